@@ -8,19 +8,18 @@ generates an opinionated digest in the house style, and commits it to the site r
 
 import os
 import sys
-import json
 import subprocess
 import time as _time
 from datetime import datetime, date
 from pathlib import Path
 
-import httpx
-import feedparser
-from dotenv import load_dotenv
-from anthropic import Anthropic
-
 from pipeline_log import log_run
+import feeds
 import git_safe
+import outbox
+import preflight
+import ranker
+import state_store
 
 # Paths
 BOT_DIR = Path(__file__).parent
@@ -38,40 +37,30 @@ FEEDS = [
     "https://www.artificialintelligence-news.com/feed/",
 ]
 
-load_dotenv(BOT_DIR / ".env")
+# The digest covers releases, research, policy, money and the big labs.
+FOCUS = """model release launch open source research benchmark regulation policy
+funding acquisition chips inference agents safety openai anthropic google deepmind
+meta mistral nvidia"""
+FEED_TOKEN_BUDGET = 3000
+INPUT_TOKEN_BUDGET = 6000  # whole prompt; see preflight.py
 
 
 def load_history() -> dict:
-    if HISTORY_FILE.exists():
-        return json.loads(HISTORY_FILE.read_text())
-    return {"digests": []}
+    return state_store.read(HISTORY_FILE, {"digests": []}, strict=True)
 
 
 def save_history(history: dict):
-    HISTORY_FILE.write_text(json.dumps(history, indent=2))
+    state_store.write(HISTORY_FILE, history, compact=True)
 
 
 def fetch_feed_entries() -> list[dict]:
     """Pull recent entries from all feeds."""
-    entries = []
-    for url in FEEDS:
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:15]:
-                entries.append({
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
-                    "summary": entry.get("summary", "")[:500],
-                    "source": feed.feed.get("title", url),
-                    "published": entry.get("published", ""),
-                })
-        except Exception as e:
-            print(f"Failed to fetch {url}: {e}")
-    return entries
+    return feeds.fetch_entries(FEEDS, limit=15)
 
 
 def generate_digest(entries: list[dict], history: dict) -> str | None:
     """Use Claude to write an opinionated digest of the week's AI news."""
+    from anthropic import Anthropic
     client = Anthropic()
     style_guide = STYLE_GUIDE.read_text()
 
@@ -86,14 +75,18 @@ def generate_digest(entries: list[dict], history: dict) -> str | None:
         print("Not enough fresh stories for a digest.")
         return None
 
-    feed_text = "\n\n".join(
-        f"**{e['title']}**\nSource: {e['source']}\nLink: {e['link']}\nPublished: {e['published']}\n{e['summary']}"
-        for e in fresh[:30]
-    )
+    stories = ranker.select(fresh, k=30, budget=FEED_TOKEN_BUDGET, focus=FOCUS,
+                            label="news_bot")
 
     today = date.today().isoformat()
 
-    prompt = f"""You are writing a daily AI news digest for SOFT CAT .ai. Pick the 3-5 most interesting or important stories from the feed below and write a digest post.
+    def build(items: list[dict]) -> str:
+        feed_text = "\n\n".join(
+            f"**{e['title']}**\nSource: {e['source']}\nLink: {e['link']}\nPublished: {e['published']}\n{e['summary']}"
+            for e in items
+        )
+
+        return f"""You are writing a daily AI news digest for SOFT CAT .ai. Pick the 3-5 most interesting or important stories from the feed below and write a digest post.
 
 ## House style (follow this exactly):
 {style_guide}
@@ -140,6 +133,9 @@ Rules:
 - Include the source link naturally in the text (as a markdown link)
 - Keep the whole thing under 400 words"""
 
+    stories, prompt = preflight.fit(build, stories, INPUT_TOKEN_BUDGET, label="news_bot",
+                                    model="claude-sonnet-4-6", client=client)
+
     response = client.messages.create(
         model="claude-sonnet-4-6",
         max_tokens=1500,
@@ -155,7 +151,7 @@ Rules:
         if content.endswith("```"):
             content = content[:-3].strip()
 
-    return content, response.usage
+    return content, response.usage, stories
 
 
 def save_and_push(content: str, entries: list[dict], history: dict):
@@ -167,8 +163,8 @@ def save_and_push(content: str, entries: list[dict], history: dict):
     output_path.write_text(content + "\n")
     print(f"Written: {output_path}")
 
-    # Track which links we used
-    links = [e["link"] for e in entries[:30]]
+    # Track which links Claude was shown
+    links = [e["link"] for e in entries]
     history.setdefault("digests", []).append({
         "date": date.today().isoformat(),
         "file": filename,
@@ -189,14 +185,12 @@ def ping_healthcheck(status="success"):
     url = os.environ.get("HC_PING_AI_DIGEST")
     if not url:
         return
-    try:
-        suffix = "/fail" if status == "fail" else ""
-        httpx.get(f"{url}{suffix}", timeout=10)
-    except Exception as e:
-        print(f"Healthcheck ping failed: {e}")
+    outbox.ping(url, status, source="news_bot")
 
 
 def main():
+    from dotenv import load_dotenv
+    load_dotenv(BOT_DIR / ".env")
     print(f"[{datetime.now().isoformat()}] AI News Digest bot starting")
     t0 = _time.time()
 
@@ -224,7 +218,7 @@ def main():
             ping_healthcheck()
             sys.exit(0)
 
-        content, usage = result
+        content, usage, stories = result
         # Sonnet pricing: $3/M input, $15/M output
         cost = (usage.input_tokens * 3 + usage.output_tokens * 15) / 1_000_000
 
@@ -238,7 +232,7 @@ def main():
                 output_files=[f"src/content/news-and-updates/{slug_date}-ai-digest.md"])
 
         print("Saving and pushing...")
-        save_and_push(content, entries, history)
+        save_and_push(content, stories, history)
 
         print("Done.")
         ping_healthcheck()
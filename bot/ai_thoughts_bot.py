@@ -10,19 +10,18 @@ import argparse
 import os
 import re
 import sys
-import json
 import subprocess
 import time as _time
 from datetime import datetime, date
 from pathlib import Path
 
-import httpx
-import feedparser
-from dotenv import load_dotenv
-from anthropic import Anthropic
-
 from pipeline_log import log_run
+import feeds
 import git_safe
+import outbox
+import preflight
+import ranker
+import state_store
 
 # Paths
 BOT_DIR = Path(__file__).parent
@@ -40,35 +39,24 @@ FEEDS = [
     "https://www.artificialintelligence-news.com/feed/",
 ]
 
-load_dotenv(BOT_DIR / ".env")
+# Slow-moving themes an essay can stand on, rather than single launches.
+FOCUS = """agents reasoning safety alignment regulation jobs work developers open
+source trend future compute energy policy ethics education creativity"""
+FEED_TOKEN_BUDGET = 3000
+INPUT_TOKEN_BUDGET = 6000  # whole prompt; see preflight.py
 
 
 def load_history() -> dict:
-    if HISTORY_FILE.exists():
-        return json.loads(HISTORY_FILE.read_text())
-    return {"thoughts": []}
+    return state_store.read(HISTORY_FILE, {"thoughts": []}, strict=True)
 
 
 def save_history(history: dict):
-    HISTORY_FILE.write_text(json.dumps(history, indent=2))
+    state_store.write(HISTORY_FILE, history, compact=True)
 
 
 def fetch_feed_entries() -> list[dict]:
     """Pull recent entries from all feeds for topic inspiration."""
-    entries = []
-    for url in FEEDS:
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:15]:
-                entries.append({
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
-                    "summary": entry.get("summary", "")[:500],
-                    "source": feed.feed.get("title", url),
-                })
-        except Exception as e:
-            print(f"Failed to fetch {url}: {e}")
-    return entries
+    return feeds.fetch_entries(FEEDS, limit=15)
 
 
 def slugify(title: str) -> str:
@@ -82,6 +70,7 @@ def slugify(title: str) -> str:
 
 def generate_thought(entries: list[dict], history: dict) -> str | None:
     """Use Claude to write an original opinion piece inspired by current AI news."""
+    from anthropic import Anthropic
     client = Anthropic()
     style_guide = STYLE_GUIDE.read_text()
 
@@ -93,14 +82,18 @@ def generate_thought(entries: list[dict], history: dict) -> str | None:
     past_titles = [t.get("title", "") for t in history.get("thoughts", [])]
     past_titles_text = "\n".join(f"- {t}" for t in past_titles[-30:]) or "None yet."
 
-    feed_text = "\n\n".join(
-        f"**{e['title']}**\nSource: {e['source']}\n{e['summary']}"
-        for e in entries[:30]
-    )
+    picked = ranker.select(entries, k=30, budget=FEED_TOKEN_BUDGET, focus=FOCUS,
+                           history=past_titles, label="thoughts_bot")
 
     target_date = os.environ.get("THOUGHT_DATE", date.today().isoformat())
 
-    prompt = f"""You are writing an opinion piece for SOFT CAT .ai. Use the AI news feed below as INSPIRATION for a topic, but do NOT summarise individual stories. Write an original take on an AI theme or trend.
+    def build(items: list[dict]) -> str:
+        feed_text = "\n\n".join(
+            f"**{e['title']}**\nSource: {e['source']}\n{e['summary']}"
+            for e in items
+        )
+
+        return f"""You are writing an opinion piece for SOFT CAT .ai. Use the AI news feed below as INSPIRATION for a topic, but do NOT summarise individual stories. Write an original take on an AI theme or trend.
 
 ## House style (follow this exactly):
 {style_guide}
@@ -149,6 +142,9 @@ Rules:
 - Do NOT start the title with "AI" every time. Mix it up.
 - This is NOT a news summary. It's a thought piece with a clear point of view."""
 
+    picked, prompt = preflight.fit(build, picked, INPUT_TOKEN_BUDGET, label="thoughts_bot",
+                                   model="claude-sonnet-4-6", client=client)
+
     response = client.messages.create(
         model="claude-sonnet-4-6",
         max_tokens=1500,
@@ -206,14 +202,12 @@ def ping_healthcheck(status="success"):
     url = os.environ.get("HC_PING_THOUGHTS")
     if not url:
         return
-    try:
-        suffix = "/fail" if status == "fail" else ""
-        httpx.get(f"{url}{suffix}", timeout=10)
-    except Exception as e:
-        print(f"Healthcheck ping failed: {e}")
+    outbox.ping(url, status, source="thoughts_bot")
 
 
 def main():
+    from dotenv import load_dotenv
+    load_dotenv(BOT_DIR / ".env")
     parser = argparse.ArgumentParser(description="SOFT CAT AI Thoughts bot")
     parser.add_argument("--date", help="Override date (YYYY-MM-DD) for backfilling")
     parser.add_argument("--no-push", action="store_true", help="Commit but don't push")
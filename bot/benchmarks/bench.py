@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for bot hot paths.
+
+    python3 bot/benchmarks/bench.py                  # run all, compare to baselines
+    python3 bot/benchmarks/bench.py log_run          # a subset (name prefix match)
+    python3 bot/benchmarks/bench.py --update         # re-record baselines.json
+    python3 bot/benchmarks/bench.py --scale 0.1      # smaller fixtures (no compare)
+
+Fixtures from fixtures.py are generated once per run into a temp directory
+and every module under test is pointed at them (module globals patched for
+the duration of a case, restored afterwards), so nothing touches the real
+tree. Each case is timed `--repeat` times after one warm-up; cases with a
+reset step (cold caches, a fresh runs.json) run it untimed before each call.
+
+A case regresses when its median exceeds the recorded baseline median by more
+than TOLERANCE. Baselines are per-machine: re-record them with --update on
+the box you compare on.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fixtures  # noqa: E402  (sibling module; bot/ is on sys.path above)
+
+BASELINES_FILE = Path(__file__).parent / "baselines.json"
+TOLERANCE = 0.5  # +50% over baseline median counts as a regression
+REPEAT = 5
+
+
+@dataclass
+class Case:
+    run: Callable[[], object]
+    reset: Callable[[], None] | None = None
+
+
+class Env:
+    """Generated fixtures plus a patch stack shared by all cases."""
+
+    def __init__(self, root: Path, scale: float):
+        self.root, self.scale = root, scale
+        self._patches: list[tuple[object, str, object]] = []
+        t0 = time.time()
+        self.radar_dir = root / "radar"
+        self.days = fixtures.radar_days(self.radar_dir, scale)
+        self.content_dir = root / "content"
+        self.posts = fixtures.markdown_posts(self.content_dir / "thoughts", scale)
+        fixtures.markdown_posts(self.content_dir / "news-and-updates", scale)
+        self.runs_master = root / "runs-master.json"
+        self.runs = fixtures.runs_json(self.runs_master, scale)
+        self.history_file = root / "digest_history.json"
+        self.links = fixtures.digest_history(self.history_file, scale)
+        self.catalogue = fixtures.openrouter_catalogue(scale)
+        self.radar_entries = fixtures.radar_entries(self.catalogue, self.days)
+        self.repo = root / "repo"
+        self.commits = fixtures.shift_repo(self.repo, scale)
+        self.cache = root / "cache"
+        self.generated_s = time.time() - t0
+
+    def patch(self, obj, attr: str, value) -> None:
+        self._patches.append((obj, attr, getattr(obj, attr)))
+        setattr(obj, attr, value)
+
+    def restore(self) -> None:
+        while self._patches:
+            obj, attr, value = self._patches.pop()
+            setattr(obj, attr, value)
+
+    def fresh_cache(self) -> Path:
+        shutil.rmtree(self.cache, ignore_errors=True)
+        self.cache.mkdir()
+        return self.cache
+
+
+# --------------------------------------------------------------------------- #
+# Cases                                                                       #
+# --------------------------------------------------------------------------- #
+
+CASES: dict[str, Callable[[Env], Case]] = {}
+
+
+def case(name: str):
+    def register(fn):
+        CASES[name] = fn
+        return fn
+    return register
+
+
+@case("log_run")
+def _log_run(env: Env) -> Case:
+    import pipeline_log
+    runs_file = env.root / "runs.json"
+    env.patch(pipeline_log, "RUNS_FILE", runs_file)
+    return Case(run=lambda: pipeline_log.log_run("radar_bot", duration_s=12.3, items_found=9),
+                reset=lambda: shutil.copyfile(env.runs_master, runs_file))
+
+
+@case("find_roster_candidates")
+def _find_roster_candidates(env: Env) -> Case:
+    import model_data_bot
+    existing = {mid for i, mid in enumerate(env.catalogue) if i % 3 == 0}
+    return Case(run=lambda: model_data_bot.find_roster_candidates(
+        existing, env.catalogue, env.radar_entries))
+
+
+def _horizon_archive(env: Env):
+    import horizon_bot
+    import radar_archive
+    env.patch(radar_archive, "_archive", None)
+    env.patch(horizon_bot, "PAST_SCORES_FILE", env.cache / "past-scores.json")
+
+    def reset():
+        env.fresh_cache()
+        radar_archive._archive = radar_archive.RadarArchive(env.radar_dir, env.cache / "radar")
+    return horizon_bot, reset
+
+
+@case("score_past_candidates[cold]")
+def _score_past_cold(env: Env) -> Case:
+    horizon_bot, reset = _horizon_archive(env)
+    return Case(run=lambda: horizon_bot.score_past_candidates([]), reset=reset)
+
+
+@case("score_past_candidates[warm]")
+def _score_past_warm(env: Env) -> Case:
+    horizon_bot, reset = _horizon_archive(env)
+    reset()
+    horizon_bot.score_past_candidates([])
+    return Case(run=lambda: horizon_bot.score_past_candidates([]))
+
+
+@case("flag_next_shifts")
+def _flag_next_shifts(env: Env) -> Case:
+    import horizon_bot
+    themes = sorted(horizon_bot.HORIZON_THEMES)
+    next_entries = [{"id": f"next-{i}", "themes": [themes[i % len(themes)], themes[(i * 7) % len(themes)]],
+                     "evidence": []} for i in range(15)]
+    radar_items = []
+    for d in env.days[:60]:
+        data = json.loads((env.radar_dir / f"{d}.json").read_text())
+        radar_items += [{**item, "_radar_date": d} for item in data["featured"] + data["picks"]]
+    thoughts = [{"slug": f"t-{i}", "title": fixtures.WORDS[i % len(fixtures.WORDS)],
+                 "summary": " ".join(fixtures.WORDS[i % 7::5])} for i in range(env.posts)]
+    return Case(run=lambda: horizon_bot.flag_next_shifts(next_entries, radar_items, thoughts))
+
+
+@case("load_recent_markdown")
+def _load_recent_markdown(env: Env) -> Case:
+    import content_catalogue
+    import horizon_bot
+
+    def reset():
+        env.fresh_cache()
+        content_catalogue._catalogue = content_catalogue.Catalogue(env.content_dir, env.cache)
+        content_catalogue._catalogue.entries("thoughts")  # warm index, as on a 2nd run
+        content_catalogue._catalogue.invalidate()
+    env.patch(content_catalogue, "_catalogue", None)
+    return Case(run=lambda: horizon_bot.load_recent_markdown("thoughts", days=7), reset=reset)
+
+
+def _shift_log(env: Env, full: bool) -> Case:
+    import os
+    import horizon_bot
+    cwd = os.getcwd()
+    env.patch(horizon_bot, "REPO_DIR", env.repo)
+    env.patch(horizon_bot, "SHIFTS_CURSOR_FILE", env.cache / "shifts-cursor.json")
+
+    def run():
+        try:
+            return horizon_bot.build_shifts_log(full_rebuild=full)
+        finally:
+            os.chdir(cwd)
+
+    def reset():
+        if full:
+            env.fresh_cache()
+    if not full:
+        env.fresh_cache()
+        run()  # establish the cursor; timed runs are the no-new-commits path
+    return Case(run=run, reset=reset)
+
+
+@case("build_shifts_log[full]")
+def _shift_log_full(env: Env) -> Case:
+    return _shift_log(env, full=True)
+
+
+@case("build_shifts_log[incremental]")
+def _shift_log_incremental(env: Env) -> Case:
+    return _shift_log(env, full=False)
+
+
+@case("check_repo_health")
+def _check_repo_health(env: Env) -> Case:
+    import git_safe
+    env.patch(git_safe, "REPO_DIR", env.repo)
+    return Case(run=git_safe.check_repo_health)
+
+
+@case("digest_load_history")
+def _digest_load_history(env: Env) -> Case:
+    import ai_news_digest
+    env.patch(ai_news_digest, "HISTORY_FILE", env.history_file)
+
+    def run():
+        history = ai_news_digest.load_history()
+        return {link for d in history["digests"] for link in d["links"]}
+    return Case(run=run)
+
+
+def _history_save(env: Env, encode: Callable[[dict], bytes]) -> Case:
+    import state_store
+    history = state_store.read(env.history_file)
+    out = env.root / "history-save.json"
+    n = [0]
+
+    def run():
+        n[0] += 1  # a real change every call, so skip-if-unchanged never kicks in
+        history["digests"][0]["date"] = str(n[0])
+        return encode(history, out)
+    return Case(run=run)
+
+
+@case("history_save[stdlib-pretty]")
+def _history_save_stdlib(env: Env) -> Case:
+    # What every history writer did before state_store.
+    return _history_save(env, lambda h, out: out.write_text(json.dumps(h, indent=2)))
+
+
+@case("history_save[state_store]")
+def _history_save_store(env: Env) -> Case:
+    import state_store
+    return _history_save(env, lambda h, out: state_store.write(out, h, compact=True))
+
+
+@case("history_save[unchanged]")
+def _history_save_unchanged(env: Env) -> Case:
+    import state_store
+    history = state_store.read(env.history_file)
+    out = env.root / "history-unchanged.json"
+    state_store.write(out, history, compact=True)
+    return Case(run=lambda: state_store.write(out, history, compact=True))
+
+
+@case("history_load[stdlib]")
+def _history_load_stdlib(env: Env) -> Case:
+    return Case(run=lambda: json.loads(env.history_file.read_text()))
+
+
+@case("history_load[state_store]")
+def _history_load_store(env: Env) -> Case:
+    import state_store
+    compact = env.root / "history-compact.json"
+    state_store.write(compact, state_store.read(env.history_file), compact=True)
+    return Case(run=lambda: state_store.read(compact))
+
+
+# --------------------------------------------------------------------------- #
+# Harness                                                                     #
+# --------------------------------------------------------------------------- #
+
+def time_case(env: Env, build: Callable[[Env], Case], repeat: int) -> dict:
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):  # bots print progress
+            c = build(env)
+            samples = []
+            for i in range(repeat + 1):
+                if c.reset:
+                    c.reset()
+                t0 = time.perf_counter()
+                c.run()
+                if i:  # first call is the warm-up
+                    samples.append(time.perf_counter() - t0)
+    finally:
+        env.restore()
+    return {"median_s": statistics.median(samples), "min_s": min(samples)}
+
+
+def run_all(names: list[str], scale: float = 1.0, repeat: int = REPEAT) -> dict[str, dict]:
+    with tempfile.TemporaryDirectory(prefix="softcat-bench-") as tmp:
+        env = Env(Path(tmp), scale)
+        print(f"[bench] fixtures in {env.generated_s:.1f}s: {len(env.days)} radar days, "
+              f"{env.links} history links, {env.runs} runs, {env.posts} posts/collection, "
+              f"{len(env.catalogue)} models, {env.commits} horizon commits")
+        return {name: time_case(env, CASES[name], repeat) for name in names}
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SOFT CAT bot hot paths")
+    parser.add_argument("cases", nargs="*", help="case name prefixes (default: all)")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--update", action="store_true", help="record results as baselines")
+    args = parser.parse_args(argv)
+
+    names = [n for n in CASES if not args.cases or any(n.startswith(p) for p in args.cases)]
+    results = run_all(names, args.scale, args.repeat)
+
+    baselines = {}
+    if BASELINES_FILE.exists():
+        baselines = json.loads(BASELINES_FILE.read_text())
+    base = baselines.get("results", {}) if args.scale == 1.0 else {}
+    regressed = []
+    for name, r in results.items():
+        b = base.get(name)
+        note = ""
+        if b:
+            ratio = r["median_s"] / b["median_s"]
+            note = f"{ratio:5.2f}x baseline"
+            if ratio > 1 + TOLERANCE:
+                regressed.append(name)
+                note += "  REGRESSION"
+        print(f"{name:32} median {r['median_s'] * 1000:9.2f}ms  min {r['min_s'] * 1000:9.2f}ms  {note}")
+
+    if args.update:
+        if args.scale != 1.0:
+            parser.error("--update needs the full-size fixtures (--scale 1.0)")
+        merged = {**baselines.get("results", {}),
+                  **{n: {k: round(v, 6) for k, v in r.items()} for n, r in results.items()}}
+        BASELINES_FILE.write_text(json.dumps({
+            "machine": f"{platform.system()} {platform.machine()}",
+            "python": platform.python_version(),
+            "results": dict(sorted(merged.items())),
+        }, indent=2) + "\n")
+        print(f"[bench] baselines written to {BASELINES_FILE}")
+    if regressed:
+        print(f"[bench] {len(regressed)} regression(s): {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
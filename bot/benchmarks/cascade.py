@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Parity check for radar_bot's launch cascade against a recorded run.
+
+    python3 bot/benchmarks/replay.py record radar      # once, live
+    python3 bot/benchmarks/cascade.py                  # offline, any time after
+
+The cassette (see replay.py) holds the feeds the run fetched and the writing
+model's reply. replay.py records with RADAR_CASCADE=0, so the writer chose
+from every ranked entry; cassettes recorded with the cascade on are refused.
+This replays the feeds through feeds.fetch_entries() and the ranker, with
+the clock and the radar history as they were at recording time, then runs
+the tier-1 launch filter over the ranked entries. Every product the writer
+published is matched back to its feed entry, by link or by name in the
+title. Parity holds when every matched product's entry survives the filter:
+the writer would have seen every launch it wrote up.
+
+HN stories are not filtered by the cascade, so products sourced from HN (or
+matched to no feed entry) are reported but cannot break parity. Also printed:
+the writer's feed-entry tokens with and without the filter.
+
+Feeds the recorded run skipped as unlikely to have changed are not in the
+cassette. They show up as replay misses and contribute no entries, as in
+the recorded run itself. Exit status 0 on parity, 1 on a lost product.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import replay  # noqa: E402  (sibling module; bot/ is on sys.path above)
+
+ANTHROPIC_MESSAGES = "https://api.anthropic.com/v1/messages"
+
+
+def _writer_products(cassette: replay.Cassette) -> list[dict]:
+    """featured + picks from the last recorded writing call."""
+    replies = [r for r in cassette.http
+               if r["method"] == "POST" and r["url"] == ANTHROPIC_MESSAGES and r["status"] == 200]
+    if not replies:
+        raise SystemExit("cassette has no successful Anthropic call to compare against")
+    text = json.loads(replies[-1]["text"])["content"][0]["text"].strip()
+    if text.startswith("```"):
+        text = "\n".join(text.split("\n")[1:]).removesuffix("```").strip()
+    data = json.loads(text)
+    return data.get("featured", []) + data.get("picks", [])
+
+
+def _source_entry(product: dict, entries: list[dict]) -> dict | None:
+    url = (product.get("ph_url") or "").rstrip("/")
+    name = (product.get("name") or "").lower()
+    for e in entries:
+        if url and e.get("link", "").rstrip("/") == url:
+            return e
+    for e in entries:
+        if name and name in e.get("title", "").lower():
+            return e
+    return None
+
+
+def compare(cassette: replay.Cassette) -> dict:
+    """Replay the cassette's feeds and compare the writer's input with and
+    without the cascade filter."""
+    import feeds
+    import normalize
+    import radar_bot
+    import ranker
+
+    if cassette.meta.get("radar_cascade") != "0":
+        # With the cascade on, the writer only saw the filter's survivors, so
+        # every product it published passes the filter by construction.
+        raise SystemExit("cassette was not recorded with RADAR_CASCADE=0; parity against "
+                         "it would be circular. Re-record with replay.py record radar")
+    recorded_at = datetime.fromisoformat(cassette.meta["recorded_at"])
+    history = radar_bot.load_history()
+    history = {"scans": [s for s in history.get("scans", [])
+                         if s.get("date", "") < recorded_at.date().isoformat()]}
+
+    restore = replay.install(cassette, "replay")
+    cache_file = feeds.CACHE_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            feeds.CACHE_FILE = Path(tmp) / "feeds.json"
+            entries = feeds.fetch_entries(radar_bot.FEEDS, limit=15, adaptive=False,
+                                          now=recorded_at.timestamp())
+    finally:
+        feeds.CACHE_FILE = cache_file
+        restore()
+
+    full = ranker.select(entries, k=40, budget=radar_bot.FEED_TOKEN_BUDGET,
+                         focus=radar_bot.FOCUS,
+                         history=radar_bot.get_past_product_names(history),
+                         now=recorded_at.timestamp(), label="cascade")
+    kept, _ = radar_bot.filter_launches(full)
+    kept_links = {e["link"] for e in kept}
+
+    report = {"entries": len(full), "kept": len(kept), "products": 0, "matched": 0,
+              "lost": [], "unmatched": [], "misses": list(cassette.misses),
+              "tokens_full": normalize.estimate_tokens(radar_bot.format_feed_entries(full)),
+              "tokens_cascade": normalize.estimate_tokens(radar_bot.format_feed_entries(kept))}
+    for product in _writer_products(cassette):
+        report["products"] += 1
+        entry = _source_entry(product, full)
+        if entry is None:
+            report["unmatched"].append(product.get("name", "?"))
+        else:
+            report["matched"] += 1
+            if entry["link"] not in kept_links:
+                report["lost"].append(f"{product.get('name', '?')} ({entry['title']})")
+    report["parity"] = not report["lost"]
+    return report
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Check the radar launch cascade for parity")
+    parser.add_argument("--cassette", type=Path, default=replay.CASSETTE_DIR / "radar.json")
+    args = parser.parse_args(argv)
+    if not args.cassette.exists():
+        parser.error(f"no cassette at {args.cassette}; record one with replay.py record radar")
+    cassette = replay.Cassette.load(args.cassette)
+
+    r = compare(cassette)
+    saved = 1 - r["tokens_cascade"] / r["tokens_full"] if r["tokens_full"] else 0.0
+    print(f"[cascade] filter kept {r['kept']}/{r['entries']} ranked entries; writer feed "
+          f"input ~{r['tokens_full']:,} -> ~{r['tokens_cascade']:,} tokens ({saved:.0%} less)")
+    print(f"[cascade] {r['products']} published product(s): {r['matched']} from feed entries, "
+          f"{len(r['unmatched'])} from HN or unmatched")
+    for lost in r["lost"]:
+        print(f"[cascade] LOST: {lost}")
+    if r["misses"]:
+        print(f"[cascade] {len(r['misses'])} replay miss(es): {r['misses'][:5]}")
+    print(f"[cascade] parity: {'ok' if r['parity'] else 'FAILED'}")
+    return 0 if r["parity"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
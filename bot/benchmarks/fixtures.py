@@ -0,0 +1,205 @@
+"""
+Synthetic fixture generators for the benchmark suite.
+
+Everything is deterministic (seeded) and sized by a `scale` factor so the
+same generators back both full benchmark runs (scale=1: production-years
+of data) and the smoke test in bot/tests (scale≈0.02). Shapes mirror the
+real files closely enough that the code under test takes its normal paths:
+
+  * radar day-files (src/data/radar/YYYY-MM-DD.json), 1,200 days
+  * digest history with 100k covered links (bot/digest_history.json)
+  * a multi-MB runs.json (src/data/pipeline/runs.json)
+  * markdown posts with frontmatter (src/content/<collection>/*.md)
+  * a 1,000-model OpenRouter catalogue (/api/v1/models, keyed by id)
+  * a git repo with a long src/data/horizon/ history and many branches
+"""
+
+import json
+import random
+import subprocess
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+SEED = 1729
+
+RADAR_DAYS = 1200
+HISTORY_LINKS = 100_000
+RUNS_JSON_BYTES = 4_000_000
+MARKDOWN_POSTS = 600
+OPENROUTER_MODELS = 1000
+SHIFT_COMMITS = 2000
+BRANCHES = 300
+
+# Theme words are mixed into generated prose so theme matching and Past
+# scoring find realistic hit rates rather than none.
+WORDS = ("agent agents model models inference chips data search code robotics "
+         "interfaces security regulation enterprise work education creativity "
+         "society infrastructure open weights latency memory sandbox eval "
+         "benchmark pricing context window orchestration retrieval vector "
+         "browser voice realtime fine tuning distillation local cloud gpu").split()
+CATEGORIES = ["AI Agents", "Developer Tools", "Models", "Infrastructure", "Productivity"]
+PROVIDERS = ["anthropic", "openai", "google", "meta-llama", "mistralai", "qwen",
+             "deepseek", "x-ai", "cohere", "nvidia", "z-ai", "moonshotai"]
+BOTS = ["radar_bot", "horizon_bot", "model_bot", "tool_bot", "digest_bot",
+        "thoughts_bot", "prompts_bot"]
+
+
+def _n(base: int, scale: float, floor: int = 1) -> int:
+    return max(floor, int(base * scale))
+
+
+def _prose(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _name(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS).capitalize() for _ in range(rng.randint(1, 3)))
+
+
+def radar_days(radar_dir: Path, scale: float = 1.0, today: date | None = None) -> list[str]:
+    """Day-files ending today, newest RADAR_DAYS days. Returns the dates."""
+    rng = random.Random(SEED)
+    today = today or date.today()
+    radar_dir.mkdir(parents=True, exist_ok=True)
+    days = []
+    for n in range(_n(RADAR_DAYS, scale, floor=70)):
+        d = (today - timedelta(days=n)).isoformat()
+
+        def item(section: str, i: int) -> dict:
+            name = _name(rng)
+            return {"id": f"ph-{d}-{section}-{i}", "name": name,
+                    "tagline": _prose(rng, 10), "category": rng.choice(CATEGORIES),
+                    "description": _prose(rng, 40), "why_radar": _prose(rng, 45),
+                    "ph_url": f"https://example.test/{d}/{i}", "maker": _name(rng),
+                    "featured": section == "featured", "added_at": f"{d}T06:00:00Z"}
+
+        payload = {"date": d,
+                   "featured": [item("featured", i) for i in range(3)],
+                   "picks": [item("picks", i) for i in range(12)],
+                   "hn_top5": [{"title": _prose(rng, 8), "points": rng.randint(5, 900),
+                                "comments": rng.randint(0, 400), "summary": _prose(rng, 30)}
+                               for _ in range(5)]}
+        (radar_dir / f"{d}.json").write_text(json.dumps(payload, indent=2) + "\n")
+        days.append(d)
+    return days
+
+
+def digest_history(path: Path, scale: float = 1.0) -> int:
+    """digest_history.json holding HISTORY_LINKS covered links, 30 per digest."""
+    rng = random.Random(SEED + 1)
+    links = _n(HISTORY_LINKS, scale, floor=30)
+    start = date(2020, 1, 1)
+    digests = []
+    for i in range(0, links, 30):
+        d = (start + timedelta(days=i // 30)).isoformat()
+        digests.append({"date": d, "file": f"{d}-ai-digest.md",
+                        "links": [f"https://news.example.test/{d}/{rng.getrandbits(48):x}"
+                                  for _ in range(min(30, links - i))]})
+    path.write_text(json.dumps({"digests": digests}, indent=2) + "\n")
+    return links
+
+
+def runs_json(path: Path, scale: float = 1.0) -> int:
+    """A pretty-printed runs.json of about RUNS_JSON_BYTES, all inside the
+    90-day prune window so log_run keeps every entry."""
+    rng = random.Random(SEED + 2)
+    target = _n(RUNS_JSON_BYTES, scale, floor=20_000)
+    now = datetime.now(timezone.utc)
+    runs, size = [], 0
+    while size < target:
+        entry = {"bot": rng.choice(BOTS),
+                 "timestamp": (now - timedelta(minutes=rng.randint(0, 89 * 24 * 60))).isoformat(),
+                 "status": "success", "duration_s": round(rng.uniform(1, 90), 1),
+                 "feeds_scanned": rng.randint(0, 8), "items_found": rng.randint(0, 60),
+                 "items_rejected": 0, "items_published": rng.randint(0, 5),
+                 "model": "claude-sonnet-4-6", "cost_usd": round(rng.uniform(0, 0.2), 4),
+                 "input_tokens": rng.randint(1000, 30000), "output_tokens": rng.randint(100, 4000),
+                 "output_files": [f"src/data/radar/{now.date().isoformat()}.json"]}
+        runs.append(entry)
+        size += len(json.dumps(entry, indent=2)) + 4
+    runs.sort(key=lambda r: r["timestamp"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(runs, indent=2) + "\n")
+    return len(runs)
+
+
+def markdown_posts(collection_dir: Path, scale: float = 1.0,
+                   today: date | None = None) -> int:
+    """Posts with thoughts/news-style frontmatter, one every other day
+    back from today (so a 7-day window always has a few)."""
+    rng = random.Random(SEED + 3)
+    today = today or date.today()
+    collection_dir.mkdir(parents=True, exist_ok=True)
+    count = _n(MARKDOWN_POSTS, scale, floor=10)
+    for i in range(count):
+        d = (today - timedelta(days=i * 2)).isoformat()
+        title = _prose(rng, 6).rstrip(".")
+        tags = ", ".join(f'"{t}"' for t in rng.sample(WORDS, 3))
+        body = "\n\n".join(_prose(rng, 80) for _ in range(8))
+        (collection_dir / f"{d}-post-{i}.md").write_text(
+            f'---\ntitle: "{title}"\ndate: {d}\nsummary: "{_prose(rng, 20)}"\n'
+            f"tags: [{tags}]\n---\n\n{body}\n")
+    return count
+
+
+def openrouter_catalogue(scale: float = 1.0) -> dict:
+    """{id: model} as model_data_bot.fetch_openrouter_models returns it,
+    including the :free variants the roster gate must skip."""
+    rng = random.Random(SEED + 4)
+    models = {}
+    for i in range(_n(OPENROUTER_MODELS, scale, floor=20)):
+        provider = rng.choice(PROVIDERS)
+        name = f"{_name(rng)} {rng.randint(1, 9)}.{rng.randint(0, 9)}"
+        mid = f"{provider}/{name.lower().replace(' ', '-')}-{i}"
+        models[mid] = {"id": mid, "name": f"{provider.title()}: {name}",
+                       "context_length": rng.choice([32000, 128000, 200000, 1000000]),
+                       "pricing": {"prompt": f"{rng.uniform(0, 0.00002):.8f}",
+                                   "completion": f"{rng.uniform(0, 0.00008):.8f}"},
+                       "architecture": {"input_modalities": ["text"]}}
+        if i % 10 == 0:
+            models[f"{mid}:free"] = {**models[mid], "id": f"{mid}:free"}
+    return models
+
+
+def radar_entries(catalogue: dict, days: list[str]) -> list[dict]:
+    """scan_radar_entries()-shaped rows; about 2% name a catalogue model."""
+    rng = random.Random(SEED + 5)
+    names = [m["name"].split(": ", 1)[-1] for mid, m in catalogue.items() if ":" not in mid]
+    out = []
+    for d in days:
+        for i in range(3):
+            name = rng.choice(names) if rng.random() < 0.02 else _name(rng)
+            out.append({"name": name, "date": d, "entry_id": f"ph-{d}-{i}"})
+    return out
+
+
+def shift_repo(repo: Path, scale: float = 1.0, today: date | None = None) -> int:
+    """A git repo whose src/data/horizon/ has SHIFT_COMMITS commits spread
+    over the last 90 days, plus BRANCHES local branches, built with one
+    `git fast-import` stream. Returns the number of commits."""
+    rng = random.Random(SEED + 6)
+    today = today or date.today()
+    commits = _n(SHIFT_COMMITS, scale, floor=20)
+    repo.mkdir(parents=True, exist_ok=True)
+    subprocess.run(["git", "init", "-q", "-b", "main", str(repo)], check=True)
+    lanes = ["now", "next", "past", "scenarios", "debates"]
+    start = datetime.combine(today - timedelta(days=89), datetime.min.time(), timezone.utc)
+    step = (89 * 86400) // commits
+    stream = []
+    for i in range(commits):
+        lane = lanes[i % len(lanes)]
+        payload = json.dumps([{"id": f"{lane}-{j}", "year": 2027 + (i + j) % 9}
+                              for j in range(rng.randint(3, 12))]).encode()
+        when = int(start.timestamp()) + i * step
+        msg = f"bot(horizon): update {lane} ({i})".encode()
+        stream += [b"commit refs/heads/main",
+                   f"committer Bench <bench@example.test> {when} +0000".encode(),
+                   f"data {len(msg)}".encode(), msg]
+        stream += [f"M 644 inline src/data/horizon/{lane}.json".encode(),
+                   f"data {len(payload)}".encode(), payload, b""]
+    for b in range(_n(BRANCHES, scale)):
+        stream += [f"reset refs/heads/bench/branch-{b}".encode(), b"from refs/heads/main", b""]
+    subprocess.run(["git", "-C", str(repo), "fast-import", "--quiet"],
+                   input=b"\n".join(stream) + b"\n", check=True)
+    subprocess.run(["git", "-C", str(repo), "checkout", "-q", "main"], check=True)
+    return commits
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Record/replay harness for timing whole bot runs offline.
+
+    python3 bot/benchmarks/replay.py record radar      # live network, sandboxed git
+    python3 bot/benchmarks/replay.py replay radar      # no network at all
+    python3 bot/benchmarks/replay.py replay horizon --profile /tmp/horizon.prof
+
+A bot's main() normally needs live RSS, Algolia, OpenRouter, Anthropic, the
+GitHub API and a pushable remote. Both modes run it in a sandbox instead:
+
+  * a clone of this repo at a fixed commit, whose `origin` is a bare repo in
+    the same temp dir, so the bot's commits and pushes land there;
+  * the current working tree's bot/*.py overlaid on top (committed in the
+    sandbox), so a replay exercises the code you are changing against the
+    data the cassette was recorded with;
+  * HOME and the git lock pointed inside the sandbox.
+
+Record mode lets outbound HTTP through and writes every exchange to a
+cassette (bot/.cache/cassettes/<bot>.json by default), along with the
+commit, the clock and every `gh` subprocess call. Replay mode serves those
+exchanges in order from the cassette, runs at the recorded commit with the
+clock frozen at the recorded time, and fails closed: an unrecorded request
+raises a ConnectError inside the bot and is reported as a miss. Recordings
+run with RADAR_CASCADE=0 (stored in the cassette, so replays match); see
+cascade.py for why.
+
+In both modes side-effecting endpoints (Discord webhooks, healthcheck
+pings, GitHub API writes) get a canned success and never leave the box;
+the notification outbox is drained in-process after main() for the same
+reason.
+Request headers are never stored, and `gh auth token` output is redacted.
+feedparser is routed through httpx so feed fetches are captured too.
+"""
+
+import argparse
+import base64
+import cProfile
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from collections import defaultdict, deque
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import httpx
+
+BOT_DIR = Path(__file__).resolve().parent.parent
+REPO_DIR = BOT_DIR.parent
+CASSETTE_DIR = BOT_DIR / ".cache" / "cassettes"
+CASSETTE_VERSION = 1
+
+# Never sent anywhere from a recording or replay, whatever the method.
+SIDE_EFFECT_HOSTS = {"discord.com", "discordapp.com", "hc-ping.com"}
+# Hosts where only reads go out.
+READ_ONLY_HOSTS = {"api.github.com"}
+# Dropped from recorded responses: the body is stored decoded.
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding",
+                "connection", "set-cookie"}
+
+
+class Cassette:
+    """Recorded HTTP exchanges and `gh` calls for one bot run."""
+
+    def __init__(self, meta: dict | None = None, http: list | None = None,
+                 commands: list | None = None):
+        self.meta = meta or {}
+        self.http = http or []
+        self.commands = commands or []
+        self.misses: list[str] = []
+        self._http_queue: dict[tuple[str, str], deque] = defaultdict(deque)
+        self._cmd_queue: dict[tuple, deque] = defaultdict(deque)
+        for rec in self.http:
+            self._http_queue[(rec["method"], rec["url"])].append(rec)
+        for rec in self.commands:
+            self._cmd_queue[tuple(rec["args"])].append(rec)
+
+    @classmethod
+    def load(cls, path: Path) -> "Cassette":
+        data = json.loads(path.read_text())
+        if data.get("version") != CASSETTE_VERSION:
+            raise SystemExit(f"{path}: unsupported cassette version {data.get('version')}")
+        return cls(data["meta"], data["http"], data["commands"])
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"version": CASSETTE_VERSION, "meta": self.meta,
+                                    "http": self.http, "commands": self.commands},
+                                   indent=1) + "\n")
+
+    # -- http -------------------------------------------------------------- #
+
+    def record_http(self, request: httpx.Request, response: httpx.Response) -> None:
+        body = response.content
+        rec = {"method": request.method, "url": str(request.url),
+               "status": response.status_code,
+               "headers": [[k, v] for k, v in response.headers.items()
+                           if k.lower() not in _HOP_HEADERS]}
+        try:
+            rec["text"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            rec["b64"] = base64.b64encode(body).decode()
+        self.http.append(rec)
+
+    def replay_http(self, request: httpx.Request) -> httpx.Response:
+        queue = self._http_queue.get((request.method, str(request.url)))
+        if not queue:
+            self.misses.append(f"{request.method} {request.url}")
+            raise httpx.ConnectError(f"replay miss: {request.method} {request.url}",
+                                     request=request)
+        rec = queue.popleft()
+        body = rec["text"].encode() if "text" in rec else base64.b64decode(rec["b64"])
+        return httpx.Response(rec["status"], headers=rec["headers"], content=body,
+                              request=request)
+
+    # -- subprocess -------------------------------------------------------- #
+
+    def record_command(self, args: list[str], result: subprocess.CompletedProcess) -> None:
+        stdout = result.stdout
+        if args[:3] == ["gh", "auth", "token"]:
+            stdout = "replay-token\n" if isinstance(stdout, str) else b"replay-token\n"
+        self.commands.append({"args": args, "returncode": result.returncode,
+                              "stdout": _text(stdout), "stderr": _text(result.stderr)})
+
+    def replay_command(self, args: list[str], text: bool) -> subprocess.CompletedProcess:
+        queue = self._cmd_queue.get(tuple(args))
+        if not queue:
+            self.misses.append(" ".join(args))
+            raise FileNotFoundError(f"replay miss: {' '.join(args)}")
+        rec = queue.popleft()
+        out, err = rec["stdout"], rec["stderr"]
+        if not text:
+            out, err = out.encode(), err.encode()
+        return subprocess.CompletedProcess(args, rec["returncode"], out, err)
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else value.decode("utf-8", "replace")
+
+
+# --------------------------------------------------------------------------- #
+# Interception                                                                #
+# --------------------------------------------------------------------------- #
+
+def _guarded(request: httpx.Request) -> httpx.Response | None:
+    """Canned success for anything with an outside-world side effect."""
+    host = request.url.host
+    if host in SIDE_EFFECT_HOSTS:
+        return httpx.Response(204, request=request)
+    if host in READ_ONLY_HOSTS and request.method not in ("GET", "HEAD"):
+        return httpx.Response(201, json={"id": 0, "number": 0,
+                                         "html_url": f"https://{host}/replay/pull/0"},
+                              request=request)
+    return None
+
+
+def install(cassette: Cassette, mode: str):
+    """Patch httpx transports, subprocess.run and feedparser.parse.
+    Returns a callable that undoes the patches."""
+    sync_send = httpx.HTTPTransport.handle_request
+    async_send = httpx.AsyncHTTPTransport.handle_async_request
+
+    def handle_request(transport, request):
+        canned = _guarded(request)
+        if canned is not None:
+            return canned
+        if mode == "replay":
+            return cassette.replay_http(request)
+        response = sync_send(transport, request)
+        response.read()
+        cassette.record_http(request, response)
+        return response
+
+    async def handle_async_request(transport, request):
+        canned = _guarded(request)
+        if canned is not None:
+            return canned
+        if mode == "replay":
+            return cassette.replay_http(request)
+        response = await async_send(transport, request)
+        await response.aread()
+        cassette.record_http(request, response)
+        return response
+
+    httpx.HTTPTransport.handle_request = handle_request
+    httpx.AsyncHTTPTransport.handle_async_request = handle_async_request
+
+    real_run = subprocess.run
+
+    def run(args, *a, **kw):
+        if isinstance(args, (list, tuple)) and args and args[0] == "gh":
+            text = bool(kw.get("text") or kw.get("universal_newlines"))
+            if mode == "replay":
+                result = cassette.replay_command(list(args), text)
+            else:
+                result = real_run(args, *a, **kw)
+                cassette.record_command(list(args), result)
+            if kw.get("check") and result.returncode:
+                raise subprocess.CalledProcessError(result.returncode, args,
+                                                    result.stdout, result.stderr)
+            return result
+        return real_run(args, *a, **kw)
+
+    subprocess.run = run
+
+    def restore():
+        httpx.HTTPTransport.handle_request = sync_send
+        httpx.AsyncHTTPTransport.handle_async_request = async_send
+        subprocess.run = real_run
+
+    try:
+        import feedparser
+    except ImportError:
+        return restore
+    real_parse = feedparser.parse
+
+    def parse(url_or_data, *a, **kw):
+        if isinstance(url_or_data, str) and url_or_data.startswith(("http://", "https://")):
+            try:
+                resp = httpx.get(url_or_data, follow_redirects=True, timeout=30,
+                                 headers={"User-Agent": feedparser.USER_AGENT})
+                url_or_data = resp.content
+            except httpx.HTTPError:
+                url_or_data = b""
+        return real_parse(url_or_data, *a, **kw)
+
+    feedparser.parse = parse
+
+    def restore_all():
+        restore()
+        feedparser.parse = real_parse
+    return restore_all
+
+
+def freeze_clock(when: datetime, modules: list) -> None:
+    """Make date.today()/datetime.now() in the given modules return `when`."""
+
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return cls(when.year, when.month, when.day)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls.fromtimestamp(when.timestamp(), tz)
+
+    for module in modules:
+        if getattr(module, "date", None) is date:
+            module.date = FrozenDate
+        if getattr(module, "datetime", None) is datetime:
+            module.datetime = FrozenDatetime
+
+
+# --------------------------------------------------------------------------- #
+# Sandbox                                                                     #
+# --------------------------------------------------------------------------- #
+
+def _git(*args, cwd: Path | None = None) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+def live_repository() -> str:
+    """owner/name of the real repo. The sandbox's origin is a local path, so
+    the bot could not work this out for itself."""
+    slug = os.environ.get("GITHUB_REPOSITORY")
+    if slug:
+        return slug
+    url = subprocess.run(["git", "-C", str(REPO_DIR), "remote", "get-url", "origin"],
+                         capture_output=True, text=True).stdout.strip()
+    m = re.search(r"github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$", url)
+    return m.group(1) if m else ""
+
+
+def make_sandbox(root: Path, sha: str) -> Path:
+    """Clone REPO_DIR at `sha` with a bare local `origin`; overlay bot/*.py."""
+    work, remote = root / "work", root / "remote.git"
+    _git("clone", "-q", "--bare", str(REPO_DIR), str(remote))
+    _git("update-ref", "refs/heads/main", sha, cwd=remote)
+    _git("clone", "-q", "--branch", "main", str(remote), str(work))
+    _git("config", "user.name", "Replay Bot", cwd=work)
+    _git("config", "user.email", "replay@example.invalid", cwd=work)
+    for src in BOT_DIR.glob("*.py"):
+        shutil.copy2(src, work / "bot" / src.name)
+    _git("add", "bot", cwd=work)
+    if subprocess.run(["git", "diff", "--cached", "--quiet"], cwd=work).returncode:
+        _git("commit", "-q", "-m", "replay: overlay working-tree bot code", cwd=work)
+    (root / "home").mkdir()
+    return work
+
+
+def load_secrets(mode: str, env_file: Path | None = None) -> None:
+    """Record mode only: load the real bot/.env into os.environ.
+
+    The sandbox clone has no bot/.env (it is gitignored), so the bot's own
+    load_dotenv() finds nothing there. Without this a recording makes its
+    live calls with no API keys and captures error responses. Replay never
+    loads secrets: nothing it does goes out."""
+    if mode != "record":
+        return
+    from dotenv import load_dotenv
+    load_dotenv(env_file or BOT_DIR / ".env")
+
+
+def run_bot(name: str, mode: str, cassette: Cassette, work: Path,
+            profile: str | None) -> tuple[bool, float]:
+    """Import the sandbox's bot module and run its main(). (ok, seconds)"""
+    sandbox_bot = work / "bot"
+    load_secrets(mode)
+    os.environ["HOME"] = str(work.parent / "home")
+    os.environ["SOFTCAT_OUTBOX_NO_KICK"] = "1"
+    if mode == "replay":
+        os.environ.setdefault("ANTHROPIC_API_KEY", "replay-key")
+    if cassette.meta.get("github_repository"):
+        os.environ["GITHUB_REPOSITORY"] = cassette.meta["github_repository"]
+    if cassette.meta.get("radar_cascade"):
+        os.environ["RADAR_CASCADE"] = cassette.meta["radar_cascade"]
+    sys.path.insert(0, str(sandbox_bot))
+    os.chdir(work)
+
+    import git_safe
+    import runner
+    git_safe.LOCK_PATH = str(work.parent / "git.lock")
+    module = __import__(runner.SCHEDULE[name][0])
+    if mode == "replay":
+        ours = [m for m in list(sys.modules.values())
+                if str(getattr(m, "__file__", "") or "").startswith(str(sandbox_bot))]
+        freeze_clock(datetime.fromisoformat(cassette.meta["recorded_at"]), ours)
+
+    sys.argv = [module.__file__]
+    profiler = cProfile.Profile() if profile else None
+    ok = True
+    t0 = time.perf_counter()
+    try:
+        if profiler:
+            profiler.enable()
+        module.main()
+    except SystemExit as e:
+        ok = e.code in (None, 0)
+    except Exception:
+        traceback.print_exc()
+        ok = False
+    finally:
+        elapsed = time.perf_counter() - t0
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(profile)
+    # Notifications were queued, not sent; deliver them here, under the
+    # patches, rather than from a detached drainer that would bypass them.
+    import outbox
+    outbox.drain()
+    return ok, elapsed
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Record or replay a whole bot run")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("bot", help="runner.py schedule name, e.g. radar, horizon")
+    parser.add_argument("--cassette", type=Path, help="default: bot/.cache/cassettes/<bot>.json")
+    parser.add_argument("--profile", help="write cProfile stats of main() here")
+    parser.add_argument("--keep", action="store_true", help="keep the sandbox for inspection")
+    args = parser.parse_args(argv)
+    path = args.cassette or CASSETTE_DIR / f"{args.bot}.json"
+
+    if args.mode == "record":
+        cassette = Cassette({"bot": args.bot,
+                             "recorded_at": datetime.now(timezone.utc).isoformat(),
+                             "sha": _git("rev-parse", "HEAD", cwd=REPO_DIR),
+                             "github_repository": live_repository(),
+                             # The writer sees every ranked entry, so
+                             # benchmarks/cascade.py can measure the launch
+                             # filter's recall against an unfiltered pick.
+                             "radar_cascade": "0"})
+    else:
+        if not path.exists():
+            parser.error(f"no cassette at {path}; record one first")
+        cassette = Cassette.load(path)
+        if cassette.meta["bot"] != args.bot:
+            parser.error(f"{path} was recorded for {cassette.meta['bot']!r}")
+
+    root = Path(tempfile.mkdtemp(prefix=f"softcat-{args.mode}-"))
+    try:
+        work = make_sandbox(root, cassette.meta["sha"])
+        base = _git("rev-parse", "HEAD", cwd=work)
+        install(cassette, args.mode)
+        ok, elapsed = run_bot(args.bot, args.mode, cassette, work, args.profile)
+        pushed = int(_git("rev-list", "--count", f"{base}..main", cwd=root / "remote.git"))
+    finally:
+        if args.keep:
+            print(f"[replay] sandbox kept at {root}")
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    if args.mode == "record":
+        cassette.save(path)
+        print(f"[replay] recorded {len(cassette.http)} HTTP exchange(s) and "
+              f"{len(cassette.commands)} gh call(s) to {path}")
+    print(f"[replay] {args.bot} {args.mode}: {'ok' if ok else 'FAILED'} in {elapsed:.2f}s, "
+          f"{pushed} commit(s) pushed to the sandbox remote"
+          + (f", {len(cassette.misses)} miss(es): {cassette.misses[:5]}" if cassette.misses else ""))
+    return 0 if ok and not cassette.misses else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,123 @@
+"""
+Shared content catalogue for every markdown collection the bots read.
+
+Before this, each bot re-scanned the tree its own way: prompt_library_bot
+regex-scanned every prompt (twice per run), tool_of_the_week re-read every
+write-up to find its url, and horizon_bot parsed thoughts and news. The
+catalogue holds one persistent content_index.FrontmatterIndex per collection
+and answers lookups by slug, date window and tag from memory.
+
+    cat = content_catalogue.get()
+    cat.by_slug("thoughts", "2026-07-02-hidden-flags-and-token-bloat")
+    cat.by_date("news", start=date(2026, 7, 1))
+    cat.by_tag("glossary", "agents")
+
+Each collection is refreshed (stat-only, re-parse what moved) the first time
+it is touched in a process; call refresh() after writing into a collection to
+see the change, or invalidate() to have every collection re-checked lazily
+(runner.py does this between bots).
+"""
+
+from datetime import date
+from pathlib import Path
+
+from content_index import FrontmatterIndex
+
+REPO_DIR = Path(__file__).parent.parent
+CONTENT_DIR = REPO_DIR / "src" / "content"
+
+# catalogue name -> directory under src/content (see src/content.config.ts)
+COLLECTIONS = {
+    "news": "news-and-updates",
+    "thoughts": "thoughts",
+    "tools": "tools",
+    "prompts": "prompts",
+    "glossary": "glossary",
+}
+
+
+def parse_tags(raw: str) -> list[str]:
+    """`[a, "b", c]` -> ["a", "b", "c"]. Frontmatter tags are flow lists."""
+    raw = (raw or "").strip()
+    if raw.startswith("[") and raw.endswith("]"):
+        raw = raw[1:-1]
+    return [t.strip().strip('"').strip("'") for t in raw.split(",") if t.strip()]
+
+
+class Catalogue:
+    """In-memory view over all collections, backed by persistent indexes."""
+
+    def __init__(self, content_dir: Path = CONTENT_DIR, cache_dir: Path | None = None):
+        self.content_dir = Path(content_dir)
+        self.cache_dir = cache_dir
+        self._indexes: dict[str, FrontmatterIndex] = {}
+        self._entries: dict[str, list[dict]] = {}
+        self._slugs: dict[str, dict[str, dict]] = {}
+        self._tags: dict[str, dict[str, list[dict]]] = {}
+
+    def _index(self, name: str) -> FrontmatterIndex:
+        if name not in COLLECTIONS:
+            raise KeyError(f"unknown collection {name!r} (expected one of {sorted(COLLECTIONS)})")
+        if name not in self._indexes:
+            dir_path = self.content_dir / COLLECTIONS[name]
+            cache = self.cache_dir / f"frontmatter-{dir_path.name}.json" if self.cache_dir else None
+            self._indexes[name] = FrontmatterIndex(dir_path, cache)
+        return self._indexes[name]
+
+    def refresh(self, name: str) -> None:
+        """Re-sync one collection with disk and rebuild its lookups."""
+        index = self._index(name).refresh()
+        entries, slugs, tags = [], {}, {}
+        for filename, rec in sorted(index.files.items()):
+            meta = rec["meta"]
+            entry = {
+                "collection": name,
+                "slug": filename[:-3],
+                "path": index.dir_path / filename,
+                "date": rec["date"],
+                "tags": parse_tags(meta.get("tags", "")),
+                "meta": meta,
+            }
+            entries.append(entry)
+            slugs[entry["slug"]] = entry
+            for tag in entry["tags"]:
+                tags.setdefault(tag, []).append(entry)
+        self._entries[name], self._slugs[name], self._tags[name] = entries, slugs, tags
+
+    def invalidate(self) -> None:
+        """Forget the in-memory views; the next lookup re-stats each
+        collection (cheap: the indexes themselves stay loaded)."""
+        self._entries.clear()
+        self._slugs.clear()
+        self._tags.clear()
+
+    def entries(self, name: str) -> list[dict]:
+        """Every entry in a collection, ordered by filename."""
+        if name not in self._entries:
+            self.refresh(name)
+        return self._entries[name]
+
+    def by_slug(self, name: str, slug: str) -> dict | None:
+        self.entries(name)
+        return self._slugs[name].get(slug)
+
+    def by_date(self, name: str, start: date | None = None, end: date | None = None) -> list[dict]:
+        """Dated entries with start <= date <= end (either bound optional)."""
+        lo = start.isoformat() if start else ""
+        hi = end.isoformat() if end else "9999-12-31"
+        return [e for e in self.entries(name) if e["date"] and lo <= e["date"] <= hi]
+
+    def by_tag(self, name: str, tag: str) -> list[dict]:
+        self.entries(name)
+        return list(self._tags[name].get(tag, []))
+
+
+_catalogue: Catalogue | None = None
+
+
+def get() -> Catalogue:
+    """The process-wide catalogue shared by every bot in this process."""
+    global _catalogue
+    if _catalogue is None:
+        _catalogue = Catalogue()
+    return _catalogue
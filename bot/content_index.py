@@ -0,0 +1,135 @@
+"""
+Persistent frontmatter index for markdown content directories.
+
+horizon_bot only needs the last 7 days of thoughts and news, but used to glob
+every .md in both directories and read each file twice (frontmatter, then
+body). This module keeps a per-directory index of parsed frontmatter keyed on
+filename + (mtime_ns, size), persisted under bot/.cache/. A refresh is one
+directory scan of stat() calls; only new or modified files are opened, and
+only up to their closing `---`. Date-window queries are answered from the
+index, so callers open just the files that match.
+
+The cache is a local optimisation, never committed: delete bot/.cache/ and
+the next refresh rebuilds it. Bots normally go through content_catalogue,
+which holds one index per collection.
+"""
+
+import json
+import os
+import re
+from datetime import date
+from pathlib import Path
+
+import state_store
+
+BOT_DIR = Path(__file__).parent
+CACHE_DIR = BOT_DIR / ".cache"
+INDEX_VERSION = 2
+
+_FRONTMATTER = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+
+def parse_frontmatter(text: str) -> dict:
+    """Cheap frontmatter parser - avoids pulling in a yaml dep."""
+    m = _FRONTMATTER.match(text)
+    if not m:
+        return {}
+    meta = {}
+    for line in m.group(1).splitlines():
+        # Top-level keys only: indented lines belong to a block scalar (the
+        # prompts collection's `prompt: |`) and must not shadow real keys.
+        if ":" not in line or line[:1].isspace():
+            continue
+        k, _, v = line.partition(":")
+        meta[k.strip()] = v.strip().strip('"').strip("'")
+    return meta
+
+
+def read_frontmatter(path: Path) -> dict:
+    """Parse a file's frontmatter, reading no further than its closing `---`."""
+    head = []
+    with open(path, encoding="utf-8") as f:
+        first = f.readline()
+        if not first.startswith("---"):
+            return {}
+        head.append(first)
+        for line in f:
+            head.append(line)
+            if line.startswith("---") and not line[3:].strip():
+                break
+    return parse_frontmatter("".join(head))
+
+
+def entry_date(meta: dict) -> str:
+    """The entry's YYYY-MM-DD date, or "" when missing/unparseable."""
+    date_str = meta.get("date", "")
+    if len(date_str) < 10:
+        return ""
+    try:
+        date.fromisoformat(date_str[:10])
+    except ValueError:
+        return ""
+    return date_str[:10]
+
+
+class FrontmatterIndex:
+    """Frontmatter for every .md in one directory, refreshed incrementally."""
+
+    def __init__(self, dir_path: Path, cache_file: Path | None = None):
+        self.dir_path = Path(dir_path)
+        self.cache_file = cache_file or CACHE_DIR / f"frontmatter-{self.dir_path.name}.json"
+        self.files: dict[str, dict] = {}
+        self.reparsed = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not self.cache_file.exists():
+            return
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (json.JSONDecodeError, ValueError, OSError):
+            return  # rebuilt on refresh
+        if data.get("version") == INDEX_VERSION and data.get("dir") == str(self.dir_path):
+            self.files = data.get("files", {})
+
+    def save(self) -> None:
+        payload = {"version": INDEX_VERSION, "dir": str(self.dir_path), "files": self.files}
+        state_store.write(self.cache_file, payload, compact=True)
+
+    def refresh(self) -> "FrontmatterIndex":
+        """Stat every .md; re-parse only files whose mtime/size moved."""
+        self.reparsed = 0
+        if not self.dir_path.exists():
+            self.files = {}
+            return self
+        seen: dict[str, dict] = {}
+        with os.scandir(self.dir_path) as it:
+            for de in it:
+                if not de.name.endswith(".md") or not de.is_file():
+                    continue
+                st = de.stat()
+                cached = self.files.get(de.name)
+                if cached and cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+                    seen[de.name] = cached
+                    continue
+                meta = read_frontmatter(Path(de.path))
+                seen[de.name] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size,
+                                 "date": entry_date(meta), "meta": meta}
+                self.reparsed += 1
+        dirty = self.reparsed or seen.keys() != self.files.keys()
+        self.files = seen
+        if dirty:
+            try:
+                self.save()
+            except OSError as e:
+                print(f"[content_index] could not persist {self.cache_file}: {e}")
+        return self
+
+    def between(self, start: date | None = None, end: date | None = None) -> list[tuple[Path, dict]]:
+        """(path, meta) for dated entries with start <= date <= end, by filename."""
+        lo = start.isoformat() if start else ""
+        hi = end.isoformat() if end else "9999-12-31"
+        return [(self.dir_path / name, rec["meta"])
+                for name, rec in sorted(self.files.items())
+                if rec["date"] and lo <= rec["date"] <= hi]
+
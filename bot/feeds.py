@@ -0,0 +1,223 @@
+"""
+RSS/Atom fetching with per-feed telemetry and adaptive polling.
+
+Five bots each had their own copy of fetch_feed_entries(): feedparser.parse()
+on every URL in FEEDS, one after another, with failures printed and
+forgotten. Nothing recorded which feeds were slow, stale or broken, and
+every feed was fetched on every run, whether or not it had published
+anything since the last one. Now they all call:
+
+    entries = feeds.fetch_entries(FEEDS, limit=15)
+
+Each fetch records per-feed telemetry: HTTP status, latency, bytes, entry
+count, age of the newest entry and any error. The last LOG_KEEP
+observations per feed are kept in bot/.cache/feeds.json, and
+`python3 bot/feeds.py` prints a table of them. The run totals (polled,
+skipped, not modified, failed, bytes) are attached to the bot's next
+log_run entry as "feeds".
+
+Scheduling. The cache also keeps each feed's last entries, its
+ETag/Last-Modified, and a publish cadence learned from entry timestamps
+(median gap between posts). The chance that a feed has posted since the
+last successful poll is estimated as 1 - exp(-elapsed / cadence). Below
+SKIP_BELOW the feed is not fetched and its cached entries are served.
+A feed is always fetched if:
+  * its cadence is unknown;
+  * its last poll failed;
+  * it has not been fetched for MAX_SKIP_S.
+Fetched feeds send conditional headers, so an unchanged feed costs a
+304 with no body. Feeds are fetched concurrently over the shared
+http_pool client.
+
+Entries come back through normalize.normalize_entries(): clean-text
+summaries of at most SUMMARY_CHARS, plus a per-entry "tokens" estimate.
+"""
+
+import calendar
+import math
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import http_pool
+import normalize
+import pipeline_log
+import state_store
+
+BOT_DIR = Path(__file__).resolve().parent
+CACHE_FILE = BOT_DIR / ".cache" / "feeds.json"
+
+SKIP_BELOW = 0.2           # poll when P(new post since last poll) >= this
+MAX_SKIP_S = 3 * 86400     # never serve a feed's cached entries older than this
+CADENCE_MIN_S = 3600
+CADENCE_MAX_S = 30 * 86400
+CACHED_ENTRIES = 30
+RAW_SUMMARY_CHARS = 4000   # raw HTML kept per entry; cleaned down to SUMMARY_CHARS
+SUMMARY_CHARS = 500
+LOG_KEEP = 30
+WORKERS = 8
+
+_report = pipeline_log.report("feeds")
+take_report = _report.take
+
+
+# --------------------------------------------------------------------------- #
+# Cadence                                                                     #
+# --------------------------------------------------------------------------- #
+
+def learn_cadence(timestamps: list[float]) -> float | None:
+    """Median gap in seconds between distinct entry timestamps, clamped;
+    None with fewer than three dated entries."""
+    ts = sorted(set(t for t in timestamps if t), reverse=True)[:CACHED_ENTRIES]
+    if len(ts) < 3:
+        return None
+    gaps = [a - b for a, b in zip(ts, ts[1:])]
+    return min(CADENCE_MAX_S, max(CADENCE_MIN_S, statistics.median(gaps)))
+
+
+def change_probability(state: dict, now: float) -> float:
+    """P(at least one new post since the last successful poll)."""
+    cadence = state.get("cadence_s")
+    last_ok = state.get("last_ok")
+    if not cadence or not last_ok:
+        return 1.0
+    return 1 - math.exp(-max(0.0, now - last_ok) / cadence)
+
+
+def should_poll(state: dict | None, now: float) -> bool:
+    if not state or not state.get("entries") or state.get("last_error"):
+        return True
+    if now - state.get("last_ok", 0) >= MAX_SKIP_S:
+        return True
+    return change_probability(state, now) >= SKIP_BELOW
+
+
+# --------------------------------------------------------------------------- #
+# Fetch                                                                       #
+# --------------------------------------------------------------------------- #
+
+def _normalize(parsed, url: str) -> list[dict]:
+    source = parsed.feed.get("title", url)
+    out = []
+    for entry in parsed.entries[:CACHED_ENTRIES]:
+        stamp = entry.get("published_parsed") or entry.get("updated_parsed")
+        out.append({
+            "title": entry.get("title", ""),
+            "link": entry.get("link", ""),
+            "summary": entry.get("summary", "")[:RAW_SUMMARY_CHARS],
+            "source": source,
+            "published": entry.get("published", ""),
+            "published_ts": calendar.timegm(stamp) if stamp else None,
+        })
+    return out
+
+
+def _poll(url: str, state: dict, now: float) -> dict:
+    """Fetch one feed; returns the updated state with a new `log` record."""
+    import feedparser
+
+    record = {"at": round(now), "polled": True, "status": None, "latency_ms": 0,
+              "bytes": 0, "entries": 0, "newest_age_h": None, "error": ""}
+    headers = {"User-Agent": feedparser.USER_AGENT}
+    # Validators are only worth sending when there are cached entries to
+    # fall back on: a 304 for a feed we hold nothing for (cache cleared or
+    # a previous parse failed) would leave us with no entries at all.
+    if state.get("entries"):
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+    t0 = time.perf_counter()
+    try:
+        resp = http_pool.get(url, purpose="feed", headers=headers, follow_redirects=True)
+        record["status"] = resp.status_code
+        record["bytes"] = len(resp.content)
+        if resp.status_code == 304:
+            entries = state.get("entries") or []
+        else:
+            resp.raise_for_status()
+            parsed = feedparser.parse(resp.content)
+            if parsed.bozo and not parsed.entries:
+                raise ValueError(f"unparseable feed: {parsed.get('bozo_exception')}")
+            entries = _normalize(parsed, url)
+            state = {**state, "etag": resp.headers.get("ETag", ""),
+                     "last_modified": resp.headers.get("Last-Modified", "")}
+        state = {**state, "entries": entries, "last_ok": now, "last_error": ""}
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"[:300]
+        state = {**state, "last_error": record["error"]}
+    record["latency_ms"] = round((time.perf_counter() - t0) * 1000)
+
+    entries = state.get("entries") or []
+    stamps = [e["published_ts"] for e in entries if e.get("published_ts")]
+    if not record["error"]:
+        record["entries"] = len(entries)
+        state["cadence_s"] = learn_cadence(stamps) or state.get("cadence_s")
+    if stamps:
+        record["newest_age_h"] = round((now - max(stamps)) / 3600, 1)
+    return {**state, "log": (state.get("log", []) + [record])[-LOG_KEEP:]}
+
+
+def fetch_entries(urls: list[str], limit: int = 15, adaptive: bool = True,
+                  now: float | None = None) -> list[dict]:
+    """Entries from every feed, at most `limit` per feed, in FEEDS order.
+    With adaptive=False every feed is fetched."""
+    now = now if now is not None else time.time()
+    cache = state_store.read(CACHE_FILE, {}) or {}
+    states = {url: cache.get(url) or {} for url in urls}
+    to_poll = [u for u in urls if not adaptive or should_poll(states[u], now)]
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        for url, state in zip(to_poll, pool.map(lambda u: _poll(u, states[u], now), to_poll)):
+            states[url] = state
+
+    entries: list[dict] = []
+    report = {"polled": 0, "skipped": 0, "not_modified": 0, "failed": 0, "bytes": 0}
+    for url in urls:
+        state = states[url]
+        if url in to_poll:
+            record = state["log"][-1]
+            report["polled"] += 1
+            report["bytes"] += record["bytes"]
+            report["not_modified"] += record["status"] == 304
+            if record["error"]:
+                report["failed"] += 1
+                print(f"Failed to fetch {url}: {record['error']}")
+        else:
+            report["skipped"] += 1
+            skip = {"at": round(now), "polled": False,
+                    "p_change": round(change_probability(state, now), 3)}
+            state["log"] = (state.get("log", []) + [skip])[-LOG_KEEP:]
+        entries.extend(state.get("entries", [])[:limit])
+        cache[url] = state
+
+    state_store.write(CACHE_FILE, cache, compact=True)
+    _report.add(**report)
+    print(f"[feeds] {len(urls)} feeds: {report['polled']} polled "
+          f"({report['not_modified']} not modified, {report['failed']} failed), "
+          f"{report['skipped']} skipped as unlikely to have changed")
+    return normalize.normalize_entries(entries, max_chars=SUMMARY_CHARS)
+
+
+def main() -> int:
+    cache = state_store.read(CACHE_FILE, {}) or {}
+    now = time.time()
+    print(f"{'feed':60} {'cadence':>8} {'p(new)':>7} {'status':>6} {'ms':>6} "
+          f"{'KB':>6} {'n':>3} {'newest':>7}  error")
+    for url, state in sorted(cache.items()):
+        polls = [r for r in state.get("log", []) if r.get("polled")]
+        last = polls[-1] if polls else {}
+        cadence = state.get("cadence_s")
+        print(f"{url[:60]:60} {(f'{cadence / 3600:.0f}h' if cadence else '?'):>8} "
+              f"{change_probability(state, now):7.2f} {str(last.get('status', '')):>6} "
+              f"{last.get('latency_ms', 0):6} {last.get('bytes', 0) / 1024:6.0f} "
+              f"{last.get('entries', 0):3} "
+              f"{(str(last.get('newest_age_h')) + 'h') if last.get('newest_age_h') is not None else '?':>7}"
+              f"  {last.get('error', '')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Minimal GitHub REST client for the bots' proposal PRs.
+
+horizon_bot and model_data_bot used to shell out to the `gh` CLI for every PR
+operation: `pr list` to dedup against open proposals, then `pr create` or
+`pr comment`. Each call cold-started a Go binary and did its own auth round
+trip. This module talks to the REST API directly over the process-wide
+http_pool client.
+
+Open-PR listings are conditional requests: the ETag and parsed body of the
+last answer are kept in bot/.cache/github-etags.json, so an unchanged list is
+a 304 (which GitHub does not count against the rate limit) served from disk.
+One listing of open PRs answers every head-branch lookup in a run.
+
+Auth: GH_TOKEN or GITHUB_TOKEN, else `gh auth token` once per process (the
+server is already logged in for git pushes). Repo: GITHUB_REPOSITORY
+("owner/name"), else parsed from the `origin` remote.
+"""
+
+import json
+import os
+import re
+import subprocess
+from pathlib import Path
+
+import httpx
+
+import http_pool
+import state_store
+
+BOT_DIR = Path(__file__).parent
+REPO_DIR = BOT_DIR.parent
+CACHE_FILE = BOT_DIR / ".cache" / "github-etags.json"
+API_URL = "https://api.github.com"
+
+_REMOTE_SLUG = re.compile(r"github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$")
+
+
+class GitHubError(Exception):
+    """A GitHub API call failed (network, auth, or non-2xx status)."""
+
+
+def resolve_token() -> str | None:
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True,
+                                text=True, timeout=10)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def resolve_repo() -> str | None:
+    slug = os.environ.get("GITHUB_REPOSITORY")
+    if slug:
+        return slug
+    try:
+        result = subprocess.run(["git", "-C", str(REPO_DIR), "remote", "get-url", "origin"],
+                                capture_output=True, text=True, timeout=10)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    m = _REMOTE_SLUG.search(result.stdout.strip())
+    return m.group(1) if m else None
+
+
+class GitHubClient:
+    """Pooled REST client for one repository."""
+
+    def __init__(self, repo: str | None = None, token: str | None = None,
+                 api_url: str = API_URL, cache_file: Path | None = CACHE_FILE):
+        self.repo = repo or resolve_repo()
+        if not self.repo:
+            raise GitHubError("no repository: set GITHUB_REPOSITORY or an origin remote")
+        token = token if token is not None else resolve_token()
+        headers = {"Accept": "application/vnd.github+json",
+                   "X-GitHub-Api-Version": "2022-11-28",
+                   "User-Agent": "softcat-bots"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        self.api_url = api_url.rstrip("/")
+        self._headers = headers
+        self._http = http_pool.client()
+        self.cache_file = cache_file
+        self._etags: dict[str, dict] | None = None
+        self.stats = {"requests": 0, "not_modified": 0}
+
+    # -- transport --------------------------------------------------------- #
+
+    def _load_etags(self) -> dict[str, dict]:
+        if self._etags is None:
+            self._etags = {}
+            if self.cache_file and self.cache_file.exists():
+                try:
+                    self._etags = json.loads(self.cache_file.read_text())
+                except (OSError, json.JSONDecodeError, ValueError):
+                    pass
+        return self._etags
+
+    def _save_etags(self) -> None:
+        if not self.cache_file:
+            return
+        try:
+            state_store.write(self.cache_file, self._etags, compact=True)
+        except OSError as e:
+            print(f"[github_client] could not persist ETag cache: {e}")
+
+    def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        self.stats["requests"] += 1
+        try:
+            headers = {**self._headers, **kwargs.pop("headers", {})}
+            resp = self._http.request(method, self.api_url + path, headers=headers,
+                                      timeout=http_pool.timeout("api"), **kwargs)
+        except httpx.HTTPError as e:
+            raise GitHubError(f"{method} {path}: {e}") from e
+        if resp.status_code >= 400:
+            raise GitHubError(f"{method} {path}: HTTP {resp.status_code} {resp.text[:200]}")
+        return resp
+
+    def _get_cached(self, path: str, params: dict):
+        """GET with If-None-Match; a 304 returns the body cached with the ETag."""
+        etags = self._load_etags()
+        key = path + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        cached = etags.get(key)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        resp = self._request("GET", path, params=params, headers=headers)
+        if resp.status_code == 304 and cached:
+            self.stats["not_modified"] += 1
+            return cached["data"]
+        data = resp.json()
+        if resp.headers.get("ETag"):
+            etags[key] = {"etag": resp.headers["ETag"], "data": data}
+            self._save_etags()
+        return data
+
+    # -- pull requests ----------------------------------------------------- #
+
+    def open_pulls(self) -> list[dict]:
+        """Open PRs as {number, url, head, title, body}, newest first.
+
+        Capped at one page of 100: the bots only care about their own
+        proposal branches, of which there are a handful at most."""
+        prs = self._get_cached(f"/repos/{self.repo}/pulls",
+                               {"state": "open", "per_page": 100})
+        return [{"number": pr["number"], "url": pr["html_url"],
+                 "head": pr["head"]["ref"], "title": pr.get("title", ""),
+                 "body": pr.get("body") or ""} for pr in prs]
+
+    def find_open_pull(self, head: str) -> dict | None:
+        """The open PR whose head branch is exactly `head`, if any."""
+        return next((pr for pr in self.open_pulls() if pr["head"] == head), None)
+
+    def open_pulls_with_prefix(self, prefix: str) -> list[dict]:
+        return [pr for pr in self.open_pulls() if pr["head"].startswith(prefix)]
+
+    def create_pull(self, title: str, body: str, head: str, base: str = "main") -> dict:
+        resp = self._request("POST", f"/repos/{self.repo}/pulls",
+                             json={"title": title, "body": body, "head": head, "base": base})
+        pr = resp.json()
+        return {"number": pr["number"], "url": pr["html_url"]}
+
+    def comment(self, number: int, body: str) -> None:
+        self._request("POST", f"/repos/{self.repo}/issues/{number}/comments",
+                      json={"body": body})
+
+
+_client: GitHubClient | None = None
+
+
+def get() -> GitHubClient:
+    """The process-wide client shared by every bot in this process."""
+    global _client
+    if _client is None:
+        _client = GitHubClient()
+    return _client
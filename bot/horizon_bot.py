@@ -30,29 +30,33 @@ Issue #97 hard lesson: `_log_run()` runs BEFORE the git commit so the run-log
 entry lands in the same commit as this bot's data changes, not the next bot's.
 """
 
+import argparse
+import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
-import httpx
-from anthropic import Anthropic
-from dotenv import load_dotenv
-
 from pipeline_log import log_run as _log_run
+import content_catalogue
 import git_safe
+import github_client
+import outbox
+import preflight
+import radar_archive
+import similarity
+import state_store
 
 # Paths
 BOT_DIR = Path(__file__).parent
 REPO_DIR = BOT_DIR.parent
 HORIZON_DIR = REPO_DIR / "src" / "data" / "horizon"
-RADAR_DIR = REPO_DIR / "src" / "data" / "radar"
-THOUGHTS_DIR = REPO_DIR / "src" / "content" / "thoughts"
-NEWS_DIR = REPO_DIR / "src" / "content" / "news-and-updates"
 SHIFTS_FILE = HORIZON_DIR / "shifts.json"
 STYLE_GUIDE = REPO_DIR / "STYLE.md"
 
@@ -84,8 +88,7 @@ SHIFT_LOG_LOOKBACK_DAYS = 90 # how far back shifts.json reaches
 MODEL = "claude-sonnet-4-6"
 INPUT_COST_PER_MTOK = 3
 OUTPUT_COST_PER_MTOK = 15
-
-load_dotenv(BOT_DIR / ".env")
+INPUT_TOKEN_BUDGET = 10000  # whole Now prompt; see preflight.py
 
 
 # --------------------------------------------------------------------------- #
@@ -111,8 +114,7 @@ def load_recent_radar(days: int = 7) -> list[dict]:
     out = []
     for n in range(days):
         d = (today - timedelta(days=n)).isoformat()
-        p = RADAR_DIR / f"{d}.json"
-        data = _read_json(p, None)
+        data = radar_archive.get().read(d)
         if not data:
             continue
         for section in ("featured", "picks"):
@@ -123,50 +125,26 @@ def load_recent_radar(days: int = 7) -> list[dict]:
 
 def load_radar_dates() -> list[str]:
     """All dated radar files present in the archive, sorted oldest first."""
-    if not RADAR_DIR.exists():
-        return []
-    names = [p.stem for p in RADAR_DIR.glob("????-??-??.json")]
-    return sorted(names)
-
-
-def _read_markdown_frontmatter(path: Path) -> dict:
-    """Cheap frontmatter parser — avoids pulling in a yaml dep."""
-    text = path.read_text()
-    m = re.match(r"^---\s*\n(.*?)\n---\s*\n", text, re.DOTALL)
-    if not m:
-        return {}
-    meta = {}
-    for line in m.group(1).splitlines():
-        if ":" not in line:
-            continue
-        k, _, v = line.partition(":")
-        meta[k.strip()] = v.strip().strip('"').strip("'")
-    return meta
+    return radar_archive.get().dates()
 
 
-def load_recent_markdown(dir_path: Path, days: int = 7) -> list[dict]:
-    """Frontmatter + body slice from recent .md entries in a content dir."""
-    if not dir_path.exists():
-        return []
-    today = date.today()
+def load_recent_markdown(collection: str, days: int = 7) -> list[dict]:
+    """Frontmatter + body slice from recent entries in a content collection
+    ("thoughts" / "news").
+
+    Dates come from the shared content catalogue's persistent frontmatter
+    index, so only files inside the window are opened — cost stays flat as
+    the archive grows.
+    """
+    start = date.today() - timedelta(days=days)
     out = []
-    for p in sorted(dir_path.glob("*.md")):
-        meta = _read_markdown_frontmatter(p)
-        date_str = meta.get("date", "")
-        if not date_str or len(date_str) < 10:
-            continue
-        try:
-            d = date.fromisoformat(date_str[:10])
-        except ValueError:
-            continue
-        if (today - d).days > days:
-            continue
-        body = p.read_text().split("---", 2)[-1].strip()
+    for e in content_catalogue.get().by_date(collection, start):
+        body = e["path"].read_text().split("---", 2)[-1].strip()
         out.append({
-            "slug": p.stem,
-            "title": meta.get("title", ""),
-            "summary": meta.get("summary", ""),
-            "date": date_str[:10],
+            "slug": e["slug"],
+            "title": e["meta"].get("title", ""),
+            "summary": e["meta"].get("summary", ""),
+            "date": e["date"],
             "body_excerpt": body[:1500],
         })
     return out
@@ -185,22 +163,14 @@ def load_pending_proposals() -> list[dict]:
     sees merged now.json and re-proposes the same themes day after day when
     PRs sit unreviewed (observed 2026-04-23 → 2026-05-02: 60%+ recycling)."""
     try:
-        result = subprocess.run(
-            ["gh", "pr", "list",
-             "--search", "head:horizon-bot/proposals- is:open",
-             "--limit", "30",
-             "--json", "body"],
-            cwd=REPO_DIR, capture_output=True, text=True, timeout=15,
-        )
-        if result.returncode != 0:
-            return []
-        prs = json.loads(result.stdout or "[]")
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+        prs = github_client.get().open_pulls_with_prefix(PROPOSAL_BRANCH_PREFIX)
+    except github_client.GitHubError as e:
+        print(f"[horizon_bot] pending proposals unavailable: {e}")
         return []
 
     pending = []
     for pr in prs:
-        for line in (pr.get("body") or "").splitlines():
+        for line in pr["body"].splitlines():
             m = _PENDING_PR_LINE.match(line.strip())
             if not m:
                 continue
@@ -277,6 +247,63 @@ def _sanitize_evidence(
     return proposal
 
 
+# Cosine score (similarity.SimilarityIndex) at or above which a Now proposal
+# counts as a re-proposal. Calibrated leave-one-out on now.json (39 entries):
+# the recycled pair that shipped (cli-agent-takeover vs
+# terminal-agents-replace-chat) scores 0.48-0.49. The closest distinct pairs
+# are real-time-interfaces vs voice-ai-crosses-realtime-barrier (0.31-0.33)
+# and debug-data-becomes-training-gold vs training-data-quality (0.30-0.32);
+# everything else is at or below 0.29, median 0.17. 0.40 sits midway in the
+# gap, about 0.07 clear of the closest distinct pair on one side and 0.08
+# under the known repeat on the other.
+NOW_DUPLICATE_THRESHOLD = 0.40
+
+
+def build_now_index(existing_now: list[dict], archived_now: list[dict],
+                    pending: list[dict]) -> similarity.SimilarityIndex:
+    """Similarity index over every Now entry a proposal must not repeat:
+    live, archived, and pending in open PRs."""
+    index = similarity.SimilarityIndex()
+    for e in existing_now + archived_now:
+        index.add(e.get("id") or e.get("title", ""), similarity.entry_text(e))
+    for p in pending:
+        index.add(f"pending: {p['title']}", similarity.entry_text(p))
+    return index
+
+
+def collapse_pending(pending: list[dict]) -> list[dict]:
+    """Drop near-duplicate pending proposals, keeping the first of each.
+
+    The same signal sits in several open PRs when they go unreviewed for a
+    few days; showing it once keeps the prompt shorter without losing it."""
+    index = similarity.SimilarityIndex()
+    kept = []
+    for p in pending:
+        toks = similarity.entry_text(p)
+        if index.nearest(toks)[1] >= NOW_DUPLICATE_THRESHOLD:
+            continue
+        index.add(p["title"], toks)
+        kept.append(p)
+    return kept
+
+
+def drop_duplicate_proposals(proposals: list[dict],
+                             index: similarity.SimilarityIndex) -> list[dict]:
+    """Deterministic backstop for prompt rule 3: drop proposals that repeat
+    an indexed entry or an earlier proposal in the same batch."""
+    kept = []
+    for p in proposals:
+        toks = similarity.entry_text(p)
+        key, score = index.nearest(toks)
+        if score >= NOW_DUPLICATE_THRESHOLD:
+            print(f"[horizon_bot] dropping {p.get('id', '?')}: near-duplicate of "
+                  f"{key} ({score:.2f})")
+            continue
+        index.add(p.get("id", ""), toks)
+        kept.append(p)
+    return kept
+
+
 def propose_now_entries(
     radar_items: list[dict],
     thoughts: list[dict],
@@ -288,6 +315,7 @@ def propose_now_entries(
     if not radar_items and not thoughts and not news:
         return [], None
 
+    from anthropic import Anthropic
     client = Anthropic()
     style_guide = STYLE_GUIDE.read_text() if STYLE_GUIDE.exists() else ""
     existing_titles = [e.get("title", "") for e in existing_now]
@@ -301,10 +329,6 @@ def propose_now_entries(
     # and the model guessed the ref — abbreviating thought/news slugs to a bare
     # date or inventing one, which shipped 48 dangling evidence refs (fixed
     # 2026-06-23). Radar's ref IS its date; thoughts/news cite the full slug.
-    radar_text = "\n".join(
-        f"- ref={r.get('_radar_date')} | {r.get('name','?')}: {r.get('description','')[:200]}"
-        for r in radar_items[:60]
-    ) or "(none)"
     thoughts_text = "\n".join(
         f"- ref={t['slug']} | [{t['date']}] {t['title']}: {t['summary'][:200]}"
         for t in thoughts
@@ -318,7 +342,12 @@ def propose_now_entries(
     today = date.today().isoformat()
     year_month = today[:7]
 
-    prompt = f"""You are proposing new entries for the NOW lane of the SOFT CAT Horizon Map.
+    def build(items: list[dict]) -> str:
+        radar_text = "\n".join(
+            f"- ref={r.get('_radar_date')} | {r.get('name','?')}: {r.get('description','')[:200]}"
+            for r in items
+        ) or "(none)"
+        return f"""You are proposing new entries for the NOW lane of the SOFT CAT Horizon Map.
 The Now lane tracks "what is changing in AI right now". Entries are signals
 about the present, not forecasts. Your job is to look across the recent
 radar, thoughts, and news entries below and identify EMERGING CROSS-SOURCE
@@ -356,7 +385,7 @@ PATTERNS that deserve a Now entry.
 
 ## Context
 
-### Recent radar ({len(radar_items)} items)
+### Recent radar ({len(items)} items)
 {radar_text}
 
 ### Recent thoughts ({len(thoughts)} items)
@@ -398,6 +427,10 @@ If nothing clears the two-source bar, return {{"proposals": []}}. Do not
 apologise, do not explain, just return the JSON.
 """
 
+    # Radar items are the bulk of the context; the oldest go first.
+    _, prompt = preflight.fit(build, radar_items[:60], INPUT_TOKEN_BUDGET,
+                              label="horizon_bot", model=MODEL, client=client)
+
     response = client.messages.create(
         model=MODEL,
         max_tokens=4096,
@@ -436,13 +469,74 @@ apologise, do not explain, just return the JSON.
 # Job 2 — Next confidence shift flags (FLAG-ONLY, no auto-shift)              #
 # --------------------------------------------------------------------------- #
 
+class ThemeIndex:
+    """Theme -> supporting-item postings, built once per run.
+
+    flag_next_shifts used to lowercase and substring-scan every radar item
+    and thought once per Next entry per theme. Here every theme string
+    ("needle") is compiled into one lookahead alternation, each item's text
+    is scanned once, and flagging becomes a union of postings per entry.
+
+    Matching is exactly `needle in text`: the lookahead tries every start
+    position, and because an alternation reports only the longest needle at
+    a given position, any needle that is a prefix of the reported one is
+    credited too.
+    """
+
+    def __init__(self, needles: set[str], radar_items: list[dict], thoughts: list[dict]):
+        ordered = sorted(needles, key=len, reverse=True)
+        self._pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+        self._prefixes = {h: {g for g in needles if g != h and h.startswith(g)}
+                          for h in needles}
+        self.radar = self._postings(
+            f"{r.get('name','')} {r.get('description','')}".lower() for r in radar_items)
+        self.thoughts = self._postings(
+            f"{t['title']} {t['summary']}".lower() for t in thoughts)
+
+    def _postings(self, texts) -> dict[str, set[int]]:
+        postings: dict[str, set[int]] = {}
+        for i, text in enumerate(texts):
+            hits = set()
+            for m in self._pattern.finditer(text):
+                hits.add(m.group(1))
+            for h in list(hits):
+                hits |= self._prefixes[h]
+            for h in hits:
+                postings.setdefault(h, set()).add(i)
+        return postings
+
+    @staticmethod
+    def lookup(postings: dict[str, set[int]], haystacks: set[str]) -> list[int]:
+        """Item indices matching any haystack, in original item order."""
+        hit: set[int] = set()
+        for h in haystacks:
+            hit |= postings.get(h, set())
+        return sorted(hit)
+
+
+def _haystacks(themes: set[str]) -> set[str]:
+    return themes | {t.replace("_", " ") for t in themes}
+
+
 def flag_next_shifts(
     next_entries: list[dict],
     radar_items: list[dict],
     thoughts: list[dict],
 ) -> list[dict]:
     """Flag Next entries whose themes have accumulated fresh supporting
-    evidence the entry does not yet reference. No auto-shifts in v1."""
+    evidence the entry does not yet reference. No auto-shifts in v1.
+
+    Radar entries don't carry horizon themes natively, so an item supports a
+    theme when the theme appears in its name+description (thoughts: title +
+    summary). Cheap and deterministic; the text matching is done once per run
+    by ThemeIndex rather than once per entry."""
+    needles: set[str] = set()
+    for entry in next_entries:
+        needles |= _haystacks(set(entry.get("themes", [])))
+    if not needles:
+        return []
+    index = ThemeIndex(needles, radar_items, thoughts)
+
     flags = []
     for entry in next_entries:
         themes = set(entry.get("themes", []))
@@ -452,24 +546,19 @@ def flag_next_shifts(
             ev.get("ref", "") for ev in entry.get("evidence", []) or []
         }
 
-        # Count fresh radar items whose themes plausibly overlap. Radar entries
-        # don't carry horizon themes natively, so we fall back to a text match
-        # against the radar item's name+description. Cheap and deterministic.
         supporting = []
-        haystacks = themes | {t.replace("_", " ") for t in themes}
-        for r in radar_items:
-            text = f"{r.get('name','')} {r.get('description','')}".lower()
-            if any(h in text for h in haystacks):
-                ref = r.get("_radar_date", "")
-                if ref and ref not in existing_refs:
-                    supporting.append({"type": "radar", "ref": ref,
-                                       "label": r.get("name", "")[:120]})
-        for t in thoughts:
-            text = f"{t['title']} {t['summary']}".lower()
-            if any(h in text for h in haystacks):
-                if t["slug"] not in existing_refs:
-                    supporting.append({"type": "thought", "ref": t["slug"],
-                                       "label": t["title"][:120]})
+        haystacks = _haystacks(themes)
+        for i in index.lookup(index.radar, haystacks):
+            r = radar_items[i]
+            ref = r.get("_radar_date", "")
+            if ref and ref not in existing_refs:
+                supporting.append({"type": "radar", "ref": ref,
+                                   "label": r.get("name", "")[:120]})
+        for i in index.lookup(index.thoughts, haystacks):
+            t = thoughts[i]
+            if t["slug"] not in existing_refs:
+                supporting.append({"type": "thought", "ref": t["slug"],
+                                   "label": t["title"][:120]})
 
         if len(supporting) >= NEXT_SHIFT_MIN_EVIDENCE:
             flags.append({
@@ -490,11 +579,56 @@ def flag_next_shifts(
 # Job 3 — Past promotion candidates                                           #
 # --------------------------------------------------------------------------- #
 
+PAST_SCORES_FILE = BOT_DIR / ".cache" / "past-scores.json"
+
+
+def _themes_key() -> str:
+    """Fingerprint of HORIZON_THEMES; a theme edit invalidates every score."""
+    return hashlib.sha256(",".join(sorted(HORIZON_THEMES)).encode()).hexdigest()[:16]
+
+
+def load_past_scores() -> dict:
+    """Persisted per-day Past scores, discarded wholesale if the themes moved."""
+    data = _read_json(PAST_SCORES_FILE, None)
+    if not isinstance(data, dict) or data.get("themes") != _themes_key():
+        return {"themes": _themes_key(), "days": {}}
+    return data
+
+
+def save_past_scores(store: dict) -> None:
+    state_store.write(PAST_SCORES_FILE, store, compact=True)
+
+
+def score_radar_day(data: dict) -> list[dict]:
+    """Score one radar day's featured items. Pure: depends only on the
+    day-file and HORIZON_THEMES, which is what makes it safe to memoize."""
+    scored = []
+    for item in data.get("featured", []) or []:
+        name = item.get("name", "")
+        if not name:
+            continue
+        description = item.get("description", "")
+        score = 0
+        # Featured items get a base score; picks we skip entirely to keep
+        # the candidate list lean.
+        score += 2
+        # Cross-theme breadth heuristic: how many horizon themes appear in
+        # the blurb? More coverage => more likely to have mattered.
+        hits = sum(1 for t in HORIZON_THEMES if t in description.lower())
+        score += hits
+        scored.append({"name": name, "description": description[:240], "score": score})
+    return scored
+
+
 def score_past_candidates(
     past_entries: list[dict],
 ) -> list[dict]:
     """Surface radar products older than PAST_MIN_AGE_DAYS that aren't yet
-    canonised. Scoring is intentionally simple — the human decides."""
+    canonised. Scoring is intentionally simple — the human decides.
+
+    A radar day this old never changes, so its scores are memoized in
+    PAST_SCORES_FILE keyed by the day-file's hash (and the themes). Each run
+    only scores days that newly crossed the age cutoff or were edited."""
     existing_origin_refs = {
         (e.get("origin") or {}).get("ref", "") for e in past_entries
     }
@@ -502,6 +636,10 @@ def score_past_candidates(
     today = date.today()
     cutoff = today - timedelta(days=PAST_MIN_AGE_DAYS)
     radar_dates = load_radar_dates()
+    archive = radar_archive.get()
+    store = load_past_scores()
+    memo = store["days"]
+    scored_now = 0
     candidates = []
     for d in radar_dates:
         try:
@@ -510,33 +648,40 @@ def score_past_candidates(
             continue
         if day > cutoff:
             continue  # too recent to canonise
-        data = _read_json(RADAR_DIR / f"{d}.json", None)
-        if not data:
+        # Skip if this radar day is already the origin for a past entry
+        if d in existing_origin_refs:
             continue
-        for item in data.get("featured", []) or []:
-            name = item.get("name", "")
-            if not name:
-                continue
-            # Skip if this radar day is already the origin for a past entry
-            if d in existing_origin_refs:
+        sha = archive.sha(d)
+        if sha is None:
+            continue
+        cached = memo.get(d)
+        if cached and cached["sha"] == sha:
+            items = cached["items"]
+        else:
+            data = archive.read(d)
+            if not data:
                 continue
-            description = item.get("description", "")
-            score = 0
-            # Featured items get a base score; picks we skip entirely to keep
-            # the candidate list lean.
-            score += 2
-            # Cross-theme breadth heuristic: how many horizon themes appear in
-            # the blurb? More coverage => more likely to have mattered.
-            hits = sum(1 for t in HORIZON_THEMES if t in description.lower())
-            score += hits
+            items = score_radar_day(data)
+            memo[d] = {"sha": sha, "items": items}
+            scored_now += 1
+        for item in items:
             candidates.append({
                 "radar_date": d,
-                "name": name,
-                "description": description[:240],
-                "score": score,
+                **item,
                 "suggested_origin": {"type": "radar", "ref": d, "promoted_at": today.isoformat()},
             })
 
+    # Forget days that were pruned from the archive.
+    live = set(radar_dates)
+    for d in [d for d in memo if d not in live]:
+        del memo[d]
+        scored_now += 1
+    if scored_now:
+        try:
+            save_past_scores(store)
+        except OSError as e:
+            print(f"[horizon_bot] could not persist past scores: {e}")
+
     candidates.sort(key=lambda c: (-c["score"], c["radar_date"]))
     return candidates[:PAST_CANDIDATE_LIMIT]
 
@@ -545,35 +690,31 @@ def score_past_candidates(
 # Shifts log (for Step 7)                                                     #
 # --------------------------------------------------------------------------- #
 
-def build_shifts_log() -> list[dict]:
-    """Parse `git log -- src/data/horizon/` into a structured shift log."""
-    os.chdir(REPO_DIR)
-    since = (date.today() - timedelta(days=SHIFT_LOG_LOOKBACK_DAYS)).isoformat()
-    try:
-        out = subprocess.run(
-            [
-                "git", "log",
-                f"--since={since}",
-                "--pretty=format:%H|%ai|%s",
-                "--name-status",
-                "--",
-                "src/data/horizon/",
-            ],
-            capture_output=True, text=True, check=True,
-        ).stdout
-    except subprocess.CalledProcessError as e:
-        print(f"[horizon_bot] git log failed: {e}")
-        return []
+SHIFTS_CURSOR_FILE = BOT_DIR / ".cache" / "shifts-cursor.json"
+SCENARIO_DIFFS_FILE = BOT_DIR / ".cache" / "scenario-diffs.json"
 
+
+def _git_out(args: list[str]) -> str:
+    return subprocess.run(["git", *args], capture_output=True, text=True,
+                          check=True).stdout
+
+
+def _parse_shift_log(out: str) -> list[dict]:
+    """Parse `git log --pretty=%H|%ai|%ci|%s --name-status` output.
+
+    Each entry carries its commit date in `_ci` so the incremental path can
+    prune by the same clock `git log --since` filters on; build_shifts_log
+    strips it before returning."""
     shifts = []
     current = None
     for line in out.splitlines():
         if not line.strip():
             current = None
             continue
-        if "|" in line and line.count("|") >= 2:
-            sha, iso, subject = line.split("|", 2)
-            current = {"sha": sha[:10], "date": iso[:10], "subject": subject}
+        if "|" in line and line.count("|") >= 3:
+            sha, iso, committed, subject = line.split("|", 3)
+            current = {"sha": sha[:10], "date": iso[:10], "ci": committed[:10],
+                       "subject": subject}
             continue
         if current is None:
             continue
@@ -593,25 +734,141 @@ def build_shifts_log() -> list[dict]:
             "verb": verb,
             "subject": current["subject"],
             "sha": current["sha"],
+            "_ci": current["ci"],
         })
     return shifts
 
 
+def build_shifts_log(full_rebuild: bool = False) -> list[dict]:
+    """Parse `git log -- src/data/horizon/` into a structured shift log.
+
+    Commits are immutable, so the parsed log is kept in SHIFTS_CURSOR_FILE
+    with the HEAD it was built at. A normal run parses only `cursor..HEAD`
+    and prepends it; the lookback window is then applied by commit date. A
+    cursor that is no longer an ancestor of HEAD (history rewritten), a
+    missing cursor, or `full_rebuild=True` re-walks the whole window.
+    """
+    os.chdir(REPO_DIR)
+    since = (date.today() - timedelta(days=SHIFT_LOG_LOOKBACK_DAYS)).isoformat()
+    fmt = "--pretty=format:%H|%ai|%ci|%s"
+    try:
+        head = _git_out(["rev-parse", "HEAD"]).strip()
+        cursor = {} if full_rebuild else _read_json(SHIFTS_CURSOR_FILE, {})
+        base = cursor.get("head", "") if isinstance(cursor, dict) else ""
+        incremental = bool(base) and subprocess.run(
+            ["git", "merge-base", "--is-ancestor", base, head],
+            capture_output=True).returncode == 0
+        if incremental:
+            new = [] if base == head else _parse_shift_log(_git_out(
+                ["log", fmt, "--name-status", f"{base}..{head}", "--", "src/data/horizon/"]))
+            shifts = new + cursor.get("shifts", [])
+            print(f"[horizon_bot] Shift log: {len(new)} new entr"
+                  f"{'y' if len(new) == 1 else 'ies'} since {base[:10]}")
+        else:
+            shifts = _parse_shift_log(_git_out(
+                ["log", f"--since={since}", fmt, "--name-status", "--", "src/data/horizon/"]))
+            print(f"[horizon_bot] Shift log: full rebuild ({len(shifts)} entries)")
+    except subprocess.CalledProcessError as e:
+        print(f"[horizon_bot] git log failed: {e}")
+        return []
+
+    shifts = [s for s in shifts if s.get("_ci", "") >= since]
+    try:
+        state_store.write(SHIFTS_CURSOR_FILE, {"head": head, "shifts": shifts}, compact=True)
+    except OSError as e:
+        print(f"[horizon_bot] could not persist shift cursor: {e}")
+    return [{k: v for k, v in s.items() if k != "_ci"} for s in shifts]
+
+
 STANCES = ("optimistic", "pragmatic", "sceptical")
-GIT_SHOW_TIMEOUT_S = 5
+GIT_BATCH_TIMEOUT_S = 5  # per-blob watchdog on the shared cat-file process
+SCENARIOS_PATH = "src/data/horizon/scenarios.json"
+
+
+class GitBlobReader:
+    """One long-lived `git cat-file --batch` process for a whole run.
+
+    parse_scenario_diff used to fork two `git show` processes per scenarios
+    commit (after, and `sha^`), each with its own timeout. This streams every
+    blob by `<rev>:<path>` through a single process instead. Use as a context
+    manager; the process starts on the first read.
+
+    A read that stalls past GIT_BATCH_TIMEOUT_S kills the process and raises
+    TimeoutError (the stream can't be resynchronised); the next read starts a
+    fresh one.
+    """
+
+    def __init__(self, repo: Path | None = None, timeout: float = GIT_BATCH_TIMEOUT_S):
+        self.repo = repo or REPO_DIR
+        self.timeout = timeout
+        self._proc: subprocess.Popen | None = None
+        self.reads = 0
 
+    def __enter__(self) -> "GitBlobReader":
+        return self
 
-def parse_scenario_diff(sha: str) -> list[dict] | None:
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=self.timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+        self._proc = None
+
+    def read(self, spec: str) -> bytes | None:
+        """Blob contents for `spec` (e.g. `abc123^:path`), None if missing."""
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                ["git", "-C", str(self.repo), "cat-file", "--batch"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        proc = self._proc
+        watchdog = threading.Timer(self.timeout, proc.kill)
+        watchdog.start()
+        try:
+            proc.stdin.write(spec.encode() + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline()
+            if not header:
+                raise TimeoutError(f"git cat-file --batch gave no answer for {spec}")
+            parts = header.split()
+            if len(parts) != 3:
+                return None  # "<spec> missing" / "<spec> ambiguous"
+            size = int(parts[2])
+            data = proc.stdout.read(size)
+            proc.stdout.read(1)  # trailing LF
+            if len(data) != size:
+                raise TimeoutError(f"git cat-file --batch truncated {spec}")
+            self.reads += 1
+            return data
+        except (OSError, ValueError, TimeoutError):
+            self._proc = None
+            proc.kill()
+            raise TimeoutError(f"git cat-file --batch failed reading {spec}")
+        finally:
+            watchdog.cancel()
+
+
+def parse_scenario_diff(sha: str, blobs: GitBlobReader | None = None) -> list[dict] | None:
     """Compare scenarios.json at `sha` vs its parent; emit year/band deltas.
 
     Returns a list of change records. Empty list means "no meaningful drift"
     (e.g., whitespace-only commit). None means "couldn't parse" — the caller
     should fall back to emitting an unenriched shift entry.
 
+    Both sides are streamed through `blobs` (one shared cat-file process per
+    run); without it a private reader is used for this one call.
+
     Failure modes handled (plan 2026-04-22):
       * file absent at parent (first commit touching scenarios.json)
       * malformed JSON on either side
-      * git show timeout
+      * cat-file stall (watchdog timeout)
       * merge commits (first parent used via ``sha^`` which git resolves to -p1)
       * whitespace-only edits (deep-equal short-circuit)
       * renamed horizon ids (treated as remove + add, emitted as stance-level
@@ -619,32 +876,31 @@ def parse_scenario_diff(sha: str) -> list[dict] | None:
       * stance block added or removed (emitted with stance_added/removed flags)
       * indefinite year (delta_months null, band_change may still fire)
     """
+    if blobs is None:
+        with GitBlobReader() as own:
+            return parse_scenario_diff(sha, own)
+
     try:
-        after_raw = subprocess.run(
-            ["git", "show", f"{sha}:src/data/horizon/scenarios.json"],
-            capture_output=True, text=True, check=True,
-            timeout=GIT_SHOW_TIMEOUT_S,
-        ).stdout
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-        print(f"[horizon_bot] parse_scenario_diff: git show after failed for {sha}: {e}")
+        after_raw = blobs.read(f"{sha}:{SCENARIOS_PATH}")
+    except TimeoutError as e:
+        print(f"[horizon_bot] parse_scenario_diff: {e}")
+        return None
+    if after_raw is None:
+        print(f"[horizon_bot] parse_scenario_diff: {SCENARIOS_PATH} missing at {sha}")
         return None
 
     try:
-        before_raw = subprocess.run(
-            ["git", "show", f"{sha}^:src/data/horizon/scenarios.json"],
-            capture_output=True, text=True, check=True,
-            timeout=GIT_SHOW_TIMEOUT_S,
-        ).stdout
-    except subprocess.CalledProcessError:
+        before_raw = blobs.read(f"{sha}^:{SCENARIOS_PATH}")
+    except TimeoutError:
+        return None
+    if before_raw is None:
         # No parent, or file didn't exist at parent. No drift to compute.
         return []
-    except subprocess.TimeoutExpired:
-        return None
 
     try:
         after_json = json.loads(after_raw)
         before_json = json.loads(before_raw)
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         print(f"[horizon_bot] parse_scenario_diff: JSON decode failed for {sha}: {e}")
         return None
 
@@ -727,47 +983,65 @@ def enrich_scenario_shifts(shifts: list[dict]) -> tuple[list[dict], int]:
     """Second pass over the shift log. For each entry where lane == 'scenarios',
     compute a `changes` array via parse_scenario_diff.
 
+    A commit's diff never changes, so successful results are memoized in
+    SCENARIO_DIFFS_FILE by sha; only commits new to the log (or ones that
+    failed to parse last time) are diffed.
+
     Returns the enriched list plus a count of successfully parsed scenario
     commits (for pipeline_log observability)."""
+    memo = _read_json(SCENARIO_DIFFS_FILE, {})
+    if not isinstance(memo, dict):
+        memo = {}
+    diffed = 0
     parsed_count = 0
     enriched: list[dict] = []
     seen_shas: set[str] = set()
-    for s in shifts:
-        if s.get("lane") != "scenarios":
-            enriched.append(s)
-            continue
-        # A single commit may appear once per lane — but we diff the scenarios
-        # file at that sha exactly once.
-        sha = s.get("sha")
-        if sha and sha in seen_shas:
-            enriched.append(s)
-            continue
-        if sha:
-            seen_shas.add(sha)
-        changes = parse_scenario_diff(sha) if sha else None
-        if changes is None:
-            # Couldn't parse; emit unenriched entry so shift log still renders.
-            enriched.append(s)
-            continue
-        parsed_count += 1
-        if changes:
-            enriched.append({**s, "changes": changes})
-        else:
-            # No drift detected (whitespace-only, structural-only, etc.); still
-            # emit the shift without a changes array so the renderer falls back
-            # to the commit-subject line.
-            enriched.append(s)
+    with GitBlobReader() as blobs:
+        for s in shifts:
+            if s.get("lane") != "scenarios":
+                enriched.append(s)
+                continue
+            # A single commit may appear once per lane — but we diff the scenarios
+            # file at that sha exactly once.
+            sha = s.get("sha")
+            if sha and sha in seen_shas:
+                enriched.append(s)
+                continue
+            if sha:
+                seen_shas.add(sha)
+            if sha and sha in memo:
+                changes = memo[sha]
+            else:
+                changes = parse_scenario_diff(sha, blobs) if sha else None
+                if changes is not None:
+                    memo[sha] = changes
+                    diffed += 1
+            if changes is None:
+                # Couldn't parse; emit unenriched entry so shift log still renders.
+                enriched.append(s)
+                continue
+            parsed_count += 1
+            if changes:
+                enriched.append({**s, "changes": changes})
+            else:
+                # No drift detected (whitespace-only, structural-only, etc.); still
+                # emit the shift without a changes array so the renderer falls back
+                # to the commit-subject line.
+                enriched.append(s)
+
+    # Keep the memo to commits still inside the shift log window.
+    live = {sha: memo[sha] for sha in seen_shas if sha in memo}
+    if diffed or live.keys() != memo.keys():
+        try:
+            state_store.write(SCENARIO_DIFFS_FILE, live, compact=True)
+        except OSError as e:
+            print(f"[horizon_bot] could not persist scenario diffs: {e}")
     return enriched, parsed_count
 
 
 def write_shifts_log(shifts: list[dict]) -> bool:
     """Write shifts.json only if content changed. Returns True if written."""
-    existing = _read_json(SHIFTS_FILE, None)
-    if existing == shifts:
-        return False
-    SHIFTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    SHIFTS_FILE.write_text(json.dumps(shifts, indent=2) + "\n")
-    return True
+    return state_store.write(SHIFTS_FILE, shifts)
 
 
 # --------------------------------------------------------------------------- #
@@ -775,14 +1049,13 @@ def write_shifts_log(shifts: list[dict]) -> bool:
 # --------------------------------------------------------------------------- #
 
 def write_staging(now_proposals, next_flags, past_candidates):
-    STAGING_DIR.mkdir(parents=True, exist_ok=True)
     payload = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "now_proposals": now_proposals,
         "next_flags": next_flags,
         "past_candidates": past_candidates,
     }
-    STAGING_FILE.write_text(json.dumps(payload, indent=2) + "\n")
+    state_store.write(STAGING_FILE, payload)
     print(f"[horizon_bot] Staging written: {STAGING_FILE}")
 
 
@@ -801,22 +1074,14 @@ def post_to_discord(now_n, next_n, past_n, pr_url=None):
         content += f"\nReview PR: {pr_url}"
     else:
         content += f"\nStaging file: `{STAGING_FILE}`."
-    try:
-        httpx.post(webhook, json={"content": content,
-                                   "username": "SOFT CAT Horizon"}, timeout=15)
-    except Exception as e:
-        print(f"[horizon_bot] Discord post failed: {e}")
+    outbox.discord(webhook, content, username="SOFT CAT Horizon", source="horizon_bot")
 
 
 def ping_healthcheck(status="success"):
     url = os.environ.get("HC_PING_HORIZON")
     if not url:
         return
-    try:
-        suffix = "/fail" if status == "fail" else ""
-        httpx.get(f"{url}{suffix}", timeout=10)
-    except Exception as e:
-        print(f"[horizon_bot] Healthcheck ping failed: {e}")
+    outbox.ping(url, status, source="horizon_bot")
 
 
 # --------------------------------------------------------------------------- #
@@ -876,18 +1141,11 @@ def create_proposal_pr(now_proposals: list[dict]) -> str | None:
     branch = f"{PROPOSAL_BRANCH_PREFIX}{today}"
 
     # Check for an existing open PR from a previous run today
-    existing_pr = None
     try:
-        result = subprocess.run(
-            ["gh", "pr", "list", "--head", branch, "--state", "open",
-             "--json", "number,url", "--limit", "1"],
-            capture_output=True, text=True, check=True,
-        )
-        prs = json.loads(result.stdout)
-        if prs:
-            existing_pr = prs[0]
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
-        pass
+        existing_pr = github_client.get().find_open_pull(branch)
+    except github_client.GitHubError as e:
+        print(f"[horizon_bot] PR lookup failed: {e}")
+        existing_pr = None
 
     # All branch/ref mutations below run under the shared git lock so they
     # cannot interleave with another bot committing to main (this path switches
@@ -919,7 +1177,7 @@ def create_proposal_pr(now_proposals: list[dict]) -> str | None:
             return None
 
         current.extend(new_entries)
-        now_file.write_text(json.dumps(current, indent=2) + "\n")
+        state_store.write(now_file, current)
 
         # Commit and push
         subprocess.run(["git", "add", str(now_file)], check=True)
@@ -951,18 +1209,13 @@ def create_proposal_pr(now_proposals: list[dict]) -> str | None:
             body = "\n".join(body_lines)
 
             try:
-                result = subprocess.run(
-                    ["gh", "pr", "create",
-                     "--title", f"Horizon: {len(new_entries)} Now proposals ({today})",
-                     "--body", body,
-                     "--base", "main",
-                     "--head", branch],
-                    capture_output=True, text=True, check=True,
-                )
-                pr_url = result.stdout.strip()
+                pr = github_client.get().create_pull(
+                    f"Horizon: {len(new_entries)} Now proposals ({today})",
+                    body, head=branch, base="main")
+                pr_url = pr["url"]
                 print(f"[horizon_bot] Created PR: {pr_url}")
-            except subprocess.CalledProcessError as e:
-                print(f"[horizon_bot] gh pr create failed: {e.stderr}")
+            except github_client.GitHubError as e:
+                print(f"[horizon_bot] PR create failed: {e}")
 
         # Return to main
         subprocess.run(["git", "checkout", "main"], capture_output=True)
@@ -973,7 +1226,40 @@ def create_proposal_pr(now_proposals: list[dict]) -> str | None:
 # Main                                                                        #
 # --------------------------------------------------------------------------- #
 
+def run_now_job(radar_items: list[dict], thoughts: list[dict], news: list[dict],
+                now_entries: list[dict], items_found: int) -> tuple[list[dict], object]:
+    """Job 1: Now proposals from Claude, deduped against live, archived and
+    pending entries. Returns (proposals, usage); usage is None when there
+    was no evidence and so no call."""
+    if items_found == 0:
+        return [], None
+    pending_proposals = load_pending_proposals()
+    pending_shown = collapse_pending(pending_proposals)
+    print(f"[horizon_bot] Pending PR proposals to dedup against: "
+          f"{len(pending_proposals)} ({len(pending_shown)} distinct)")
+    now_proposals, usage = propose_now_entries(
+        radar_items, thoughts, news, now_entries,
+        pending_proposals=pending_shown,
+    )
+    now_index = build_now_index(now_entries, load_lane("now-archive"), pending_proposals)
+    return drop_duplicate_proposals(now_proposals, now_index), usage
+
+
+def _timed(fn, *args):
+    t = time.time()
+    result = fn(*args)
+    return result, time.time() - t
+
+
 def main():
+    from dotenv import load_dotenv
+    load_dotenv(BOT_DIR / ".env")
+    parser = argparse.ArgumentParser(description="SOFT CAT Horizon bot")
+    parser.add_argument("--rebuild-shifts", action="store_true",
+                        help="Ignore the shift-log cursor and re-walk the full "
+                             "lookback window (repairs a bad cache)")
+    args = parser.parse_args()
+
     print(f"[{datetime.now().isoformat()}] Horizon bot starting")
     t0 = time.time()
     items_found = 0
@@ -988,38 +1274,50 @@ def main():
         past_entries = load_lane("past")
 
         radar_items = load_recent_radar(days=7)
-        thoughts = load_recent_markdown(THOUGHTS_DIR, days=7)
-        news = load_recent_markdown(NEWS_DIR, days=7)
+        thoughts = load_recent_markdown("thoughts", days=7)
+        news = load_recent_markdown("news", days=7)
         items_found = len(radar_items) + len(thoughts) + len(news)
 
         print(f"[horizon_bot] Evidence: {len(radar_items)} radar, "
               f"{len(thoughts)} thoughts, {len(news)} news")
 
-        # Job 1 — Now proposals (LLM, grounded)
-        now_proposals: list[dict] = []
-        usage = None
-        if items_found > 0:
-            pending_proposals = load_pending_proposals()
-            print(f"[horizon_bot] Pending PR proposals to dedup against: "
-                  f"{len(pending_proposals)}")
-            now_proposals, usage = propose_now_entries(
-                radar_items, thoughts, news, now_entries,
-                pending_proposals=pending_proposals,
-            )
-            if usage is not None:
-                input_tokens = usage.input_tokens
-                output_tokens = usage.output_tokens
-                cost = (input_tokens * INPUT_COST_PER_MTOK
-                        + output_tokens * OUTPUT_COST_PER_MTOK) / 1_000_000
+        # Job 1 (Claude) runs in a worker while this thread does the
+        # deterministic jobs and the git-log walks, none of which read its
+        # result. Nothing is written until both sides are done.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            now_job = pool.submit(_timed, run_now_job, radar_items, thoughts,
+                                  news, now_entries, items_found)
+            t_local = time.time()
+
+            # Job 2 — Next shift flags (deterministic)
+            next_flags = flag_next_shifts(next_entries, radar_items, thoughts)
+            print(f"[horizon_bot] Next flags: {len(next_flags)}")
+
+            # Job 3 — Past candidates (deterministic)
+            past_candidates = score_past_candidates(past_entries)
+            print(f"[horizon_bot] Past candidates: {len(past_candidates)}")
+
+            # Both radar readers above share one memoized archive; persist its
+            # manifest so the next run only re-reads day-files that changed.
+            archive = radar_archive.get()
+            archive.save()
+            print(f"[horizon_bot] Radar archive: {archive.stats}")
+
+            # Shifts log. Second pass enriches scenario-lane entries with
+            # year/band delta arrays so /horizon/five can narrate drift.
+            shifts = build_shifts_log(full_rebuild=args.rebuild_shifts)
+            shifts, scenario_changes_parsed = enrich_scenario_shifts(shifts)
+            local_s = time.time() - t_local
+
+            (now_proposals, usage), model_s = now_job.result()
         print(f"[horizon_bot] Now proposals: {len(now_proposals)}")
-
-        # Job 2 — Next shift flags (deterministic)
-        next_flags = flag_next_shifts(next_entries, radar_items, thoughts)
-        print(f"[horizon_bot] Next flags: {len(next_flags)}")
-
-        # Job 3 — Past candidates (deterministic)
-        past_candidates = score_past_candidates(past_entries)
-        print(f"[horizon_bot] Past candidates: {len(past_candidates)}")
+        print(f"[horizon_bot] Overlap: model {model_s:.1f}s, deterministic "
+              f"{local_s:.1f}s, saved {min(model_s, local_s):.1f}s")
+        if usage is not None:
+            input_tokens = usage.input_tokens
+            output_tokens = usage.output_tokens
+            cost = (input_tokens * INPUT_COST_PER_MTOK
+                    + output_tokens * OUTPUT_COST_PER_MTOK) / 1_000_000
 
         # Staging (backup, always written)
         write_staging(now_proposals, next_flags, past_candidates)
@@ -1028,10 +1326,7 @@ def main():
         # Proposal PR (Now entries only for now; Next/Past still staging-only)
         pr_url = create_proposal_pr(now_proposals)
 
-        # Shifts.json (committed if changed). Second pass enriches scenario-lane
-        # entries with year/band delta arrays so /horizon/five can narrate drift.
-        shifts = build_shifts_log()
-        shifts, scenario_changes_parsed = enrich_scenario_shifts(shifts)
+        # Shifts.json (committed if changed)
         shifts_changed = write_shifts_log(shifts)
         print(f"[horizon_bot] Shifts: {len(shifts)} entries, "
               f"{'changed' if shifts_changed else 'unchanged'}, "
@@ -0,0 +1,211 @@
+"""
+One pooled HTTP client per process for every bot.
+
+The bots used module-level httpx.get/post/head for everything: OpenRouter,
+Algolia, GitHub, Discord and Healthchecks. Each of those calls builds a
+throwaway connection pool, so every request paid for DNS, TCP and TLS again.
+That includes the eight Algolia searches radar_bot makes back to back
+against the same host. Now they share one client:
+
+    resp = http_pool.get("https://hn.algolia.com/api/v1/search", purpose="api",
+                         params={...})
+
+What the shared client does:
+
+  * keeps connections alive (LIMITS), so repeat hosts reuse a warm socket;
+  * speaks HTTP/2 when the optional `h2` package is installed (pip install
+    'httpx[http2]'); set SOFTCAT_HTTP2=0 to force HTTP/1.1;
+  * caches DNS answers for DNS_TTL_S. The resolver cache also backs the
+    async clients from async_client() (tool_of_the_week's link checker);
+  * gives each kind of call its own timeout (TIMEOUTS), replacing the
+    per-call-site timeout=10/15/30 literals.
+
+Reuse is counted: take_stats() returns requests, new connections, reused
+connections and DNS hits/misses since the last call. pipeline_log.log_run
+attaches it to each run entry as "http", so the dashboard data shows
+whether pooling is paying off.
+"""
+
+import os
+import socket
+import threading
+import time
+
+import httpcore
+import httpx
+
+TIMEOUTS = {
+    "api": httpx.Timeout(15, connect=5),       # JSON APIs: GitHub, Algolia
+    "bulk": httpx.Timeout(30, connect=5),      # large payloads: OpenRouter catalogue
+    "feed": httpx.Timeout(20, connect=5),      # RSS/Atom
+    "webhook": httpx.Timeout(15, connect=5),   # Discord
+    "ping": httpx.Timeout(10, connect=5),      # Healthchecks
+    "verify": httpx.Timeout(15, connect=5),    # tool link checks
+}
+LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16,
+                      keepalive_expiry=30)
+DNS_TTL_S = 300
+
+_lock = threading.Lock()
+_dns: dict[tuple[str, int], tuple[float, list[str]]] = {}
+_stats = {"requests": 0, "connections": 0, "dns_hits": 0, "dns_misses": 0}
+_client: httpx.Client | None = None
+
+
+def _count(key: str, n: int = 1) -> None:
+    with _lock:
+        _stats[key] += n
+
+
+def http2_enabled() -> bool:
+    if os.environ.get("SOFTCAT_HTTP2", "1") == "0":
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def timeout(purpose: str) -> httpx.Timeout:
+    return TIMEOUTS.get(purpose, TIMEOUTS["api"])
+
+
+# --------------------------------------------------------------------------- #
+# DNS cache                                                                   #
+# --------------------------------------------------------------------------- #
+
+def resolve(host: str, port: int) -> list[str]:
+    """Addresses for host, cached for DNS_TTL_S. IP literals pass through.
+    Raises socket.gaierror like getaddrinfo."""
+    try:
+        socket.inet_pton(socket.AF_INET6 if ":" in host else socket.AF_INET, host)
+        return [host]
+    except OSError:
+        pass
+    key = (host, port)
+    now = time.monotonic()
+    with _lock:
+        cached = _dns.get(key)
+        if cached and cached[0] > now:
+            _stats["dns_hits"] += 1
+            return cached[1]
+        _stats["dns_misses"] += 1
+    infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    addresses = list(dict.fromkeys(info[4][0] for info in infos))
+    with _lock:
+        _dns[key] = (now + DNS_TTL_S, addresses)
+    return addresses
+
+
+def _connect_each(connect, host: str, addresses: list[str], *args, **kwargs):
+    """Try each address in turn, as socket.create_connection does."""
+    error: Exception | None = None
+    for address in addresses:
+        try:
+            stream = connect(address, *args, **kwargs)
+        except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+            error = e
+            continue
+        _count("connections")
+        return stream
+    raise error or httpcore.ConnectError(f"no addresses for {host}")
+
+
+class _CachingBackend(httpcore.SyncBackend):
+    def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        try:
+            addresses = resolve(host, port)
+        except socket.gaierror as e:
+            raise httpcore.ConnectError(str(e)) from e
+        return _connect_each(super().connect_tcp, host, addresses, port, timeout=timeout,
+                             local_address=local_address, socket_options=socket_options)
+
+
+class _AsyncCachingBackend(httpcore.AnyIOBackend):
+    async def connect_tcp(self, host, port, timeout=None, local_address=None,
+                          socket_options=None):
+        import anyio.to_thread
+        try:
+            addresses = await anyio.to_thread.run_sync(resolve, host, port)
+        except socket.gaierror as e:
+            raise httpcore.ConnectError(str(e)) from e
+        error: Exception | None = None
+        for address in addresses:
+            try:
+                stream = await super().connect_tcp(address, port, timeout=timeout,
+                                                   local_address=local_address,
+                                                   socket_options=socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+                continue
+            _count("connections")
+            return stream
+        raise error or httpcore.ConnectError(f"no addresses for {host}")
+
+
+def _install_backend(transport, backend) -> None:
+    # httpx does not expose httpcore's network_backend; set it on the pool
+    # before the first request. Without the attribute (a future httpx), the
+    # transport simply resolves without the cache.
+    pool = getattr(transport, "_pool", None)
+    if pool is not None and hasattr(pool, "_network_backend"):
+        pool._network_backend = backend
+
+
+# --------------------------------------------------------------------------- #
+# Clients                                                                     #
+# --------------------------------------------------------------------------- #
+
+def client() -> httpx.Client:
+    """The shared client. Never close it; it lives as long as the process."""
+    global _client
+    with _lock:
+        if _client is None:
+            transport = httpx.HTTPTransport(http2=http2_enabled(), limits=LIMITS)
+            _install_backend(transport, _CachingBackend())
+            _client = httpx.Client(transport=transport, timeout=TIMEOUTS["api"],
+                                   event_hooks={"request": [lambda r: _count("requests")]})
+        return _client
+
+
+def request(method: str, url: str, purpose: str = "api", **kwargs) -> httpx.Response:
+    kwargs.setdefault("timeout", timeout(purpose))
+    return client().request(method, url, **kwargs)
+
+
+def get(url: str, purpose: str = "api", **kwargs) -> httpx.Response:
+    return request("GET", url, purpose, **kwargs)
+
+
+def post(url: str, purpose: str = "api", **kwargs) -> httpx.Response:
+    return request("POST", url, purpose, **kwargs)
+
+
+def async_client(purpose: str = "api", limits: httpx.Limits | None = None,
+                 transport: httpx.AsyncBaseTransport | None = None,
+                 **kwargs) -> httpx.AsyncClient:
+    """A new AsyncClient (one per event loop) sharing the DNS cache and the
+    reuse counters. The caller owns it and closes it."""
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(http2=http2_enabled(), limits=limits or LIMITS)
+        _install_backend(transport, _AsyncCachingBackend())
+
+    async def on_request(request):
+        _count("requests")
+
+    kwargs.setdefault("timeout", timeout(purpose))
+    return httpx.AsyncClient(transport=transport, event_hooks={"request": [on_request]},
+                             **kwargs)
+
+
+def take_stats() -> dict:
+    """Counters since the last call (then reset), with reused connections
+    derived as requests that did not open one."""
+    with _lock:
+        out = dict(_stats)
+        for key in _stats:
+            _stats[key] = 0
+    out["reused"] = max(0, out["requests"] - out["connections"])
+    out["http2"] = http2_enabled()
+    return out
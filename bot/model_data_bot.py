@@ -10,6 +10,10 @@ Auto-updated fields: contextK, inputPrice, outputPrice, multimodal
 Manual fields (preserved): family, reasoning, coding, reasoning_score,
     speed, description, strengths, openSource, released
 
+Every accepted and suspect change is also appended to the columnar history
+in src/data/models-history.json (see model_history.py), which emits
+src/data/models-trends.json for the lab components.
+
 Trust model (issue #96):
   - Every change is gated by MAX_AUTO_DELTA. Anything larger is rejected
     from the auto-commit and written to a staging file for Valori review.
@@ -31,14 +35,15 @@ import time as _time
 from datetime import datetime, date
 from pathlib import Path
 
-import httpx
-from dotenv import load_dotenv
-
 from pipeline_log import log_run
 import git_safe
+import github_client
+import http_pool
+import model_history
+import outbox
+import state_store
 
 BOT_DIR = Path(__file__).parent
-load_dotenv(BOT_DIR / ".env")
 REPO_DIR = BOT_DIR.parent
 MODELS_FILE = REPO_DIR / "src" / "data" / "models.json"
 STAGING_DIR = Path.home() / ".softcat-bot-staging"
@@ -139,12 +144,12 @@ def load_models():
 
 def save_models(models):
     models.sort(key=lambda m: (m.get("provider", ""), m.get("name", "")))
-    MODELS_FILE.write_text(json.dumps(models, indent=2) + "\n")
+    state_store.write(MODELS_FILE, models)
 
 
 def fetch_openrouter():
     """Fetch model list from OpenRouter (public, no auth required)."""
-    resp = httpx.get("https://openrouter.ai/api/v1/models", timeout=30)
+    resp = http_pool.get("https://openrouter.ai/api/v1/models", purpose="bulk")
     resp.raise_for_status()
     data = resp.json()
     return {m["id"]: m for m in data.get("data", [])}
@@ -248,29 +253,33 @@ def update_models(existing, api_models):
     return updated, changed, suspects
 
 
+BOT_DATA_FILES = [
+    "src/data/models.json",
+    "src/data/models-history.json",
+    "src/data/models-trends.json",
+]
+
+
 def reset_drifted_baseline():
-    """Discard any uncommitted drift in models.json before we start so a
-    previously failed commit does not become the new silent baseline."""
+    """Discard any uncommitted drift in models.json (and its history files)
+    before we start so a previously failed commit does not become the new
+    silent baseline. The history is reset with it: the reset models.json
+    re-detects the same changes, which are then recorded again."""
     os.chdir(REPO_DIR)
-    result = subprocess.run(
-        ["git", "diff", "--quiet", "HEAD", "--", "src/data/models.json"],
-    )
-    if result.returncode != 0:
-        print("[model_bot] models.json drifted from HEAD; resetting before run.")
-        subprocess.run(
-            ["git", "checkout", "HEAD", "--", "src/data/models.json"],
-            check=True,
-        )
+    for path in BOT_DATA_FILES:
+        result = subprocess.run(["git", "diff", "--quiet", "HEAD", "--", path])
+        if result.returncode != 0:
+            print(f"[model_bot] {path} drifted from HEAD; resetting before run.")
+            subprocess.run(["git", "checkout", "HEAD", "--", path], check=True)
 
 
 def write_suspects(suspects):
-    STAGING_DIR.mkdir(parents=True, exist_ok=True)
     payload = {
         "generated_at": datetime.now().astimezone().isoformat(),
         "threshold": MAX_AUTO_DELTA,
         "suspects": suspects,
     }
-    SUSPECTS_FILE.write_text(json.dumps(payload, indent=2) + "\n")
+    state_store.write(SUSPECTS_FILE, payload)
     print(f"[model_bot] Wrote {len(suspects)} suspect(s) to {SUSPECTS_FILE}")
 
 
@@ -284,12 +293,8 @@ def post_suspects_to_discord(suspects):
         lines.append(f"- {s['name']}.{s['field']}: "
                      f"{s['current']} -> {s['proposed']}")
     lines.append(f"Review: `{SUSPECTS_FILE}`")
-    try:
-        httpx.post(webhook, json={"content": "\n".join(lines),
-                                   "username": "SOFT CAT Model Data"},
-                   timeout=15)
-    except Exception as e:
-        print(f"[model_bot] Discord post failed: {e}")
+    outbox.discord(webhook, "\n".join(lines), username="SOFT CAT Model Data",
+                   source="model_bot")
 
 
 def git_commit_and_push():
@@ -298,7 +303,7 @@ def git_commit_and_push():
     today = date.today().isoformat()
     msg = f"bot: update model data ({today})"
     git_safe.safe_commit_and_push(
-        ["src/data/models.json", "src/data/pipeline/runs.json"],
+        BOT_DATA_FILES + ["src/data/pipeline/runs.json"],
         msg,
     )
 
@@ -400,13 +405,10 @@ def post_roster_pr_to_discord(pr_url: str, entries: list[dict]):
     if not webhook:
         return
     names = ", ".join(e["name"] for e in entries)
-    try:
-        httpx.post(webhook, json={
-            "content": f"**Model bot:** roster proposal PR for {names}\n"
-                       f"Edit the placeholder scores before merging: {pr_url}",
-            "username": "SOFT CAT Model Data"}, timeout=15)
-    except Exception as e:
-        print(f"[model_bot] Discord post failed: {e}")
+    outbox.discord(webhook,
+                   f"**Model bot:** roster proposal PR for {names}\n"
+                   f"Edit the placeholder scores before merging: {pr_url}",
+                   username="SOFT CAT Model Data", source="model_bot")
 
 
 def propose_roster_pr(entries: list[dict]) -> str | None:
@@ -414,25 +416,19 @@ def propose_roster_pr(entries: list[dict]) -> str | None:
 
     D11/E6.5: new proposals land as commits ON TOP of the existing open PR
     branch (preserves human edits + review discussion). Never checkout -B
-    over a remote branch, never force-push. gh network calls run OUTSIDE
+    over a remote branch, never force-push. GitHub API calls run OUTSIDE
     the git lock (E6.6). The tree is ALWAYS checked back to main (E6.4).
     """
     if not entries:
         return None
     os.chdir(REPO_DIR)
 
-    # gh queries outside the lock
-    existing_pr = None
+    # GitHub queries outside the lock
     try:
-        result = subprocess.run(
-            ["gh", "pr", "list", "--head", PROPOSAL_BRANCH, "--state", "open",
-             "--json", "number,url", "--limit", "1"],
-            capture_output=True, text=True, check=True)
-        prs = json.loads(result.stdout)
-        if prs:
-            existing_pr = prs[0]
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
-        pass
+        existing_pr = github_client.get().find_open_pull(PROPOSAL_BRANCH)
+    except github_client.GitHubError as e:
+        print(f"[model_bot] PR lookup failed: {e}")
+        existing_pr = None
 
     pushed = False
     added = []
@@ -461,7 +457,7 @@ def propose_roster_pr(entries: list[dict]) -> str | None:
 
             current.extend(added)
             current.sort(key=lambda m: (m.get("provider", ""), m.get("name", "")))
-            MODELS_FILE.write_text(json.dumps(current, indent=2) + "\n")
+            state_store.write(MODELS_FILE, current)
             names = ", ".join(e["name"] for e in added)
             subprocess.run(["git", "add", str(MODELS_FILE)], check=True, capture_output=True)
             subprocess.run(["git", "commit", "-m",
@@ -477,11 +473,14 @@ def propose_roster_pr(entries: list[dict]) -> str | None:
     if not pushed:
         return existing_pr["url"] if existing_pr else None
 
-    # gh mutations outside the lock (E6.6)
+    # GitHub mutations outside the lock (E6.6)
+    gh = github_client.get()
     if existing_pr:
         body = "New roster candidate(s) appended: " + ", ".join(e["name"] for e in added)
-        subprocess.run(["gh", "pr", "comment", str(existing_pr["number"]),
-                        "--body", body], capture_output=True)
+        try:
+            gh.comment(existing_pr["number"], body)
+        except github_client.GitHubError as e:
+            print(f"[model_bot] PR comment failed: {e}")
         pr_url = existing_pr["url"]
     else:
         lines = [f"- **{e['name']}** (`{e['id']}`) - radar: {e['radarRef']}" for e in added]
@@ -489,11 +488,8 @@ def propose_roster_pr(entries: list[dict]) -> str | None:
                 "\n\nScores are PLACEHOLDER - assign editorial scores during review, "
                 "then merge. Trigger: model on OpenRouter AND featured on Radar AND "
                 "not in models.json.\n\n---\nGenerated by `model_data_bot.py` Job 2.")
-        result = subprocess.run(
-            ["gh", "pr", "create", "--base", "main", "--head", PROPOSAL_BRANCH,
-             "--title", f"Model roster: {', '.join(e['name'] for e in added)}",
-             "--body", body], capture_output=True, text=True, check=True)
-        pr_url = result.stdout.strip().splitlines()[-1]
+        pr_url = gh.create_pull(f"Model roster: {', '.join(e['name'] for e in added)}",
+                                body, head=PROPOSAL_BRANCH, base="main")["url"]
 
     post_roster_pr_to_discord(pr_url, added)
     return pr_url
@@ -523,14 +519,12 @@ def ping_healthcheck(status="success"):
     url = os.environ.get("HC_PING_MODEL_DATA")
     if not url:
         return
-    try:
-        suffix = "/fail" if status == "fail" else ""
-        httpx.get(f"{url}{suffix}", timeout=10)
-    except Exception as e:
-        print(f"Healthcheck ping failed: {e}")
+    outbox.ping(url, status, source="model_bot")
 
 
 def main():
+    from dotenv import load_dotenv
+    load_dotenv(BOT_DIR / ".env")
     print(f"[{datetime.now().isoformat()}] Model Data bot starting")
     t0 = _time.time()
 
@@ -563,6 +557,10 @@ def main():
             write_suspects(suspects)
             post_suspects_to_discord(suspects)
 
+        recorded = model_history.record(existing, updated, suspects)
+        if recorded:
+            print(f"Recorded {recorded} change(s) in {model_history.HISTORY_FILE.name}")
+
         if changed:
             print(f"Saving {len(updated)} models...")
             save_models(updated)
@@ -576,6 +574,14 @@ def main():
 
             print("Committing and pushing...")
             git_commit_and_push()
+        elif recorded:
+            # Suspect-only run: nothing lands in models.json, but the history
+            # moved and must not sit uncommitted in the shared tree.
+            print("No price/spec changes landed; committing history only.")
+            log_run("model_bot", status="success", duration_s=_time.time() - t0,
+                    items_found=len(api_models), items_published=0,
+                    output_files=["src/data/models-history.json"], job="prices")
+            git_commit_and_push()
         else:
             print("No price/spec changes detected.")
             log_run("model_bot", status="success", duration_s=_time.time() - t0,
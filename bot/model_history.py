@@ -0,0 +1,187 @@
+"""
+Columnar price/spec history for src/data/models.json.
+
+model_data_bot overwrites contextK, inputPrice, outputPrice and multimodal in
+place, so before this module the only history was `git log -p models.json`.
+Every accepted change (and every suspect change routed to human review) is now
+appended here, one column set per (model, field):
+
+    {"version": 1,
+     "series": {"anthropic/claude-sonnet-4": {
+         "inputPrice": {"t": ["2026-10-01", "2026-10-19"],
+                        "v": [3, 3.5],
+                        "k": ["b", "a"]}}}}
+
+`t` is sorted ascending, so range queries are a bisect. `k` marks the point:
+"b" baseline (the value before the first recorded change), "a" accepted
+(landed in models.json), "s" suspect (rejected by MAX_AUTO_DELTA, not landed).
+
+The store is machine-only and written compact. From it we emit
+src/data/models-trends.json, a small per-model summary the lab components can
+import at build time without walking git.
+"""
+
+import json
+from bisect import bisect_left, bisect_right
+from datetime import date
+from pathlib import Path
+
+import state_store
+
+REPO_DIR = Path(__file__).parent.parent
+HISTORY_FILE = REPO_DIR / "src" / "data" / "models-history.json"
+TRENDS_FILE = REPO_DIR / "src" / "data" / "models-trends.json"
+
+TRACKED_FIELDS = ("contextK", "inputPrice", "outputPrice", "multimodal")
+TREND_POINTS = 12  # accepted points kept per series in the trend file
+
+BASELINE, ACCEPTED, SUSPECT = "b", "a", "s"
+
+
+def load_store() -> dict:
+    """Read the history store, starting fresh if missing or corrupt."""
+    if not HISTORY_FILE.exists():
+        return {"version": 1, "series": {}}
+    try:
+        data = json.loads(HISTORY_FILE.read_text())
+    except (json.JSONDecodeError, ValueError):
+        print(f"[model_history] WARNING: {HISTORY_FILE} was corrupt, starting fresh")
+        return {"version": 1, "series": {}}
+    if not isinstance(data, dict) or not isinstance(data.get("series"), dict):
+        return {"version": 1, "series": {}}
+    return data
+
+
+def save_store(store: dict) -> None:
+    state_store.write(HISTORY_FILE, store, compact=True, sort_keys=True)
+
+
+def _series(store: dict, model_id: str, field: str) -> dict:
+    return (store["series"].setdefault(model_id, {})
+            .setdefault(field, {"t": [], "v": [], "k": []}))
+
+
+def _last_of_kind(col: dict, kinds: tuple[str, ...]):
+    for v, k in zip(reversed(col["v"]), reversed(col["k"])):
+        if k in kinds:
+            return v
+    return None
+
+
+def append_point(store: dict, model_id: str, field: str, when: str,
+                 old, new, kind: str) -> bool:
+    """Append one change to the (model, field) column set.
+
+    Seeds a baseline point with `old` the first time a series is touched so
+    every trend has a starting value. Consecutive duplicates of the same kind
+    are skipped: a suspect that OpenRouter keeps reporting run after run is
+    recorded once, not daily. Returns True if anything was appended.
+    """
+    col = _series(store, model_id, field)
+    if not col["t"]:
+        _insert(col, when, old, BASELINE)
+    if kind == SUSPECT:
+        if col["k"][-1] == SUSPECT and col["v"][-1] == new:
+            return False
+    elif _last_of_kind(col, (BASELINE, ACCEPTED)) == new:
+        return False
+    _insert(col, when, new, kind)
+    return True
+
+
+def _insert(col: dict, when: str, value, kind: str) -> None:
+    # Appends are almost always at the tail; bisect keeps `t` sorted even if a
+    # backfill lands out of order.
+    i = bisect_right(col["t"], when)
+    col["t"].insert(i, when)
+    col["v"].insert(i, value)
+    col["k"].insert(i, kind)
+
+
+def query(store: dict, model_id: str, field: str, start: str = "",
+          end: str = "", kinds: tuple[str, ...] = (BASELINE, ACCEPTED)) -> list[tuple[str, object]]:
+    """(date, value) points for one series with start <= date <= end.
+
+    Dates are ISO strings, so lexical order is chronological and both bounds
+    are located by bisect rather than a scan."""
+    col = (store.get("series", {}).get(model_id) or {}).get(field)
+    if not col:
+        return []
+    lo = bisect_left(col["t"], start) if start else 0
+    hi = bisect_right(col["t"], end) if end else len(col["t"])
+    return [(col["t"][i], col["v"][i]) for i in range(lo, hi) if col["k"][i] in kinds]
+
+
+def diff_changes(existing: list[dict], updated: list[dict],
+                 suspects: list[dict]) -> list[dict]:
+    """Turn one update_models() result into change records.
+
+    Accepted changes are recovered by diffing the before/after rosters, so
+    update_models() itself stays a pure merge with its pinned contract."""
+    before = {m.get("id"): m for m in existing}
+    changes = []
+    for model in updated:
+        old_model = before.get(model.get("id"))
+        if old_model is None:
+            continue
+        for field in TRACKED_FIELDS:
+            old, new = old_model.get(field), model.get(field)
+            if old != new and new is not None:
+                changes.append({"id": model["id"], "field": field,
+                                "old": old, "new": new, "kind": ACCEPTED})
+    for s in suspects:
+        changes.append({"id": s["id"], "field": s["field"],
+                        "old": s["current"], "new": s["proposed"], "kind": SUSPECT})
+    return changes
+
+
+def build_trends(store: dict) -> dict:
+    """Per-model summary of accepted history for the site.
+
+    Numeric fields carry first/last and percent change across the recorded
+    window; every field carries its last TREND_POINTS accepted points."""
+    trends = {}
+    for model_id, fields in sorted(store.get("series", {}).items()):
+        out = {}
+        for field, col in sorted(fields.items()):
+            points = [[t, v] for t, v, k in zip(col["t"], col["v"], col["k"])
+                      if k in (BASELINE, ACCEPTED)]
+            if len(points) < 2:
+                continue  # baseline only: nothing has landed yet
+            first, last = points[0][1], points[-1][1]
+            summary = {"since": points[0][0], "updated": points[-1][0],
+                       "changes": len(points) - 1, "points": points[-TREND_POINTS:]}
+            if isinstance(first, (int, float)) and isinstance(last, (int, float)) \
+                    and not isinstance(first, bool) and first:
+                summary["change_pct"] = round((last - first) / abs(first) * 100, 1)
+            out[field] = summary
+        if out:
+            trends[model_id] = out
+    return trends
+
+
+def write_trends(store: dict) -> bool:
+    """Write models-trends.json only if it changed. Returns True if written."""
+    trends = build_trends(store)
+    text = json.dumps(trends, indent=2) + "\n"
+    if TRENDS_FILE.exists() and TRENDS_FILE.read_text() == text:
+        return False
+    TRENDS_FILE.write_text(text)
+    return True
+
+
+def record(existing: list[dict], updated: list[dict], suspects: list[dict],
+           when: str | None = None) -> int:
+    """Append this run's accepted + suspect changes and refresh the trend file.
+
+    Returns the number of points appended (0 means neither file moved)."""
+    when = when or date.today().isoformat()
+    store = load_store()
+    appended = 0
+    for c in diff_changes(existing, updated, suspects):
+        if append_point(store, c["id"], c["field"], when, c["old"], c["new"], c["kind"]):
+            appended += 1
+    if appended:
+        save_store(store)
+        write_trends(store)
+    return appended
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Persistent notification outbox for Discord posts and Healthchecks pings.
+
+Bots used to post to Discord (timeout=15) and ping Healthchecks (timeout=10)
+inline at the end of a run, so a slow webhook went straight onto the run's
+duration, and a failed post was printed and lost. Now they enqueue:
+
+    outbox.discord(webhook, content, username="SOFT CAT Radar", source="radar_bot")
+    outbox.ping(url, status="fail", source="radar_bot")
+
+enqueue() appends to bot/.cache/outbox.json (under an flock on
+outbox.json.lock, rewritten atomically via state_store) and starts a
+detached `outbox.py drain` process, so the bot returns at once. The drainer
+(one at a time, serialized on outbox-drain.lock):
+
+  * batches: queued Discord posts for the same webhook and username are
+    joined into one message up to Discord's 2,000-character limit, and only
+    the newest pending ping per check URL is sent (older ones are marked
+    superseded: Healthchecks only cares about the latest state);
+  * backs off: a failed delivery is retried after 1, 2, 4 ... minutes,
+    capped at BACKOFF_MAX_S, honouring Discord's 429 retry_after; 4xx
+    other than 408/429 is permanent. After MAX_ATTEMPTS the message is
+    marked dead and kept for inspection;
+  * lingers up to LINGER_S while retries are due, then exits. Anything
+    still pending is picked up by the next drain, i.e. the next bot run.
+
+Every message records enqueued_at, attempts, last_error and delivered_at.
+Settled messages are pruned after KEEP_DAYS. `python3 bot/outbox.py` (no
+arguments) prints the queue.
+
+The service units use KillMode=process so systemd lets the drainer finish
+after the bot's oneshot process has exited.
+"""
+
+import fcntl
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+
+import http_pool
+import state_store
+
+BOT_DIR = Path(__file__).resolve().parent
+OUTBOX_FILE = BOT_DIR / ".cache" / "outbox.json"
+DRAIN_LOCK = BOT_DIR / ".cache" / "outbox-drain.lock"
+
+DISCORD_LIMIT = 2000
+MAX_ATTEMPTS = 8
+BACKOFF_BASE_S = 60
+BACKOFF_MAX_S = 6 * 3600
+LINGER_S = 15 * 60
+KEEP_DAYS = 7
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _read_messages() -> list[dict]:
+    """The queue on disk. A corrupt file is moved aside, not overwritten:
+    its pending and failed posts are still there to recover by hand."""
+    try:
+        messages = json.loads(OUTBOX_FILE.read_bytes())
+    except FileNotFoundError:
+        return []
+    except ValueError:
+        messages = None
+    if isinstance(messages, list):
+        return messages
+    aside = OUTBOX_FILE.with_name(f"{OUTBOX_FILE.name}.corrupt-{_now():%Y%m%dT%H%M%SZ}")
+    os.replace(OUTBOX_FILE, aside)
+    print(f"[outbox] ERROR: {OUTBOX_FILE} was corrupt; moved to {aside.name}. Its queued "
+          f"notifications were NOT sent: recover them from there")
+    return []
+
+
+def _update(fn):
+    """Run fn(messages) -> result under the outbox flock; the list is
+    written back afterwards (fn mutates it in place), atomically, so a
+    crash mid-write leaves the previous queue intact."""
+    OUTBOX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(OUTBOX_FILE.with_name(OUTBOX_FILE.name + ".lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        messages = _read_messages()
+        result = fn(messages)
+        state_store.write_bytes(OUTBOX_FILE, (json.dumps(messages, indent=1) + "\n").encode())
+    return result
+
+
+def load() -> list[dict]:
+    return _update(lambda messages: list(messages))
+
+
+# --------------------------------------------------------------------------- #
+# Enqueue                                                                     #
+# --------------------------------------------------------------------------- #
+
+def enqueue(kind: str, url: str, payload: dict | None = None, source: str = "",
+            start_drain: bool = True) -> str:
+    """Queue one notification and (by default) kick a background drain."""
+    msg = {"id": uuid.uuid4().hex[:12], "kind": kind, "url": url, "payload": payload,
+           "source": source, "status": "pending", "enqueued_at": _now().isoformat(),
+           "attempts": 0, "next_attempt_at": "", "last_error": "", "delivered_at": ""}
+    _update(lambda messages: messages.append(msg))
+    if start_drain:
+        kick()
+    return msg["id"]
+
+
+def discord(webhook: str, content: str, username: str, source: str = "") -> str:
+    return enqueue("discord", webhook, {"content": content, "username": username}, source)
+
+
+def ping(url: str, status: str = "success", source: str = "") -> str:
+    suffix = "/fail" if status == "fail" else ""
+    return enqueue("ping", f"{url}{suffix}", None, source)
+
+
+def kick() -> None:
+    """Start a detached drainer. Never raises: the message is already safe
+    on disk and the next kick will deliver it."""
+    if os.environ.get("SOFTCAT_OUTBOX_NO_KICK"):
+        return
+    log = BOT_DIR / ".cache" / "outbox.log"
+    try:
+        with open(log, "a") as out:
+            subprocess.Popen([sys.executable, str(Path(__file__).resolve()), "drain"],
+                             stdin=subprocess.DEVNULL, stdout=out, stderr=out,
+                             start_new_session=True, cwd=BOT_DIR)
+    except OSError as e:
+        print(f"[outbox] Could not start drainer: {e}")
+
+
+# --------------------------------------------------------------------------- #
+# Drain                                                                       #
+# --------------------------------------------------------------------------- #
+
+def _batches(due: list[dict]) -> list[list[dict]]:
+    """Group due messages into deliveries (see module docstring)."""
+    out: list[list[dict]] = []
+    open_discord: dict[tuple[str, str], list[dict]] = {}
+    for msg in due:
+        if msg["kind"] != "discord":
+            out.append([msg])
+            continue
+        key = (msg["url"], msg["payload"].get("username", ""))
+        batch = open_discord.get(key)
+        joined = sum(len(m["payload"]["content"]) + 2 for m in batch or [])
+        if batch and joined + len(msg["payload"]["content"]) <= DISCORD_LIMIT:
+            batch.append(msg)
+        else:
+            batch = open_discord[key] = [msg]
+            out.append(batch)
+    return out
+
+
+def _supersede(messages: list[dict], now: datetime) -> None:
+    newest: dict[str, dict] = {}
+    for msg in messages:
+        if msg["kind"] == "ping" and msg["status"] == "pending":
+            check = msg["url"].removesuffix("/fail")
+            if check in newest:
+                newest[check]["status"] = "superseded"
+                newest[check]["delivered_at"] = now.isoformat()
+            newest[check] = msg
+
+
+def _deliver(client: httpx.Client, batch: list[dict]) -> tuple[bool, str, float | None]:
+    """(ok, error, retry_after_s). Permanent failures return retry_after -1."""
+    first = batch[0]
+    try:
+        if first["kind"] == "discord":
+            content = "\n\n".join(m["payload"]["content"] for m in batch)
+            resp = client.post(first["url"], json={**first["payload"], "content": content},
+                               timeout=http_pool.timeout("webhook"))
+        else:
+            resp = client.get(first["url"], timeout=http_pool.timeout("ping"))
+    except httpx.HTTPError as e:
+        return False, f"{type(e).__name__}: {e}", None
+    if resp.is_success:
+        return True, "", None
+    error = f"HTTP {resp.status_code}"
+    if resp.status_code == 429:
+        try:
+            return False, error, float(resp.json().get("retry_after", 0)) or None
+        except (ValueError, AttributeError):
+            return False, error, None
+    if 400 <= resp.status_code < 500 and resp.status_code != 408:
+        return False, error, -1
+    return False, error, None
+
+
+def drain(client: httpx.Client | None = None, now: datetime | None = None) -> dict:
+    """One pass: deliver everything due. Returns counts by outcome."""
+    now = now or _now()
+    stamp = now.isoformat()
+
+    def take_due(messages):
+        _supersede(messages, now)
+        return [dict(m) for m in messages if m["status"] == "pending"
+                and (not m["next_attempt_at"] or m["next_attempt_at"] <= stamp)]
+
+    due = _update(take_due)
+    stats = {"delivered": 0, "retry": 0, "dead": 0, "requests": 0}
+    if not due:
+        return stats
+
+    outcomes: dict[str, tuple[bool, str, float | None]] = {}
+    client = client or http_pool.client()
+    for batch in _batches(due):
+        result = _deliver(client, batch)
+        stats["requests"] += 1
+        for msg in batch:
+            outcomes[msg["id"]] = result
+
+    def settle(messages):
+        done = _now().isoformat()
+        for msg in messages:
+            if msg["id"] not in outcomes:
+                continue
+            ok, error, retry_after = outcomes[msg["id"]]
+            msg["attempts"] += 1
+            if ok:
+                msg.update(status="delivered", delivered_at=done, last_error="")
+                stats["delivered"] += 1
+                continue
+            msg["last_error"] = error
+            if retry_after == -1 or msg["attempts"] >= MAX_ATTEMPTS:
+                msg["status"] = "dead"
+                stats["dead"] += 1
+                continue
+            delay = retry_after or min(BACKOFF_MAX_S, BACKOFF_BASE_S * 2 ** (msg["attempts"] - 1))
+            msg["next_attempt_at"] = (now + timedelta(seconds=delay)).isoformat()
+            stats["retry"] += 1
+        cutoff = (now - timedelta(days=KEEP_DAYS)).isoformat()
+        messages[:] = [m for m in messages if m["status"] == "pending"
+                       or (m["delivered_at"] or m["enqueued_at"]) >= cutoff]
+
+    _update(settle)
+    return stats
+
+
+def _next_due() -> datetime | None:
+    pending = [m["next_attempt_at"] for m in load() if m["status"] == "pending"]
+    if not pending:
+        return None
+    return min(datetime.fromisoformat(p) if p else _now() for p in pending)
+
+
+def drain_loop(linger_s: float = LINGER_S) -> bool:
+    """Drain until nothing is due within linger_s. One drainer at a time:
+    every enqueue kicks a drainer, so while one is running (say, stuck on a
+    slow webhook) the others exit at once instead of queueing up behind the
+    lock. Returns False if another drainer held it."""
+    DRAIN_LOCK.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        with open(DRAIN_LOCK, "w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            _drain_until_idle(linger_s)
+        # A message queued while we were finishing found the lock held and its
+        # drainer exited; pick it up now rather than wait for the next kick.
+        due = _next_due()
+        if due is None or due > _now():
+            return True
+
+
+def _drain_until_idle(linger_s: float) -> None:
+    deadline = time.time() + linger_s
+    while True:
+        stats = drain()
+        if stats["requests"]:
+            print(f"[outbox] {_now().isoformat()} {stats}", flush=True)
+        due = _next_due()
+        if due is None:
+            return
+        wait = (due - _now()).total_seconds()
+        if time.time() + wait > deadline:
+            return
+        time.sleep(max(wait, 0))
+
+
+def main(argv: list[str]) -> int:
+    if argv[:1] == ["drain"]:
+        drain_loop()
+        return 0
+    for msg in load():
+        print(f"{msg['enqueued_at'][:19]}  {msg['status']:10} {msg['kind']:7} "
+              f"{msg['source']:14} attempts={msg['attempts']} "
+              f"{msg['delivered_at'][:19] or msg['next_attempt_at'][:19]} {msg['last_error']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -8,6 +8,8 @@ at build time to render the /pipeline dashboard and activity ticker.
 
 import fcntl
 import json
+import sys
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -16,6 +18,43 @@ RUNS_FILE = REPO_DIR / "src" / "data" / "pipeline" / "runs.json"
 MAX_DAYS = 90
 
 
+class RunReport:
+    """Totals a pipeline module gathers between two log_run() calls.
+
+    feeds, normalize, ranker and preflight each register one under their
+    own key; log_run() takes (and resets) every non-empty report into the
+    entry. Counts add up over the run; note() keeps the latest value."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self._lock = threading.Lock()
+        self._totals: dict = {}
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for key, n in counts.items():
+                self._totals[key] = self._totals.get(key, 0) + n
+
+    def note(self, **values) -> None:
+        with self._lock:
+            self._totals.update(values)
+
+    def take(self) -> dict:
+        """Totals since the last call (then reset)."""
+        with self._lock:
+            out = dict(self._totals)
+            self._totals.clear()
+        return out
+
+
+_reports: dict[str, RunReport] = {}
+
+
+def report(key: str) -> RunReport:
+    """The RunReport attached to log_run entries as `key`."""
+    return _reports.setdefault(key, RunReport(key))
+
+
 def _load_runs() -> list[dict]:
     """Read runs.json, recovering gracefully from missing or corrupt files."""
     if not RUNS_FILE.exists():
@@ -56,12 +95,18 @@ def log_run(
     output_files: list[str] | None = None,
     error_msg: str = "",
     job: str = "",
+    tiers: list[dict] | None = None,
 ) -> None:
     """Append a run entry to runs.json with file locking.
 
     `job` optionally distinguishes sub-jobs of one bot (e.g. model_bot's
     "prices" vs "roster") without registering new bot ids - the site's
-    "six bots" copy stays true (eng D8/4A)."""
+    "six bots" copy stays true (eng D8/4A).
+
+    `tiers` is the per-tier breakdown of a model cascade (radar_bot's local
+    launch filter, then the writing call); the top-level token and cost
+    fields stay the billed totals. Only billed tiers use input_tokens/
+    output_tokens; local tiers report estimates as est_tokens_in/out."""
     entry = {
         "bot": bot,
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -81,6 +126,24 @@ def log_run(
         entry["error_msg"] = error_msg
     if job:
         entry["job"] = job
+    if tiers:
+        entry["tiers"] = tiers
+    # Connection reuse since the previous log_run in this process. Only
+    # read if a bot actually imported http_pool.
+    if "http_pool" in sys.modules:
+        http = sys.modules["http_pool"].take_stats()
+        if http["requests"]:
+            entry["http"] = http
+    # Same for every registered RunReport: feeds.py's poll/skip totals,
+    # normalize.py's token savings, ranker.py's selection and preflight.py's
+    # prompt budget.
+    for key, run_report in list(_reports.items()):
+        totals = run_report.take()
+        if totals:
+            entry[key] = totals
+    # Budget vs the bill: how far off the preflight estimate was.
+    if "preflight" in entry and input_tokens:
+        entry["preflight"]["actual"] = input_tokens
 
     # Ensure directory exists
     RUNS_FILE.parent.mkdir(parents=True, exist_ok=True)
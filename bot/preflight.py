@@ -0,0 +1,98 @@
+"""
+Token budget preflight: size a prompt before paying for it.
+
+No bot knew how big its prompt was until the bill arrived. Growth in
+STYLE.md, longer summaries or a pile of pending PRs raised the cost and
+latency of every call without anyone noticing. Each bot now builds its
+prompt through:
+
+    stories, prompt = preflight.fit(build, stories, INPUT_TOKEN_BUDGET,
+                                    label="news_bot", model=MODEL, client=client)
+
+`build(items)` renders the whole prompt from a list of context items,
+best first (ranker.select() order). fit() counts the prompt's tokens.
+While it is over the bot's budget, it drops items from the end, the
+lowest ranked first, and rebuilds. The rest of the prompt (style guide,
+rules, history) is never trimmed.
+
+Counting uses normalize.estimate_tokens() by default: local, instant and
+within ~15% on prose. With SOFTCAT_COUNT_TOKENS=1, it uses the
+count-tokens endpoint instead, which costs one extra round trip per count.
+If the endpoint fails, fit() falls back to the local estimate.
+
+A prompt still over budget with every item gone is the fixed part growing:
+  * past the budget, fit() warns;
+  * past RUNAWAY_FACTOR x budget, it raises, so the run fails loudly
+    instead of paying for the runaway prompt.
+
+Budget, estimate and items trimmed are attached to the bot's next log_run
+entry as "preflight". The billed input tokens are added there as "actual",
+so the budgets and the estimator can be checked against the bill.
+"""
+
+import os
+from typing import Callable
+
+import normalize
+import pipeline_log
+
+RUNAWAY_FACTOR = 2.0
+
+_report = pipeline_log.report("preflight")
+take_report = _report.take
+
+
+def count(prompt: str, model: str | None = None, client=None) -> tuple[int, str]:
+    """(input tokens, method) for a single-user-message prompt."""
+    if os.environ.get("SOFTCAT_COUNT_TOKENS") == "1" and client is not None and model:
+        try:
+            result = client.messages.count_tokens(
+                model=model, messages=[{"role": "user", "content": prompt}])
+            return result.input_tokens, "count_tokens"
+        except Exception as e:
+            print(f"[preflight] count_tokens failed ({type(e).__name__}: {e}); "
+                  f"using the local estimate")
+    return normalize.estimate_tokens(prompt), "local"
+
+
+def fit(build: Callable[[list], str], items: list, budget: int, *, label: str,
+        model: str | None = None, client=None) -> tuple[list, str]:
+    """(kept items, prompt) with the prompt trimmed to `budget` tokens where
+    dropping context items can get it there."""
+    kept = list(items)
+    prompt = build(kept)
+    tokens, method = count(prompt, model, client)
+    first = tokens
+
+    if tokens > budget and kept:
+        # Drop enough items to cover the overshoot in one go, sizing each by
+        # the local estimate scaled to whichever counter is in use.
+        base = normalize.estimate_tokens(build([]))
+        scale = tokens / max(1, normalize.estimate_tokens(prompt))
+        over = tokens - budget
+        while kept and over > 0:
+            over -= scale * (normalize.estimate_tokens(build([kept.pop()])) - base)
+        prompt = build(kept)
+        tokens, method = count(prompt, model, client)
+        while tokens > budget and kept:  # the estimate undershot
+            kept.pop()
+            prompt = build(kept)
+            tokens, method = count(prompt, model, client)
+
+    trimmed = len(items) - len(kept)
+    _report.add(calls=1, estimate=tokens, trimmed=trimmed)
+    _report.note(budget=budget, method=method)
+
+    if trimmed:
+        print(f"[preflight] {label}: ~{first:,} tokens over the {budget:,} budget; trimmed "
+              f"{trimmed} of {len(items)} context items -> ~{tokens:,} ({method})")
+    else:
+        print(f"[preflight] {label}: ~{tokens:,}/{budget:,} tokens, "
+              f"{len(items)} context items ({method})")
+    if tokens > budget * RUNAWAY_FACTOR:
+        raise RuntimeError(f"{label}: prompt is ~{tokens:,} tokens, over {RUNAWAY_FACTOR:g}x "
+                           f"its {budget:,} budget with no context left to trim")
+    if tokens > budget:
+        print(f"[preflight] WARNING: {label} prompt is over budget with no context left "
+              f"to trim; the fixed part (style guide, rules) has grown")
+    return kept, prompt
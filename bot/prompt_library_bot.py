@@ -10,19 +10,19 @@ import argparse
 import os
 import re
 import sys
-import json
 import subprocess
 import time as _time
 from datetime import datetime
 from pathlib import Path
 
-import httpx
-import feedparser
-from dotenv import load_dotenv
-from anthropic import Anthropic
-
 from pipeline_log import log_run
+import content_catalogue
+import feeds
 import git_safe
+import outbox
+import preflight
+import ranker
+import state_store
 
 # Paths
 BOT_DIR = Path(__file__).parent
@@ -39,46 +39,33 @@ FEEDS = [
     "https://www.artificialintelligence-news.com/feed/",
 ]
 
-load_dotenv(BOT_DIR / ".env")
+# Stories that show a way of working with models, not just what shipped.
+FOCUS = """prompt prompts prompting workflow developer coding writing research
+productivity agent technique guide tutorial template context reasoning"""
+FEED_TOKEN_BUDGET = 3000
+INPUT_TOKEN_BUDGET = 8000  # whole prompt; see preflight.py
 
 
 def load_history() -> dict:
-    if HISTORY_FILE.exists():
-        return json.loads(HISTORY_FILE.read_text())
-    return {"prompts": []}
+    return state_store.read(HISTORY_FILE, {"prompts": []}, strict=True)
 
 
 def save_history(history: dict):
-    HISTORY_FILE.write_text(json.dumps(history, indent=2))
+    state_store.write(HISTORY_FILE, history, compact=True)
 
 
 def fetch_feed_entries() -> list[dict]:
     """Pull recent entries from all feeds for topic inspiration."""
-    entries = []
-    for url in FEEDS:
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:15]:
-                entries.append({
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
-                    "summary": entry.get("summary", "")[:500],
-                    "source": feed.feed.get("title", url),
-                })
-        except Exception as e:
-            print(f"Failed to fetch {url}: {e}")
-    return entries
+    return feeds.fetch_entries(FEEDS, limit=15)
 
 
 def get_existing_prompts() -> list[str]:
-    """Read titles and categories of all existing prompts on disk."""
+    """Titles and categories of all existing prompts, from the content catalogue."""
     prompts = []
-    for f in CONTENT_DIR.glob("*.md"):
-        text = f.read_text()
-        title_match = re.search(r'^title:\s*["\'](.+?)["\']', text, re.MULTILINE)
-        cat_match = re.search(r'^category:\s*["\']?(.+?)["\']?\s*$', text, re.MULTILINE)
-        if title_match:
-            prompts.append(f"{title_match.group(1)} ({cat_match.group(1) if cat_match else 'unknown'})")
+    for e in content_catalogue.get().entries("prompts"):
+        title = e["meta"].get("title")
+        if title:
+            prompts.append(f"{title} ({e['meta'].get('category') or 'unknown'})")
     return prompts
 
 
@@ -91,23 +78,30 @@ def slugify(title: str) -> str:
     return slug[:60]
 
 
-def generate_prompts(entries: list[dict], history: dict) -> list[str] | None:
+def generate_prompts(entries: list[dict], history: dict,
+                     existing_prompts: list[str] | None = None) -> list[str] | None:
     """Use Claude to generate 2 new prompts for the library."""
+    from anthropic import Anthropic
     client = Anthropic()
     style_guide = STYLE_GUIDE.read_text()
 
-    existing_prompts = get_existing_prompts()
+    if existing_prompts is None:
+        existing_prompts = get_existing_prompts()
     existing_text = "\n".join(f"- {p}" for p in existing_prompts) or "None yet."
 
     past_titles = [p.get("title", "") for p in history.get("prompts", [])]
     past_text = "\n".join(f"- {t}" for t in past_titles[-30:]) or "None yet."
 
-    feed_text = "\n\n".join(
-        f"**{e['title']}**\nSource: {e['source']}\n{e['summary']}"
-        for e in entries[:30]
-    )
+    picked = ranker.select(entries, k=30, budget=FEED_TOKEN_BUDGET, focus=FOCUS,
+                           history=past_titles + existing_prompts, label="prompt_bot")
+
+    def build(items: list[dict]) -> str:
+        feed_text = "\n\n".join(
+            f"**{e['title']}**\nSource: {e['source']}\n{e['summary']}"
+            for e in items
+        )
 
-    prompt = f"""You are creating copy-ready prompts for the SOFT CAT .ai Prompt Library. These are reusable prompt templates that developers can copy and paste into any AI model.
+        return f"""You are creating copy-ready prompts for the SOFT CAT .ai Prompt Library. These are reusable prompt templates that developers can copy and paste into any AI model.
 
 ## House style (follow this exactly):
 {style_guide}
@@ -160,6 +154,9 @@ Rules:
 - Category must be lowercase and hyphenated
 - Tags must be lowercase and hyphenated"""
 
+    picked, prompt = preflight.fit(build, picked, INPUT_TOKEN_BUDGET, label="prompt_bot",
+                                   model="claude-sonnet-4-6", client=client)
+
     response = client.messages.create(
         model="claude-sonnet-4-6",
         max_tokens=3000,
@@ -264,14 +261,12 @@ def ping_healthcheck(status="success"):
     url = os.environ.get("HC_PING_PROMPTS")
     if not url:
         return
-    try:
-        suffix = "/fail" if status == "fail" else ""
-        httpx.get(f"{url}{suffix}", timeout=10)
-    except Exception as e:
-        print(f"Healthcheck ping failed: {e}")
+    outbox.ping(url, status, source="prompt_bot")
 
 
 def main():
+    from dotenv import load_dotenv
+    load_dotenv(BOT_DIR / ".env")
     parser = argparse.ArgumentParser(description="SOFT CAT Prompt Library bot")
     parser.add_argument("--no-push", action="store_true", help="Commit but don't push")
     args = parser.parse_args()
@@ -298,7 +293,7 @@ def main():
         print(f"Found {len(existing)} existing prompts")
 
         print("Generating new prompts...")
-        prompts = generate_prompts(entries, history)
+        prompts = generate_prompts(entries, history, existing_prompts=existing)
 
         if not prompts:
             print("Nothing to publish. Exiting.")
@@ -0,0 +1,163 @@
+"""
+Memoized reader for the radar day-file archive (src/data/radar/YYYY-MM-DD.json).
+
+One horizon run used to read the last 7 day-files for evidence and then open
+every file older than 60 days again for Past scoring, re-parsing the whole
+archive on every run. RadarArchive shares one reader across those jobs:
+
+  * an in-process LRU of parsed day-files, keyed by content hash;
+  * an on-disk parsed cache under bot/.cache/radar/, one pickle per content
+    hash, plus a manifest mapping each day to (mtime_ns, size, sha256).
+
+A day whose stat matches the manifest is served without touching its JSON
+file; a day whose stat moved is re-hashed and only re-parsed if the bytes
+actually changed. So a run's radar I/O is the files changed since last run.
+
+Parsed day-files are shared between callers: treat them as read-only.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+
+import state_store
+
+BOT_DIR = Path(__file__).parent
+REPO_DIR = BOT_DIR.parent
+RADAR_DIR = REPO_DIR / "src" / "data" / "radar"
+CACHE_DIR = BOT_DIR / ".cache" / "radar"
+LRU_SIZE = 128
+MANIFEST_VERSION = 1
+
+
+class RadarArchive:
+    """Read-through cache over one radar directory."""
+
+    def __init__(self, radar_dir: Path = RADAR_DIR, cache_dir: Path = CACHE_DIR,
+                 lru_size: int = LRU_SIZE):
+        self.radar_dir = Path(radar_dir)
+        self.cache_dir = Path(cache_dir)
+        self.lru_size = lru_size
+        self._lru: OrderedDict[str, dict] = OrderedDict()
+        self._manifest: dict[str, list] | None = None
+        self._dirty = False
+        self.stats = {"lru_hits": 0, "disk_hits": 0, "parsed": 0, "hashed": 0}
+
+    # -- manifest ---------------------------------------------------------- #
+
+    @property
+    def _manifest_file(self) -> Path:
+        return self.cache_dir / "manifest.json"
+
+    def _load_manifest(self) -> dict[str, list]:
+        if self._manifest is None:
+            self._manifest = {}
+            try:
+                data = json.loads(self._manifest_file.read_text())
+                if data.get("version") == MANIFEST_VERSION and data.get("dir") == str(self.radar_dir):
+                    self._manifest = data.get("days", {})
+            except (OSError, json.JSONDecodeError, ValueError):
+                pass
+        return self._manifest
+
+    def save(self) -> None:
+        """Persist the manifest and drop pickles no day points at any more."""
+        if not self._dirty:
+            return
+        manifest = self._load_manifest()
+        try:
+            state_store.write(self._manifest_file, {"version": MANIFEST_VERSION,
+                                                    "dir": str(self.radar_dir),
+                                                    "days": manifest}, compact=True)
+            live = {rec[2] for rec in manifest.values()}
+            for p in self.cache_dir.glob("*.pickle"):
+                if p.stem not in live:
+                    p.unlink(missing_ok=True)
+            self._dirty = False
+        except OSError as e:
+            print(f"[radar_archive] could not persist cache: {e}")
+
+    # -- reads ------------------------------------------------------------- #
+
+    def dates(self) -> list[str]:
+        """All dated radar files present in the archive, sorted oldest first."""
+        if not self.radar_dir.exists():
+            return []
+        return sorted(p.stem for p in self.radar_dir.glob("????-??-??.json"))
+
+    def sha(self, day: str) -> str | None:
+        """Content hash of a day-file (None if missing/unparseable). Answered
+        from the manifest without reading the file when its stat is unchanged."""
+        path = self.radar_dir / f"{day}.json"
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        manifest = self._load_manifest()
+        rec = manifest.get(day)
+        if rec and rec[0] == st.st_mtime_ns and rec[1] == st.st_size:
+            return rec[2]
+        raw = path.read_bytes()
+        self.stats["hashed"] += 1
+        digest = hashlib.sha256(raw).hexdigest()
+        if not (self.cache_dir / f"{digest}.pickle").exists() and digest not in self._lru:
+            if self._parse_and_store(day, digest, raw) is None:
+                return None
+        manifest[day] = [st.st_mtime_ns, st.st_size, digest]
+        self._dirty = True
+        return digest
+
+    def read(self, day: str) -> dict | None:
+        """Parsed day-file, or None if it is missing or not valid JSON."""
+        digest = self.sha(day)
+        if digest is None:
+            return None
+        if digest in self._lru:
+            self._lru.move_to_end(digest)
+            self.stats["lru_hits"] += 1
+            return self._lru[digest]
+        try:
+            data = pickle.loads((self.cache_dir / f"{digest}.pickle").read_bytes())
+            self.stats["disk_hits"] += 1
+        except (OSError, pickle.UnpicklingError, EOFError):
+            data = self._parse_and_store(day, digest, (self.radar_dir / f"{day}.json").read_bytes())
+            if data is None:
+                return None
+        self._remember(digest, data)
+        return data
+
+    def _parse_and_store(self, day: str, digest: str, raw: bytes):
+        try:
+            data = json.loads(raw)
+        except (json.JSONDecodeError, ValueError):
+            return None
+        self.stats["parsed"] += 1
+        self._remember(digest, data)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_dir / f"{digest}.tmp"
+            tmp.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp, self.cache_dir / f"{digest}.pickle")
+        except OSError as e:
+            print(f"[radar_archive] could not cache {day}: {e}")
+        return data
+
+    def _remember(self, digest: str, data) -> None:
+        self._lru[digest] = data
+        self._lru.move_to_end(digest)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+
+_archive: RadarArchive | None = None
+
+
+def get() -> RadarArchive:
+    """The process-wide archive shared by every job in this process."""
+    global _archive
+    if _archive is None:
+        _archive = RadarArchive()
+    return _archive
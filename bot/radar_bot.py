@@ -7,6 +7,7 @@ generates editorial JSON data for the /radar page, and commits to the site repo.
 """
 
 import os
+import re
 import sys
 import json
 import subprocess
@@ -14,13 +15,14 @@ import time
 from datetime import datetime, date
 from pathlib import Path
 
-import httpx
-import feedparser
-from dotenv import load_dotenv
-from anthropic import Anthropic
-
 from pipeline_log import log_run as _log_run
+import feeds
 import git_safe
+import http_pool
+import outbox
+import preflight
+import ranker
+import state_store
 
 # Paths
 BOT_DIR = Path(__file__).parent
@@ -48,6 +50,41 @@ HN_SEARCH_TERMS = [
     "AI automation",
 ]
 
+# Launch language first: the radar writes up products, not news about them.
+FOCUS = """launch launched launches release released introducing announces
+available beta open source tool app api sdk cli plugin extension platform product
+agent agents developer coding assistant"""
+FEED_TOKEN_BUDGET = 4000
+INPUT_TOKEN_BUDGET = 8000  # whole prompt; see preflight.py
+
+# Launch cascade. The writing model used to read every ranked entry just to
+# decide which were launches, then wrote copy for a handful. Tier 1,
+# launch_score(), is a local keyword filter: it drops the entries that
+# plainly are not launches (funding, opinion, lawsuits) and keeps
+# anything doubtful. Only the survivors reach the writing model, tier 2.
+# HN stories skip tier 1: the writer needs them all for hn_top5.
+# RADAR_CASCADE=0 sends every ranked entry, as before. To check recall on a
+# recorded run: python3 bot/benchmarks/cascade.py
+LAUNCH_THRESHOLD = 2
+LAUNCH_CUES = re.compile(
+    r"\b(launch(es|ed|ing)?|releas(e|es|ed|ing)|introduc(es|ed|ing)|announc(e|es|ed|ing)|"
+    r"unveil(s|ed)?|debut(s|ed)?|ships?|shipped|rolls? out|rolled out|now available|"
+    r"available (now|today)|open[- ]sourc(es|ed)|beta|preview|early access|show hn|"
+    r"(new|meet)( [\w-]+){0,2} (models?|apps?|tools?|agents?|apis?|sdks?|clis?|assistants?|"
+    r"features?|plugins?|extensions?)|v\d+(\.\d+)*)\b", re.I)
+PRODUCT_CUES = re.compile(
+    r"\b(tool|app|model|api|sdk|cli|agent|platform|extension|plugin|library|framework|"
+    r"assistant|ide|editor|copilot|open[- ]source|github)s?\b", re.I)
+# Only what is almost never a launch headline. Generic words (study, guide,
+# policy, why) also name products ("Study Mode"), so they are not here.
+NOT_LAUNCH_CUES = re.compile(
+    r"\b(raises?|raised|funding|series [a-e]|seed round|valuation|acquir(es|ed)|acquisition|"
+    r"lawsuit|sues?|opinion|interview|podcast|earnings|regulators?)\b", re.I)
+
+WRITE_MODEL = "claude-sonnet-4-6"
+# $ per million tokens: (input, output)
+PRICES = {"claude-sonnet-4-6": (3, 15)}
+
 # Valid categories for radar products
 CATEGORIES = [
     "AI Agents", "Developer Tools", "AI Coding", "AI Security",
@@ -60,46 +97,26 @@ CATEGORIES = [
 # to consider them for promotion to past.json (60-day eligibility window).
 MAX_ARCHIVE_DAYS = 365
 
-load_dotenv(BOT_DIR / ".env")
-
 
 def load_history() -> dict:
-    if HISTORY_FILE.exists():
-        return json.loads(HISTORY_FILE.read_text())
-    return {"scans": []}
+    return state_store.read(HISTORY_FILE, {"scans": []}, strict=True)
 
 
 def save_history(history: dict):
-    HISTORY_FILE.write_text(json.dumps(history, indent=2) + "\n")
+    state_store.write(HISTORY_FILE, history, compact=True)
 
 
 def load_manifest() -> dict:
-    if MANIFEST_FILE.exists():
-        return json.loads(MANIFEST_FILE.read_text())
-    return {"latest": "", "dates": []}
+    return state_store.read(MANIFEST_FILE, {"latest": "", "dates": []}, strict=True)
 
 
 def save_manifest(manifest: dict):
-    MANIFEST_FILE.write_text(json.dumps(manifest, indent=2) + "\n")
+    state_store.write(MANIFEST_FILE, manifest)
 
 
 def fetch_feed_entries() -> list[dict]:
     """Pull recent entries from all feeds."""
-    entries = []
-    for url in FEEDS:
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:15]:
-                entries.append({
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
-                    "summary": entry.get("summary", "")[:500],
-                    "source": feed.feed.get("title", url),
-                    "published": entry.get("published", ""),
-                })
-        except Exception as e:
-            print(f"Failed to fetch {url}: {e}")
-    return entries
+    return feeds.fetch_entries(FEEDS, limit=15)
 
 
 def fetch_hn_entries() -> list[dict]:
@@ -110,15 +127,15 @@ def fetch_hn_entries() -> list[dict]:
 
     for term in HN_SEARCH_TERMS:
         try:
-            resp = httpx.get(
+            resp = http_pool.get(
                 "https://hn.algolia.com/api/v1/search",
+                purpose="api",
                 params={
                     "query": term,
                     "tags": "story",
                     "numericFilters": f"created_at_i>{since}",
                     "hitsPerPage": 20,
                 },
-                timeout=15,
             )
             resp.raise_for_status()
             for hit in resp.json().get("hits", []):
@@ -154,18 +171,64 @@ def get_past_product_names(history: dict) -> list[str]:
     return names
 
 
-def generate_radar(entries: list[dict], hn_entries: list[dict], history: dict) -> dict | None:
-    """Use Claude to extract product launches and generate radar JSON."""
+def launch_score(entry: dict) -> int:
+    """Cascade tier 1: how much an entry reads like a product launch.
+    Deliberately generous; a false keep only costs writer tokens."""
+    title, summary = entry.get("title", ""), entry.get("summary", "")
+    score = 2 * bool(LAUNCH_CUES.search(title)) + bool(LAUNCH_CUES.search(summary))
+    score += bool(PRODUCT_CUES.search(f"{title} {summary}"))
+    score -= 2 * bool(NOT_LAUNCH_CUES.search(title))
+    return score
+
+
+def filter_launches(entries: list[dict]) -> tuple[list[dict], dict]:
+    """Entries at or above LAUNCH_THRESHOLD, in rank order, plus the tier record."""
+    kept = [e for e in entries if launch_score(e) >= LAUNCH_THRESHOLD]
+    tier = {"tier": "filter", "model": "local", "entries_in": len(entries),
+            "entries_out": len(kept),
+            "est_tokens_in": sum(ranker.entry_tokens(e) for e in entries),
+            "est_tokens_out": sum(ranker.entry_tokens(e) for e in kept),
+            "cost_usd": 0.0}
+    print(f"[radar_bot] Cascade filter: {len(entries)} -> {len(kept)} entries, "
+          f"~{tier['est_tokens_in']:,} -> ~{tier['est_tokens_out']:,} tokens")
+    return kept, tier
+
+
+def format_feed_entries(entries: list[dict]) -> str:
+    return "\n\n".join(
+        f"**{e['title']}**\nSource: {e['source']}\nLink: {e['link']}\nPublished: {e['published']}\n{e['summary']}"
+        for e in entries
+    )
+
+
+def usage_tier(tier: str, model: str, usage, **extra) -> dict:
+    price_in, price_out = PRICES[model]
+    cost = (usage.input_tokens * price_in + usage.output_tokens * price_out) / 1_000_000
+    return {"tier": tier, "model": model, **extra, "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens, "cost_usd": round(cost, 6)}
+
+
+def generate_radar(entries: list[dict], hn_entries: list[dict], history: dict,
+                   cascade: bool | None = None) -> tuple[dict, list[dict]] | None:
+    """Use Claude to extract product launches and generate radar JSON.
+
+    Returns (data, tiers): one record per cascade tier with its tokens and
+    cost, the writing call last."""
+    from anthropic import Anthropic
     client = Anthropic()
     style_guide = STYLE_GUIDE.read_text()
+    if cascade is None:
+        cascade = os.environ.get("RADAR_CASCADE", "1") != "0"
 
     past_names = get_past_product_names(history)
     past_names_text = ", ".join(past_names[-50:]) if past_names else "None yet"
 
-    feed_text = "\n\n".join(
-        f"**{e['title']}**\nSource: {e['source']}\nLink: {e['link']}\nPublished: {e['published']}\n{e['summary']}"
-        for e in entries[:40]
-    )
+    picked = ranker.select(entries, k=40, budget=FEED_TOKEN_BUDGET, focus=FOCUS,
+                           history=past_names, label="radar_bot")
+    tiers = []
+    if cascade:
+        picked, tier = filter_launches(picked)
+        tiers.append(tier)
 
     hn_text = "\n\n".join(
         f"**{e['title']}** ({e['points']} pts, {e['comments']} comments)\nHN: {e['hn_url']}\nLink: {e['link']}"
@@ -174,7 +237,9 @@ def generate_radar(entries: list[dict], hn_entries: list[dict], history: dict) -
 
     today = date.today().isoformat()
 
-    prompt = f"""You are curating "The Radar" for SOFT CAT .ai. Your job is to find genuine AI product and tool LAUNCHES from the feeds below. Not news articles. Not opinion pieces. Not funding announcements. Actual products or tools that someone can go and use or try.
+    def build(items: list[dict]) -> str:
+        feed_text = format_feed_entries(items) if items else "No likely launches in the feeds today."
+        return f"""You are curating "The Radar" for SOFT CAT .ai. Your job is to find genuine AI product and tool LAUNCHES from the feeds below. Not news articles. Not opinion pieces. Not funding announcements. Actual products or tools that someone can go and use or try.
 
 ## House style (follow this exactly):
 {style_guide}
@@ -274,8 +339,11 @@ Keep discord_summary under 1800 characters. Wrap all URLs in angle brackets.
 - Do NOT repeat products from the "already covered" list
 - Be selective. Quality over quantity. 2-6 products is the sweet spot."""
 
+    picked, prompt = preflight.fit(build, picked, INPUT_TOKEN_BUDGET, label="radar_bot",
+                                   model=WRITE_MODEL, client=client)
+
     response = client.messages.create(
-        model="claude-sonnet-4-6",
+        model=WRITE_MODEL,
         max_tokens=4096,
         messages=[{"role": "user", "content": prompt}],
     )
@@ -305,7 +373,9 @@ Keep discord_summary under 1800 characters. Wrap all URLs in angle brackets.
     data.setdefault("featured", [])
     data.setdefault("picks", [])
 
-    return data, response.usage
+    tiers.append(usage_tier("write", WRITE_MODEL, response.usage,
+                            entries_in=len(picked) + len(hn_entries[:10])))
+    return data, tiers
 
 
 def _git(args: list[str], check: bool = False):
@@ -353,7 +423,7 @@ def save_and_push(radar_data: dict, history: dict):
 
     # Write the daily radar file
     output_path = RADAR_DIR / filename
-    output_path.write_text(json.dumps(radar_data, indent=2) + "\n")
+    state_store.write(output_path, radar_data)
     print(f"Written: {output_path}")
 
     # Update manifest
@@ -429,7 +499,7 @@ def save_and_push(radar_data: dict, history: dict):
 
 
 def post_to_discord(radar_data: dict):
-    """Post the daily summary to Discord via webhook."""
+    """Queue the daily summary for Discord (delivered by outbox.py)."""
     webhook_url = os.environ.get("DISCORD_WEBHOOK_RADAR")
     if not webhook_url:
         print("No DISCORD_WEBHOOK_RADAR set, skipping Discord post.")
@@ -440,16 +510,8 @@ def post_to_discord(radar_data: dict):
         print("No discord_summary in radar data, skipping Discord post.")
         return
 
-    try:
-        resp = httpx.post(
-            webhook_url,
-            json={"content": summary, "username": "SOFT CAT Radar"},
-            timeout=15,
-        )
-        resp.raise_for_status()
-        print("Discord summary posted.")
-    except Exception as e:
-        print(f"Discord post failed: {e}")
+    outbox.discord(webhook_url, summary, username="SOFT CAT Radar", source="radar_bot")
+    print("Discord summary queued.")
 
 
 def ping_healthcheck(status="success"):
@@ -457,14 +519,12 @@ def ping_healthcheck(status="success"):
     url = os.environ.get("HC_PING_RADAR")
     if not url:
         return
-    try:
-        suffix = "/fail" if status == "fail" else ""
-        httpx.get(f"{url}{suffix}", timeout=10)
-    except Exception as e:
-        print(f"Healthcheck ping failed: {e}")
+    outbox.ping(url, status, source="radar_bot")
 
 
 def main():
+    from dotenv import load_dotenv
+    load_dotenv(BOT_DIR / ".env")
     print(f"[{datetime.now().isoformat()}] Radar bot starting")
     t0 = time.time()
 
@@ -500,13 +560,17 @@ def main():
             _log_run("radar_bot", status="success", duration_s=time.time() - t0,
                      feeds_scanned=len(FEEDS) + len(HN_SEARCH_TERMS),
                      items_found=total_found, items_published=0,
-                     model="claude-sonnet-4-6")
+                     model=WRITE_MODEL)
             save_and_push(empty_data, history)
             ping_healthcheck()
             sys.exit(0)
 
-        radar_data, usage = result
-        cost = (usage.input_tokens * 3 + usage.output_tokens * 15) / 1_000_000
+        radar_data, tiers = result
+        cost = sum(t["cost_usd"] for t in tiers)
+        # Billed usage only: the local filter tier carries estimates under
+        # est_tokens_in/out instead.
+        input_tokens = sum(t.get("input_tokens", 0) for t in tiers)
+        output_tokens = sum(t.get("output_tokens", 0) for t in tiers)
         published = len(radar_data.get("featured", [])) + len(radar_data.get("picks", []))
         rejected = total_found - published
 
@@ -528,9 +592,9 @@ def main():
         _log_run("radar_bot", status="success", duration_s=time.time() - t0,
                  feeds_scanned=len(FEEDS) + len(HN_SEARCH_TERMS),
                  items_found=total_found, items_rejected=rejected, items_published=published,
-                 model="claude-sonnet-4-6", cost_usd=cost,
-                 input_tokens=usage.input_tokens, output_tokens=usage.output_tokens,
-                 output_files=[f"src/data/radar/{today}.json"])
+                 model=WRITE_MODEL, cost_usd=cost,
+                 input_tokens=input_tokens, output_tokens=output_tokens,
+                 output_files=[f"src/data/radar/{today}.json"], tiers=tiers)
 
         print("Saving and pushing...")
         save_and_push(site_data, history)
@@ -0,0 +1,143 @@
+"""
+Local relevance pre-ranking: which feed entries reach the model.
+
+The bots used to prompt with the first N entries in feed order
+(`entries[:40]`, `fresh[:30]`, `fresh[:20]`). fetch_entries() returns up
+to 15 entries per feed in FEEDS order, so the first two or three feeds
+filled the whole slice. The later feeds were never seen, and neither was
+anything relevant they carried. Now each bot calls:
+
+    picked = ranker.select(fresh, k=30, budget=3000, focus=FOCUS,
+                           history=past_titles, label="news_bot")
+
+Every entry gets a deterministic score. No model, no network:
+
+  * relevance: TF-IDF cosine (similarity.py) between the entry (title
+    counted twice, plus summary) and the bot's FOCUS terms, scaled so the
+    best entry in the batch scores 1;
+  * recency: halves every HALF_LIFE_H hours since publication (undated
+    entries score 0.5);
+  * novelty: 1 minus the closest match among `history` (past titles,
+    product names), so themes the bot has already covered sink.
+
+Entries are then picked greedily, best first:
+  * each pick from a source multiplies that source's remaining scores by
+    SOURCE_DECAY, so one prolific feed cannot take every slot;
+  * an entry at or above DUPLICATE_COSINE to one already picked (the same
+    story syndicated to two feeds) is dropped;
+  * an entry that would overrun `budget` is skipped in favour of smaller
+    ones further down.
+Selection stops at k entries. The result is best first, so a caller that
+must shrink it further can drop entries from the end.
+
+Candidates, picks and token totals are attached to the bot's next log_run
+entry as "ranker".
+"""
+
+import math
+import time
+
+import normalize
+import pipeline_log
+import similarity
+
+W_RELEVANCE = 0.5
+W_RECENCY = 0.3
+W_NOVELTY = 0.2
+HALF_LIFE_H = 36
+SOURCE_DECAY = 0.75
+DUPLICATE_COSINE = 0.6
+
+_report = pipeline_log.report("ranker")
+take_report = _report.take
+
+
+def entry_tokens(entry: dict) -> int:
+    """normalize.py's estimate, or a fresh one for entries that skipped it."""
+    if entry.get("tokens") is not None:
+        return entry["tokens"]
+    return (normalize.estimate_tokens(entry.get("title", ""))
+            + normalize.estimate_tokens(entry.get("summary", "")))
+
+
+def _text(entry: dict) -> list[str]:
+    title = similarity.tokens(entry.get("title", ""))
+    return title + title + similarity.tokens(entry.get("summary", ""))
+
+
+def recency(entry: dict, now: float) -> float:
+    ts = entry.get("published_ts")
+    if not ts:
+        return 0.5
+    age_h = max(0.0, now - ts) / 3600
+    return math.exp(-age_h * math.log(2) / HALF_LIFE_H)
+
+
+def score(entries: list[dict], focus: str = "", history: list[str] | None = None,
+          now: float | None = None) -> list[float]:
+    """Base score per entry, in input order."""
+    now = now if now is not None else time.time()
+    docs = [_text(e) for e in entries]
+
+    relevance = [0.0] * len(entries)
+    query = similarity.tokens(focus)
+    if query and entries:
+        index = similarity.SimilarityIndex()
+        for i, toks in enumerate(docs):
+            index.add(str(i), toks)
+        for key, cos in index.scores(query):
+            relevance[int(key)] = cos
+        best = max(relevance)
+        relevance = [r / best if best else 0.0 for r in relevance]
+
+    novelty = [1.0] * len(entries)
+    past = similarity.SimilarityIndex()
+    for i, text in enumerate(history or []):
+        past.add(str(i), similarity.tokens(text))
+    if len(past):
+        novelty = [1.0 - past.nearest(toks)[1] for toks in docs]
+
+    return [W_RELEVANCE * rel + W_RECENCY * recency(e, now) + W_NOVELTY * nov
+            for e, rel, nov in zip(entries, relevance, novelty)]
+
+
+def select(entries: list[dict], k: int, budget: int | None = None, focus: str = "",
+           history: list[str] | None = None, now: float | None = None,
+           label: str = "ranker") -> list[dict]:
+    """Up to k entries, best first, whose tokens fit within `budget`."""
+    base = score(entries, focus, history, now)
+    remaining = list(range(len(entries)))
+    per_source: dict[str, int] = {}
+    picked_index = similarity.SimilarityIndex()
+    picked: list[dict] = []
+    used = duplicates = 0
+
+    while remaining and len(picked) < k:
+        # Ties keep input order so the same feeds always give the same pick.
+        best = max(remaining, key=lambda i: (
+            base[i] * SOURCE_DECAY ** per_source.get(entries[i].get("source", ""), 0), -i))
+        remaining.remove(best)
+        entry = entries[best]
+        toks = _text(entry)
+        if len(picked_index) and picked_index.nearest(toks)[1] >= DUPLICATE_COSINE:
+            duplicates += 1
+            continue
+        cost = entry_tokens(entry)
+        if budget is not None and used + cost > budget:
+            continue
+        picked.append(entry)
+        picked_index.add(str(best), toks)
+        used += cost
+        source = entry.get("source", "")
+        per_source[source] = per_source.get(source, 0) + 1
+
+    total = sum(entry_tokens(e) for e in entries)
+    _report.add(candidates=len(entries), picked=len(picked), duplicates=duplicates,
+                tokens_candidates=total, tokens_picked=used)
+    if budget is not None:
+        _report.note(budget=budget)
+    print(f"[ranker] {label}: picked {len(picked)}/{len(entries)} entries from "
+          f"{len(per_source)} sources, ~{used:,}"
+          f"{f'/{budget:,}' if budget is not None else ''} tokens"
+          f"{f', {duplicates} duplicates dropped' if duplicates else ''}")
+    return picked
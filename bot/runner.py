@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Run several SOFT CAT bots in one warm process.
+
+Each softcat-*.service used to start its own interpreter and pay for
+importing anthropic, httpx, feedparser and dotenv before doing any work, then
+rebuild the process-wide caches (content catalogue, radar archive, GitHub
+client) from scratch. The runner imports each bot module once and calls its
+main() in turn, so later bots reuse what earlier ones warmed.
+
+    python3 bot/runner.py                 # today's schedule, in order
+    python3 bot/runner.py radar horizon   # a named subset, in the given order
+    python3 bot/runner.py --list
+
+Isolation: every bot's main() already logs its own run (pipeline_log) and
+pings its own healthcheck. The runner additionally catches SystemExit and
+any exception escaping main(), restores argv and the working directory, and
+moves on, so one failing bot never stops the rest. The exit status is 1 if
+any bot failed.
+
+softcat-runner.timer fires once at 06:00 and runs the day's schedule in the
+order the per-bot timers used to fire (radar still lands before horizon
+reads it). Enable it INSTEAD of the per-bot timers, never alongside them.
+"""
+
+import argparse
+import calendar
+import importlib
+import os
+import sys
+import time
+import traceback
+from datetime import date
+
+import content_catalogue
+
+# name -> (module, weekdays it runs on; None = daily). Ordered as the old
+# per-bot timers fired: model-data 06:00, digest 07:00, thoughts 08:00,
+# prompts Wed 09:00, radar 09:30, horizon 10:00, tool-of-week Sun 10:00.
+SCHEDULE = {
+    "model-data": ("model_data_bot", None),
+    "digest": ("ai_news_digest", None),
+    "thoughts": ("ai_thoughts_bot", None),
+    "prompts": ("prompt_library_bot", {2}),
+    "radar": ("radar_bot", None),
+    "horizon": ("horizon_bot", None),
+    "tool-of-week": ("tool_of_the_week", {6}),
+}
+
+
+def due_today(today: date | None = None) -> list[str]:
+    weekday = (today or date.today()).weekday()
+    return [name for name, (_, days) in SCHEDULE.items() if days is None or weekday in days]
+
+
+def run_bot(name: str) -> bool:
+    """Import (once) and run one bot's main(). Returns True on success."""
+    module_name = SCHEDULE[name][0]
+    saved_argv, saved_cwd = sys.argv, os.getcwd()
+    t0 = time.time()
+    ok = True
+    print(f"[runner] --- {name} ---")
+    try:
+        module = importlib.import_module(module_name)
+        sys.argv = [module.__file__]  # bots parse argv as if run as scripts
+        module.main()
+    except SystemExit as e:
+        ok = e.code in (None, 0)
+    except Exception:
+        traceback.print_exc()
+        ok = False
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+        # The previous bot may have written into a collection; make the next
+        # one re-stat it rather than trust this process's in-memory view.
+        content_catalogue.get().invalidate()
+    print(f"[runner] {name}: {'ok' if ok else 'FAILED'} in {time.time() - t0:.1f}s")
+    return ok
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Run SOFT CAT bots in one process")
+    parser.add_argument("bots", nargs="*", metavar="BOT",
+                        help=f"bots to run (default: today's schedule); one of {list(SCHEDULE)}")
+    parser.add_argument("--list", action="store_true", help="print the schedule and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (module, days) in SCHEDULE.items():
+            when = "daily" if days is None else ", ".join(calendar.day_abbr[d] for d in sorted(days))
+            print(f"{name:14} {module:20} {when}")
+        return 0
+    unknown = [b for b in args.bots if b not in SCHEDULE]
+    if unknown:
+        parser.error(f"unknown bot(s): {', '.join(unknown)}")
+
+    names = args.bots or due_today()
+    t0 = time.time()
+    failed = [name for name in names if not run_bot(name)]
+    print(f"[runner] {len(names) - len(failed)}/{len(names)} bots ok in {time.time() - t0:.1f}s"
+          + (f"; failed: {', '.join(failed)}" if failed else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
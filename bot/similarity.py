@@ -0,0 +1,114 @@
+"""
+Offline TF-IDF similarity for short editorial entries.
+
+horizon_bot relied on prompt rule 3 alone to stop Claude re-proposing Now
+themes that were already live, archived, or waiting in an open PR, and it
+recycled anyway (60%+ repeats while PRs sat unreviewed). This gives the bot a
+deterministic check of its own: entries are reduced to content-word stems
+plus `theme:<name>` tokens, weighted by TF-IDF over the reference corpus, and
+compared by cosine similarity. No model, no network, no extra dependency.
+
+    index = SimilarityIndex()
+    index.add("now-2026-06-cli-agent-takeover", entry_text(entry))
+    key, score = index.nearest(entry_text(proposal))
+
+Scores are in [0, 1]. The IDF is recomputed lazily after each add(), so the
+index can be queried while it is being filled (horizon_bot does this to
+catch near-duplicates inside a single batch of proposals).
+"""
+
+import math
+import re
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Function words plus the editorial filler every Now title leans on
+# ("X becomes the new Y"), which would otherwise make unrelated entries look
+# alike.
+STOPWORDS = frozenset("""
+a about across after against ai all also an and any are as at be because
+become becomes becoming been being but by can could do does for from has have
+how in into is it its just more most move moves new no not now of on one or
+other our out over same shift shifts so some than that the their them then
+there these they this to turn turns up via was what when where which while
+who why will with without you your
+""".split())
+
+_SUFFIXES = ("ing", "ed", "es", "s")
+
+
+def stem(word: str) -> str:
+    """Crude suffix stripper: enough to fold agent/agents, hardening/harden."""
+    for suffix in _SUFFIXES:
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            return word[: -len(suffix)]
+    return word
+
+
+def tokens(text: str) -> list[str]:
+    return [stem(w) for w in _WORD.findall(text.lower()) if w not in STOPWORDS]
+
+
+def entry_text(entry: dict) -> list[str]:
+    """Tokens for a Now entry or proposal: title, why_it_matters and themes.
+
+    The title is counted twice: pending PR proposals only carry a title, and
+    it is the most deliberate summary of the signal."""
+    title = tokens(entry.get("title", ""))
+    return (title + title + tokens(entry.get("why_it_matters", ""))
+            + [f"theme:{t}" for t in entry.get("themes", []) or []])
+
+
+class SimilarityIndex:
+    """Cosine similarity over TF-IDF vectors of token lists."""
+
+    def __init__(self):
+        self.keys: list[str] = []
+        self._docs: list[dict[str, int]] = []
+        self._df: dict[str, int] = {}
+        self._vectors: list[dict[str, float]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: str, toks: list[str]) -> None:
+        counts: dict[str, int] = {}
+        for t in toks:
+            counts[t] = counts.get(t, 0) + 1
+        for t in counts:
+            self._df[t] = self._df.get(t, 0) + 1
+        self.keys.append(key)
+        self._docs.append(counts)
+        self._vectors = None
+
+    def _idf(self, term: str) -> float:
+        # Smoothed so a term unseen in the corpus still carries weight.
+        return math.log((1 + len(self._docs)) / (1 + self._df.get(term, 0))) + 1
+
+    def _vector(self, counts: dict[str, int]) -> dict[str, float]:
+        vec = {t: (1 + math.log(c)) * self._idf(t) for t, c in counts.items()}
+        norm = math.sqrt(sum(w * w for w in vec.values())) or 1.0
+        return {t: w / norm for t, w in vec.items()}
+
+    def _all_vectors(self) -> list[dict[str, float]]:
+        if self._vectors is None:
+            self._vectors = [self._vector(d) for d in self._docs]
+        return self._vectors
+
+    def scores(self, toks: list[str]) -> list[tuple[str, float]]:
+        """(key, cosine) for every indexed entry, best first; ties keep
+        insertion order so results are deterministic."""
+        counts: dict[str, int] = {}
+        for t in toks:
+            counts[t] = counts.get(t, 0) + 1
+        query = self._vector(counts)
+        out = []
+        for key, vec in zip(self.keys, self._all_vectors()):
+            small, big = (query, vec) if len(query) <= len(vec) else (vec, query)
+            out.append((key, sum(w * big.get(t, 0.0) for t, w in small.items())))
+        out.sort(key=lambda kv: -kv[1])
+        return out
+
+    def nearest(self, toks: list[str]) -> tuple[str | None, float]:
+        best = self.scores(toks)
+        return best[0] if best else (None, 0.0)
@@ -0,0 +1,158 @@
+"""
+Atomic JSON state files for every bot.
+
+History, manifest, data and staging files were all written with
+`path.write_text(json.dumps(data, indent=2))`. That truncates the file
+before writing it, so a crash or a full disk mid-write leaves an empty or
+half-written history, and the next run starts from nothing. It also rewrote
+(and git-staged) files whose content had not changed, and spent most of its
+time in the stdlib encoder's pretty-printer on the largest file,
+digest_history.json (~0.5 MB and growing).
+
+    state_store.write(MODELS_FILE, models)                      # pretty, site/human-read
+    state_store.write(HISTORY_FILE, history, compact=True)      # machine-only
+    history = state_store.read(HISTORY_FILE, {"digests": []}, strict=True)
+
+write():
+
+  * writes to a temp file in the same directory, fsyncs it, and renames it
+    over the target, so readers see the old file or the new one, never a
+    partial one;
+  * skips the write when the encoded bytes match what is on disk. Each
+    path's digest is remembered with its mtime and size, so an unchanged
+    file is not even re-read. Returns whether it wrote;
+  * pretty output (compact=False) goes through the stdlib encoder, so it
+    stays byte-identical to what the bots wrote before (indent=2, ASCII
+    escapes, same key order). Files the site imports or humans review
+    keep the same git diffs;
+  * compact output uses orjson when it is installed (a large speed-up on
+    big files, see bot/benchmarks: state_store[...] cases). Otherwise it
+    falls back to the stdlib with tight separators. Only machine-read
+    files use it.
+
+read() uses orjson too when available. Any JSON reader can load either
+format. A missing file reads as the default. A corrupt one does too,
+except with strict=True, which raises.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib fallback
+    orjson = None
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# New files get the permissions write_text would have given them; read the
+# umask once here, since setting it to read it is not thread-safe.
+_UMASK = _umask()
+
+# path -> (mtime_ns, size, digest) of the bytes we last wrote or compared.
+_digests: dict[Path, tuple[int, int, bytes]] = {}
+
+
+def dumps(data, compact: bool = False, sort_keys: bool = False,
+          trailing_newline: bool = True) -> bytes:
+    if compact and orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS
+                           | (orjson.OPT_SORT_KEYS if sort_keys else 0))
+    elif compact:
+        raw = json.dumps(data, separators=(",", ":"), sort_keys=sort_keys,
+                         ensure_ascii=False).encode()
+    else:
+        raw = json.dumps(data, indent=2, sort_keys=sort_keys).encode()
+    return raw + b"\n" if trailing_newline else raw
+
+
+def loads(raw: bytes | str):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read(path: Path, default=None, strict: bool = False):
+    """Parsed contents of path, or `default` if it is missing or corrupt.
+
+    With strict=True a corrupt file raises instead. Use it for history and
+    manifests: falling back to an empty default there would be saved over
+    the real (recoverable) file on the next write. Only regenerable caches
+    should read leniently."""
+    try:
+        return loads(Path(path).read_bytes())
+    except FileNotFoundError:
+        return default
+    except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError both subclass it
+        if strict:
+            raise ValueError(f"{path} is not valid JSON: {e}") from e
+        print(f"[state_store] WARNING: {path} is not valid JSON, using default")
+        return default
+
+
+def _digest(raw: bytes) -> bytes:
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _unchanged(path: Path, digest: bytes) -> bool:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return False
+    known = _digests.get(path)
+    if known and known[:2] == (st.st_mtime_ns, st.st_size):
+        return known[2] == digest
+    try:
+        on_disk = _digest(path.read_bytes())
+    except OSError:
+        return False
+    _digests[path] = (st.st_mtime_ns, st.st_size, on_disk)
+    return on_disk == digest
+
+
+def write_bytes(path: Path, raw: bytes) -> bool:
+    """Atomically replace path with raw unless it already holds exactly
+    that. Returns True if the file was written."""
+    path = Path(path)
+    digest = _digest(raw)
+    if _unchanged(path, digest):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(tmp, path.stat().st_mode & 0o777)
+        else:
+            os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except BaseException:
+        _unlink_quietly(tmp)
+        raise
+    st = path.stat()
+    _digests[path] = (st.st_mtime_ns, st.st_size, digest)
+    return True
+
+
+def write(path: Path, data, compact: bool = False, sort_keys: bool = False,
+          trailing_newline: bool = True) -> bool:
+    """Encode data (see dumps) and write it atomically if it changed."""
+    return write_bytes(path, dumps(data, compact, sort_keys, trailing_newline))
+
+
+def _unlink_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
@@ -0,0 +1,30 @@
+"""Smoke test for bot/benchmarks: every case runs against tiny fixtures and
+leaves the patched module globals as it found them. Timings are not
+checked here; `python3 bot/benchmarks/bench.py` does that against
+baselines.json.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+import bench  # noqa: E402
+import git_safe  # noqa: E402
+import horizon_bot  # noqa: E402
+import pipeline_log  # noqa: E402
+
+
+def test_every_case_runs_on_small_fixtures():
+    before = (pipeline_log.RUNS_FILE, horizon_bot.REPO_DIR, git_safe.REPO_DIR,
+              horizon_bot.PAST_SCORES_FILE)
+    results = bench.run_all(list(bench.CASES), scale=0.02, repeat=1)
+    assert set(results) == set(bench.CASES)
+    assert all(r["median_s"] > 0 for r in results.values())
+    assert (pipeline_log.RUNS_FILE, horizon_bot.REPO_DIR, git_safe.REPO_DIR,
+            horizon_bot.PAST_SCORES_FILE) == before
+
+
+def test_baselines_cover_every_case():
+    import json
+    recorded = json.loads(bench.BASELINES_FILE.read_text())["results"]
+    assert set(recorded) == set(bench.CASES)
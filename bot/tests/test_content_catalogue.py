@@ -0,0 +1,60 @@
+"""Shared content catalogue: lookups by slug, date and tag over every
+collection, plus a real-repo smoke test so a collection rename in
+src/content.config.ts can't silently empty a bot's view of the site.
+"""
+from datetime import date
+
+import pytest
+
+import content_catalogue
+
+
+@pytest.fixture
+def cat(tmp_path):
+    content = tmp_path / "content"
+    glossary = content / "glossary"
+    glossary.mkdir(parents=True)
+    (glossary / "agentic-loop.md").write_text(
+        '---\ntitle: "Agentic Loop"\ntags: [agents, "architecture"]\ndate: 2026-04-03\n---\n\nBody.\n')
+    (glossary / "llm.md").write_text(
+        '---\ntitle: "LLM"\ntags: [models]\ndate: 2026-05-01\n---\n\nBody.\n')
+    prompts = content / "prompts"
+    prompts.mkdir()
+    (prompts / "audit.md").write_text(
+        '---\ntitle: "Audit"\ncategory: "audit"\nprompt: |\n  title: not a real key\n'
+        '  More text.\ndraft: false\n---\n\nUsage.\n')
+    return content_catalogue.Catalogue(content, cache_dir=tmp_path / "cache")
+
+
+def test_parse_tags():
+    assert content_catalogue.parse_tags('[a, "b c", \'d\']') == ["a", "b c", "d"]
+    assert content_catalogue.parse_tags("") == []
+
+
+def test_by_slug_and_tag(cat):
+    assert cat.by_slug("glossary", "llm")["meta"]["title"] == "LLM"
+    assert cat.by_slug("glossary", "missing") is None
+    assert [e["slug"] for e in cat.by_tag("glossary", "architecture")] == ["agentic-loop"]
+
+
+def test_by_date_window(cat):
+    assert [e["slug"] for e in cat.by_date("glossary", start=date(2026, 4, 10))] == ["llm"]
+    assert [e["slug"] for e in cat.by_date("glossary", end=date(2026, 4, 10))] == ["agentic-loop"]
+
+
+def test_block_scalar_lines_do_not_shadow_keys(cat):
+    meta = cat.by_slug("prompts", "audit")["meta"]
+    assert meta["title"] == "Audit"
+    assert meta["category"] == "audit"
+
+
+def test_missing_collection_dir_is_empty(cat):
+    assert cat.entries("thoughts") == []
+    with pytest.raises(KeyError):
+        cat.entries("not-a-collection")
+
+
+def test_real_repo_collections_are_populated(tmp_path):
+    cat = content_catalogue.Catalogue(cache_dir=tmp_path)
+    for name in content_catalogue.COLLECTIONS:
+        assert cat.entries(name), name
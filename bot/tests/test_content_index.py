@@ -0,0 +1,59 @@
+"""Frontmatter index (content_index): the incremental refresh must only
+re-parse files whose mtime/size moved, and date-window queries must be
+answered from the index without opening non-matching files.
+"""
+import os
+from datetime import date
+
+import content_index
+
+
+def write(dir_path, name, day, title="T"):
+    p = dir_path / name
+    p.write_text(f'---\ntitle: "{title}"\ndate: {day}\n---\n\nBody for {name}.\n')
+    return p
+
+
+def test_refresh_reparses_only_changed_files(tmp_path):
+    content = tmp_path / "thoughts"
+    content.mkdir()
+    write(content, "a.md", "2026-06-01")
+    b = write(content, "b.md", "2026-06-20")
+    cache = tmp_path / "idx.json"
+
+    idx = content_index.FrontmatterIndex(content, cache).refresh()
+    assert idx.reparsed == 2
+
+    idx = content_index.FrontmatterIndex(content, cache).refresh()  # reloaded from disk
+    assert idx.reparsed == 0
+
+    write(content, "b.md", "2026-06-21", title="Changed title")
+    st = b.stat()
+    os.utime(b, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    idx.refresh()
+    assert idx.reparsed == 1
+    assert idx.files["b.md"]["meta"]["title"] == "Changed title"
+
+
+def test_removed_files_drop_out(tmp_path):
+    write(tmp_path, "a.md", "2026-06-01")
+    idx = content_index.FrontmatterIndex(tmp_path, tmp_path / "c" / "idx.json").refresh()
+    (tmp_path / "a.md").unlink()
+    assert idx.refresh().files == {}
+
+
+def test_between_filters_by_date_and_skips_undated(tmp_path):
+    write(tmp_path, "a.md", "2026-06-01")
+    write(tmp_path, "b.md", "2026-06-20")
+    write(tmp_path, "c.md", "not-a-date")
+    idx = content_index.FrontmatterIndex(tmp_path, tmp_path / "idx.json").refresh()
+    hits = idx.between(date(2026, 6, 10))
+    assert [p.name for p, _ in hits] == ["b.md"]
+    assert [p.name for p, _ in idx.between(None, date(2026, 6, 10))] == ["a.md"]
+
+
+def test_read_frontmatter_matches_full_parse(tmp_path):
+    p = write(tmp_path, "a.md", "2026-06-01", title="It's: fine")
+    assert content_index.read_frontmatter(p) == content_index.parse_frontmatter(p.read_text())
+    (tmp_path / "bare.md").write_text("no frontmatter here\n")
+    assert content_index.read_frontmatter(tmp_path / "bare.md") == {}
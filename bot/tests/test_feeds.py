@@ -0,0 +1,116 @@
+"""Tests for feeds.py: cadence learning, skip-when-unlikely-to-have-changed,
+conditional re-polls, per-feed telemetry and the run totals log_run gets.
+"""
+import json
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import feeds
+
+NOW = time.time()
+DAY = 86400
+
+
+def rss(n: int = 5, gap: float = DAY) -> bytes:
+    items = "".join(
+        f"<item><title>Post {i}</title><link>https://blog.test/{i}</link>"
+        f"<description>&lt;p&gt;Body {i}&lt;/p&gt;</description>"
+        f"<pubDate>{formatdate(NOW - i * gap)}</pubDate></item>" for i in range(n))
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Blog</title>{items}' \
+           f"</channel></rss>".encode()
+
+
+class Feed(BaseHTTPRequestHandler):
+    hits: list[str] = []
+
+    def do_GET(self):
+        Feed.hits.append(self.path)
+        if self.path == "/broken":
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = rss()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(feeds, "CACHE_FILE", tmp_path / "feeds.json")
+    Feed.hits = []
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Feed)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    feeds.take_report()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+
+
+def test_learn_cadence_and_change_probability():
+    assert feeds.learn_cadence([NOW, NOW - DAY]) is None
+    assert feeds.learn_cadence([NOW - i * DAY for i in range(6)]) == DAY
+    assert feeds.learn_cadence([NOW - i * 60 for i in range(6)]) == feeds.CADENCE_MIN_S
+    state = {"cadence_s": DAY, "last_ok": NOW, "entries": [{}]}
+    assert feeds.change_probability(state, NOW + DAY) == pytest.approx(0.632, abs=1e-3)
+    assert not feeds.should_poll(state, NOW + 3600)
+    assert feeds.should_poll(state, NOW + DAY)
+    assert feeds.should_poll({**state, "last_error": "HTTP 500"}, NOW + 60)
+    assert feeds.should_poll({"entries": [{}], "last_ok": NOW}, NOW + 60)  # cadence unknown
+
+
+def test_skips_then_polls_conditionally(server):
+    url = f"{server}/feed"
+    first = feeds.fetch_entries([url], limit=3, now=NOW)
+    assert [e["title"] for e in first] == ["Post 0", "Post 1", "Post 2"]
+    assert first[0]["source"] == "Blog" and first[0]["published_ts"]
+
+    # An hour later a daily feed has a ~4% chance of news: served from cache.
+    assert feeds.fetch_entries([url], limit=3, now=NOW + 3600) == first
+    assert len(Feed.hits) == 1
+
+    # Two days on it is polled, with If-None-Match; the 304 reuses the cache.
+    assert feeds.fetch_entries([url], limit=3, now=NOW + 2 * DAY) == first
+    assert len(Feed.hits) == 2
+    assert feeds.take_report() == {"polled": 2, "skipped": 1, "not_modified": 1,
+                                   "failed": 0, "bytes": len(rss())}
+
+    log = json.loads(feeds.CACHE_FILE.read_text())[url]["log"]
+    assert [r["polled"] for r in log] == [True, False, True]
+    assert log[0]["status"] == 200 and log[0]["entries"] == 5 and log[0]["bytes"] > 0
+    assert log[0]["newest_age_h"] == 0.0
+    assert log[2]["status"] == 304
+
+
+def test_validators_are_not_sent_without_cached_entries(server):
+    url = f"{server}/feed"
+    # An ETag left behind with no entries (cache trimmed, or the last parse
+    # failed): a 304 here would leave the feed empty, so poll unconditionally.
+    feeds.CACHE_FILE.write_text(json.dumps({url: {"etag": '"v1"', "entries": []}}))
+    entries = feeds.fetch_entries([url], limit=3, now=NOW)
+    assert [e["title"] for e in entries] == ["Post 0", "Post 1", "Post 2"]
+    assert json.loads(feeds.CACHE_FILE.read_text())[url]["log"][-1]["status"] == 200
+
+
+def test_failures_are_recorded_and_retried(server):
+    urls = [f"{server}/broken", f"{server}/feed"]
+    entries = feeds.fetch_entries(urls, limit=2, now=NOW)
+    assert len(entries) == 2  # the healthy feed still contributes
+    state = json.loads(feeds.CACHE_FILE.read_text())[urls[0]]
+    assert state["log"][-1]["error"].startswith("HTTPStatusError")
+    feeds.fetch_entries(urls, limit=2, now=NOW + 60)
+    assert Feed.hits.count("/broken") == 2 and Feed.hits.count("/feed") == 1
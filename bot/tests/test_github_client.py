@@ -0,0 +1,102 @@
+"""github_client against a local fake GitHub: open-PR listings are
+ETag-conditional (an unchanged list is a 304 served from the cache file),
+and horizon's pending-proposal dedup parses bodies through it.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import github_client
+import horizon_bot as bot
+
+
+class FakeGitHub(BaseHTTPRequestHandler):
+    pulls: list[dict] = []
+    log: list[tuple] = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload=None, etag=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        etag = f'"{len(self.pulls)}"'
+        inm = self.headers.get("If-None-Match")
+        self.log.append(("GET", self.path, inm, self.headers.get("Authorization")))
+        if inm == etag:
+            return self._send(304)
+        self._send(200, self.pulls, etag)
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.log.append(("POST", self.path, payload))
+        if self.path.endswith("/pulls"):
+            n = len(self.pulls) + 1
+            pr = {"number": n, "html_url": f"https://github.test/o/r/pull/{n}",
+                  "head": {"ref": payload["head"]}, "title": payload["title"],
+                  "body": payload["body"]}
+            self.pulls.insert(0, pr)
+            return self._send(201, pr)
+        self._send(201, {"id": 1})
+
+
+@pytest.fixture
+def server():
+    FakeGitHub.pulls, FakeGitHub.log = [], []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHub)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+def make_client(server, tmp_path):
+    return github_client.GitHubClient("o/r", token="t0k", api_url=server,
+                                      cache_file=tmp_path / "etags.json")
+
+
+def test_listing_is_conditional_and_cache_survives_restart(server, tmp_path):
+    gh = make_client(server, tmp_path)
+    created = gh.create_pull("t", "b", head="horizon-bot/proposals-2026-10-19")
+    assert created["url"].endswith("/pull/1")
+    assert gh.find_open_pull("horizon-bot/proposals-2026-10-19")["number"] == 1
+    assert gh.find_open_pull("other") is None
+    assert gh.stats["not_modified"] == 1  # second lookup was a 304
+
+    again = make_client(server, tmp_path)
+    assert again.open_pulls_with_prefix("horizon-bot/")[0]["body"] == "b"
+    assert again.stats == {"requests": 1, "not_modified": 1}
+    assert FakeGitHub.log[-1][2] == '"1"'
+    assert FakeGitHub.log[-1][3] == "Bearer t0k"
+
+
+def test_errors_raise_github_error(tmp_path):
+    gh = github_client.GitHubClient("o/r", token="", api_url="http://127.0.0.1:9",
+                                    cache_file=None)
+    with pytest.raises(github_client.GitHubError):
+        gh.open_pulls()
+
+
+def test_pending_proposals_parse_bodies(server, tmp_path, monkeypatch):
+    gh = make_client(server, tmp_path)
+    gh.create_pull("roster", "- **Not horizon** (high, models)", head="model-bot/roster-proposals")
+    gh.create_pull("h", "## Horizon bot proposals\n\n"
+                        "- **Agents at work** (medium, agents, bogus) — 3 sources",
+                   head="horizon-bot/proposals-2026-10-19")
+    monkeypatch.setattr(github_client, "_client", gh)
+    assert bot.load_pending_proposals() == [{"title": "Agents at work", "themes": ["agents"]}]
+
+
+def test_repo_slug_from_env(monkeypatch):
+    monkeypatch.setenv("GITHUB_REPOSITORY", "a/b")
+    assert github_client.resolve_repo() == "a/b"
+    assert github_client._REMOTE_SLUG.search("git@github.com:a/b.git").group(1) == "a/b"
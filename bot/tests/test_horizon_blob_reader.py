@@ -0,0 +1,74 @@
+"""parse_scenario_diff streams both sides of every scenarios commit through
+one `git cat-file --batch` process instead of two `git show` forks each.
+"""
+import json
+import subprocess
+
+import pytest
+
+import horizon_bot as bot
+
+
+def git(repo, *args):
+    return subprocess.run(["git", "-C", str(repo), *args], check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+def commit_scenarios(repo, payload, msg):
+    f = repo / bot.SCENARIOS_PATH
+    f.parent.mkdir(parents=True, exist_ok=True)
+    f.write_text(json.dumps(payload))
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", msg)
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    r = tmp_path / "repo"
+    r.mkdir()
+    git(r, "init", "-q")
+    git(r, "config", "user.email", "t@example.com")
+    git(r, "config", "user.name", "t")
+    monkeypatch.setattr(bot, "REPO_DIR", r)
+    return r
+
+
+def test_one_process_serves_many_reads(repo):
+    first = commit_scenarios(repo, [{"id": "agi", "pragmatic": {"year": 2030}}], "add")
+    second = commit_scenarios(repo, [{"id": "agi", "pragmatic": {"year": 2032}}], "slip")
+    with bot.GitBlobReader() as blobs:
+        assert bot.parse_scenario_diff(first, blobs) == []  # no parent blob
+        changes = bot.parse_scenario_diff(second, blobs)
+        pid = blobs._proc.pid
+        assert blobs.read(f"{second}:does/not/exist") is None
+        assert blobs._proc.pid == pid
+        assert blobs.reads == 3
+    assert changes == [{"horizon": "agi", "stance": "pragmatic", "from": 2030,
+                        "to": 2032, "delta_months": 24}]
+    assert blobs._proc is None
+
+
+def test_without_shared_reader(repo):
+    commit_scenarios(repo, [{"id": "agi", "pragmatic": {"year": 2030}}], "add")
+    sha = commit_scenarios(repo, [{"id": "agi", "pragmatic": {"year": 2030}}, {"id": "x"}], "add x")
+    assert bot.parse_scenario_diff(sha) == []
+
+
+def test_malformed_side_returns_none(repo):
+    commit_scenarios(repo, [], "empty")
+    (repo / bot.SCENARIOS_PATH).write_text("{not json")
+    git(repo, "commit", "-qam", "broken")
+    assert bot.parse_scenario_diff(git(repo, "rev-parse", "HEAD")) is None
+
+
+def test_stalled_read_times_out_and_restarts(repo, monkeypatch):
+    sha = commit_scenarios(repo, [], "empty")
+    blobs = bot.GitBlobReader(timeout=0.5)
+    monkeypatch.setattr(blobs, "_proc", subprocess.Popen(
+        ["sleep", "30"], stdin=subprocess.PIPE, stdout=subprocess.PIPE))
+    with pytest.raises(TimeoutError):
+        blobs.read(f"{sha}:{bot.SCENARIOS_PATH}")
+    assert blobs._proc is None
+    assert blobs.read(f"{sha}:{bot.SCENARIOS_PATH}") == b"[]"
+    blobs.close()
@@ -0,0 +1,89 @@
+"""Deterministic near-duplicate filter for Now proposals (backstop for
+prompt rule 3). Fixtures are the recycled pair that actually shipped in
+now.json: the June CLI-agent entry re-proposed the earlier terminal one.
+"""
+import horizon_bot as bot
+import similarity
+
+TERMINAL = {
+    "id": "now-2026-06-terminal-agents-replace-chat",
+    "title": "Command-line interfaces become the preferred agent interaction pattern",
+    "themes": ["agents", "interfaces"],
+    "why_it_matters": "Chat interfaces are proving inadequate for complex AI agent "
+                      "workflows. Terminal-style interactions force precision and "
+                      "enable proper operational control.",
+}
+RECYCLED = {
+    "id": "now-2026-06-cli-agent-takeover",
+    "title": "Command-line agents force operational complexity onto developers",
+    "themes": ["agents", "interfaces", "work"],
+    "why_it_matters": "AI agents are gravitating towards command-line interfaces "
+                      "because they force clarity, but this dumps decades of system "
+                      "administration complexity directly onto developers. The "
+                      "terminal is becoming the preferred agent interaction layer.",
+}
+DISTINCT = {
+    "id": "now-2026-10-chip-export-controls",
+    "title": "Chip export controls reshape where frontier models get trained",
+    "themes": ["chips", "regulation"],
+    "why_it_matters": "Training capacity is moving to jurisdictions outside the controls.",
+}
+
+
+# Unrelated live entries, so IDF has a corpus to weigh terms against.
+BACKGROUND = [
+    {"id": "now-2026-04-agent-production-ops",
+     "title": "The agent production-ops layer is crystallising",
+     "themes": ["agents", "infrastructure", "enterprise"]},
+    {"id": "now-2026-04-tool-calling-protocols",
+     "title": "Tool-calling and agent-messaging protocols are hardening into infrastructure",
+     "themes": ["agents", "infrastructure"]},
+    {"id": "now-2026-05-remote-agents-cloud-first",
+     "title": "Remote AI agents shift development from local to cloud-first",
+     "themes": ["agents", "infrastructure"]},
+    {"id": "now-2026-05-voice-ai-crosses-realtime-barrier",
+     "title": "Voice AI crosses the real-time interaction barrier",
+     "themes": ["interfaces", "models"]},
+    {"id": "now-2026-05-spec-driven-ai-development",
+     "title": "Specification-driven development becomes the production standard for AI agents",
+     "themes": ["code", "agents"]},
+    {"id": "now-2026-05-real-time-interfaces",
+     "title": "Real-time interaction becomes the new baseline for AI interfaces",
+     "themes": ["interfaces", "models"]},
+    {"id": "now-2026-06-model-repos-security-crisis",
+     "title": "AI model repositories face systematic security contamination",
+     "themes": ["security", "models", "infrastructure"]},
+    {"id": "now-2026-06-agentic-loops-become-ops-liability",
+     "title": "Continuous agent loops shift from product feature to operational liability",
+     "themes": ["agents", "infrastructure", "security"]},
+]
+
+
+def test_identical_text_scores_one():
+    index = similarity.SimilarityIndex()
+    index.add("a", similarity.entry_text(TERMINAL))
+    assert abs(index.nearest(similarity.entry_text(TERMINAL))[1] - 1.0) < 1e-9
+    assert similarity.SimilarityIndex().nearest(["x"]) == (None, 0.0)
+
+
+def test_reworded_reproposal_is_dropped():
+    index = bot.build_now_index([TERMINAL], BACKGROUND, [])
+    kept = bot.drop_duplicate_proposals([RECYCLED, DISTINCT], index)
+    assert [p["id"] for p in kept] == [DISTINCT["id"]]
+
+
+def test_pending_and_in_batch_duplicates_are_dropped():
+    pending = [{"title": TERMINAL["title"], "themes": TERMINAL["themes"]}]
+    index = bot.build_now_index([], [], pending)
+    assert bot.drop_duplicate_proposals([TERMINAL], index) == []
+
+    index = bot.build_now_index([], [], [])
+    assert bot.drop_duplicate_proposals([DISTINCT, dict(DISTINCT, id="x")], index) == [DISTINCT]
+
+
+def test_collapse_pending_keeps_first_of_each_signal():
+    a = {"title": TERMINAL["title"], "themes": TERMINAL["themes"]}
+    b = {"title": "Command-line interfaces become the preferred pattern for agents",
+         "themes": ["agents", "interfaces"]}
+    c = {"title": DISTINCT["title"], "themes": DISTINCT["themes"]}
+    assert bot.collapse_pending([a, b, c]) == [a, c]
@@ -0,0 +1,69 @@
+"""horizon_bot.main() runs the Claude job alongside the deterministic jobs
+and git-log walks, and only writes staging, opens the PR and commits once
+both sides have finished.
+"""
+import sys
+import threading
+import time
+
+import horizon_bot as bot
+
+DELAY = 0.3
+
+
+class FakeArchive:
+    stats = {}
+
+    def save(self):
+        pass
+
+
+def test_model_call_overlaps_deterministic_jobs(monkeypatch, capsys):
+    events = []
+    main_thread = threading.get_ident()
+
+    def slow(name, result):
+        def fn(*args, **kwargs):
+            events.append((name, threading.get_ident() == main_thread))
+            time.sleep(DELAY)
+            events.append((f"{name} done", None))
+            return result
+        return fn
+
+    def record(name, result=None):
+        def fn(*args, **kwargs):
+            events.append((name, None))
+            return result
+        return fn
+
+    monkeypatch.setattr(sys, "argv", ["horizon_bot.py"])
+    monkeypatch.setattr(bot, "load_lane", lambda name: [])
+    monkeypatch.setattr(bot, "load_recent_radar", lambda days: [{"name": "x"}])
+    monkeypatch.setattr(bot, "load_recent_markdown", lambda *a, **k: [])
+    monkeypatch.setattr(bot, "run_now_job", slow("model", ([{"id": "now-x"}], None)))
+    monkeypatch.setattr(bot, "flag_next_shifts", slow("next", []))
+    monkeypatch.setattr(bot, "score_past_candidates", record("past", []))
+    monkeypatch.setattr(bot.radar_archive, "get", lambda: FakeArchive())
+    monkeypatch.setattr(bot, "build_shifts_log", slow("shifts", []))
+    monkeypatch.setattr(bot, "enrich_scenario_shifts", record("enrich", ([], 0)))
+    monkeypatch.setattr(bot, "write_staging", record("staging"))
+    monkeypatch.setattr(bot, "create_proposal_pr", record("pr"))
+    monkeypatch.setattr(bot, "write_shifts_log", record("write shifts", False))
+    monkeypatch.setattr(bot, "post_to_discord", record("discord"))
+    monkeypatch.setattr(bot, "_log_run", record("log"))
+    monkeypatch.setattr(bot, "commit_shifts", record("commit"))
+    monkeypatch.setattr(bot, "ping_healthcheck", record("ping"))
+
+    t0 = time.time()
+    bot.main()
+    elapsed = time.time() - t0
+
+    names = [name for name, _ in events]
+    assert dict(events)["model"] is False      # worker thread
+    assert dict(events)["next"] is True        # main thread
+    assert elapsed < 3 * DELAY                 # serial would be 3 x DELAY
+    first_write = names.index("staging")
+    assert names.index("model done") < first_write
+    assert names.index("shifts done") < first_write
+    assert names.index("pr") < names.index("commit")
+    assert "[horizon_bot] Overlap: model 0.3s" in capsys.readouterr().out
@@ -0,0 +1,58 @@
+"""Incremental Past scoring: per-day scores are memoized by day-file hash,
+and invalidated when the day-file or HORIZON_THEMES changes. A memoized run
+must return exactly what a cold run returns.
+"""
+import json
+from datetime import date, timedelta
+
+import pytest
+
+import horizon_bot as bot
+import radar_archive
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    radar = tmp_path / "radar"
+    radar.mkdir()
+    old = (date.today() - timedelta(days=bot.PAST_MIN_AGE_DAYS + 5)).isoformat()
+    fresh = date.today().isoformat()
+    (radar / f"{old}.json").write_text(json.dumps({"featured": [
+        {"name": "Agent Kit", "description": "agents for code and data"},
+        {"name": "Plain", "description": "nothing thematic"},
+    ]}))
+    (radar / f"{fresh}.json").write_text(json.dumps({"featured": [{"name": "Too new"}]}))
+    a = radar_archive.RadarArchive(radar, tmp_path / "cache")
+    monkeypatch.setattr(radar_archive, "_archive", a)
+    monkeypatch.setattr(bot, "PAST_SCORES_FILE", tmp_path / "past-scores.json")
+    return a, radar, old
+
+
+def test_scores_and_age_cutoff(archive):
+    _, _, old = archive
+    out = bot.score_past_candidates([])
+    assert [(c["name"], c["score"]) for c in out] == [("Agent Kit", 5), ("Plain", 2)]
+    assert all(c["radar_date"] == old for c in out)
+
+
+def test_second_run_is_memoized(archive):
+    a, _, _ = archive
+    cold = bot.score_past_candidates([])
+    parsed = a.stats["parsed"]
+    warm = bot.score_past_candidates([])
+    assert warm == cold
+    assert a.stats["parsed"] == parsed
+    assert json.loads(bot.PAST_SCORES_FILE.read_text())["days"]
+
+
+def test_theme_change_invalidates(archive, monkeypatch):
+    bot.score_past_candidates([])
+    monkeypatch.setattr(bot, "HORIZON_THEMES", bot.HORIZON_THEMES - {"agents"})
+    assert bot.load_past_scores()["days"] == {}
+    out = bot.score_past_candidates([])
+    assert out[0]["score"] == 4
+
+
+def test_existing_origin_days_are_skipped(archive):
+    _, _, old = archive
+    assert bot.score_past_candidates([{"origin": {"ref": old}}]) == []
@@ -0,0 +1,77 @@
+"""Incremental shift log: after a cursor exists, a run parses only new
+commits, and the result must equal a full rebuild. Scenario diffs are
+memoized per sha so immutable commits are never re-diffed.
+"""
+import json
+import subprocess
+
+import pytest
+
+import horizon_bot as bot
+
+
+def git(repo, *args):
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+def commit(repo, name, payload, msg):
+    f = repo / "src" / "data" / "horizon" / name
+    f.parent.mkdir(parents=True, exist_ok=True)
+    f.write_text(json.dumps(payload))
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", msg)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    r = tmp_path / "repo"
+    r.mkdir()
+    git(r, "init", "-q")
+    git(r, "config", "user.email", "t@example.com")
+    git(r, "config", "user.name", "t")
+    commit(r, "now.json", [1], "first now")
+    commit(r, "next.json", [1], "first next")
+    monkeypatch.chdir(r)  # restored on teardown; build_shifts_log chdirs too
+    monkeypatch.setattr(bot, "REPO_DIR", r)
+    monkeypatch.setattr(bot, "SHIFTS_CURSOR_FILE", tmp_path / "cursor.json")
+    monkeypatch.setattr(bot, "SCENARIO_DIFFS_FILE", tmp_path / "diffs.json")
+    return r
+
+
+def test_incremental_matches_full_rebuild(repo):
+    first = bot.build_shifts_log()
+    assert [s["subject"] for s in first] == ["first next", "first now"]
+    commit(repo, "now.json", [1, 2], "second now")
+    incremental = bot.build_shifts_log()
+    assert incremental[0]["subject"] == "second now"
+    assert incremental == bot.build_shifts_log(full_rebuild=True)
+    assert all("_ci" not in s for s in incremental)
+
+
+def test_rewritten_history_falls_back_to_full(repo):
+    bot.build_shifts_log()
+    git(repo, "reset", "-q", "--hard", "HEAD~1")
+    commit(repo, "past.json", [1], "rewritten")
+    shifts = bot.build_shifts_log()
+    assert [s["subject"] for s in shifts] == ["rewritten", "first now"]
+
+
+def test_scenario_diffs_are_memoized(repo, monkeypatch):
+    calls = []
+    monkeypatch.setattr(bot, "parse_scenario_diff",
+                        lambda sha, blobs=None: calls.append(sha) or [{"horizon": "h"}])
+    shifts = [{"lane": "scenarios", "sha": "abc"}, {"lane": "now", "sha": "def"}]
+    first, n = bot.enrich_scenario_shifts(shifts)
+    second, _ = bot.enrich_scenario_shifts(shifts)
+    assert calls == ["abc"]
+    assert first == second and n == 1
+    assert first[0]["changes"] == [{"horizon": "h"}]
+
+
+def test_failed_diffs_are_retried(repo, monkeypatch):
+    calls = []
+    monkeypatch.setattr(bot, "parse_scenario_diff", lambda sha, blobs=None: calls.append(sha))
+    shifts = [{"lane": "scenarios", "sha": "abc"}]
+    bot.enrich_scenario_shifts(shifts)
+    bot.enrich_scenario_shifts(shifts)
+    assert calls == ["abc", "abc"]
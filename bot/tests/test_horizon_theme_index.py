@@ -0,0 +1,39 @@
+"""ThemeIndex must reproduce the old per-entry `needle in text` scan
+exactly, including needles that overlap at the same position ("data" inside
+"database") and underscore themes matched with spaces.
+"""
+import horizon_bot as bot
+
+RADAR = [
+    {"name": "Database agent", "description": "", "_radar_date": "2026-06-01"},
+    {"name": "Chip fab", "description": "new CHIPS plant", "_radar_date": "2026-06-02"},
+    {"name": "Code review bot", "description": "", "_radar_date": "2026-06-03"},
+]
+THOUGHTS = [{"slug": "2026-06-04-x", "title": "Open data wins", "summary": "and ai safety too"}]
+
+
+def test_prefix_overlap_credits_both_needles():
+    idx = bot.ThemeIndex({"data", "database", "base"}, RADAR, THOUGHTS)
+    assert idx.radar["data"] == {0}
+    assert idx.radar["database"] == {0}
+    assert idx.radar["base"] == {0}
+    assert idx.thoughts["data"] == {0}
+
+
+def test_lookup_preserves_item_order():
+    idx = bot.ThemeIndex({"code", "chips", "agent"}, RADAR, THOUGHTS)
+    assert idx.lookup(idx.radar, {"code", "chips", "agent"}) == [0, 1, 2]
+
+
+def test_flags_match_underscore_themes_and_skip_known_refs():
+    entries = [{"id": "next-x", "themes": ["data", "ai_safety"],
+                "evidence": [{"ref": "2026-06-03"}]}]
+    radar = RADAR + [{"name": "Data lake", "description": "", "_radar_date": "2026-06-05"}]
+    flags = bot.flag_next_shifts(entries, radar, THOUGHTS)
+    refs = [e["ref"] for e in flags[0]["new_supporting_evidence"]]
+    assert refs == ["2026-06-01", "2026-06-05", "2026-06-04-x"]
+
+
+def test_below_threshold_is_not_flagged():
+    entries = [{"id": "next-y", "themes": ["robotics"]}]
+    assert bot.flag_next_shifts(entries, RADAR, THOUGHTS) == []
@@ -0,0 +1,97 @@
+"""Tests for http_pool.py: repeat requests reuse one keep-alive connection,
+DNS answers are cached, and log_run reports the reuse counters.
+"""
+import asyncio
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import http_pool
+import pipeline_log
+
+
+class Ok(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Ok)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://localhost:{srv.server_address[1]}"
+    srv.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool(monkeypatch):
+    monkeypatch.setattr(http_pool, "_client", None)
+    monkeypatch.setattr(http_pool, "_dns", {})
+    monkeypatch.setenv("SOFTCAT_HTTP2", "0")
+    http_pool.take_stats()
+
+
+def test_repeat_requests_reuse_one_connection(server):
+    for _ in range(5):
+        assert http_pool.get(f"{server}/search", purpose="api").json() == {"ok": True}
+    stats = http_pool.take_stats()
+    assert stats["requests"] == 5
+    assert stats["connections"] == 1
+    assert stats["reused"] == 4
+    assert stats["dns_misses"] == 1
+    assert http_pool.take_stats()["requests"] == 0  # reset after reading
+
+
+def test_dns_answers_are_cached(monkeypatch):
+    calls = []
+    real = socket.getaddrinfo
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return real(*args, **kwargs)
+    monkeypatch.setattr(socket, "getaddrinfo", counting)
+    assert http_pool.resolve("localhost", 80) == http_pool.resolve("localhost", 80)
+    assert http_pool.resolve("127.0.0.1", 80) == ["127.0.0.1"]
+    assert calls == ["localhost"]
+    stats = http_pool.take_stats()
+    assert (stats["dns_hits"], stats["dns_misses"]) == (1, 1)
+
+
+def test_unresolvable_host_is_a_connect_error():
+    import httpx
+    with pytest.raises(httpx.ConnectError):
+        http_pool.get("http://no-such-host.invalid/", purpose="ping")
+
+
+def test_async_client_shares_the_counters(server):
+    async def run():
+        async with http_pool.async_client("verify") as client:
+            for _ in range(3):
+                await client.get(f"{server}/x")
+    asyncio.run(run())
+    stats = http_pool.take_stats()
+    assert (stats["requests"], stats["connections"]) == (3, 1)
+
+
+def test_log_run_attaches_reuse_stats(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline_log, "RUNS_FILE", tmp_path / "runs.json")
+    http_pool.get(f"{server}/a")
+    http_pool.get(f"{server}/b")
+    pipeline_log.log_run("radar_bot")
+    pipeline_log.log_run("radar_bot")
+    first, second = json.loads((tmp_path / "runs.json").read_text())
+    assert first["http"]["requests"] == 2 and first["http"]["reused"] == 1
+    assert "http" not in second
@@ -0,0 +1,48 @@
+"""Cold-import budget for bot entry points (`python -X importtime`).
+
+Importing a bot must not pull in anthropic (~1.7s cold), feedparser or
+dotenv: they load on first use, so paths that never call Claude or read a
+feed (model_data_bot, the tool verify job, `git_safe.py --check` from
+auto-build.sh) don't pay for them. The time budget is loose on purpose;
+the forbidden-module check is the precise one.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BOT_DIR = Path(__file__).parent.parent
+
+ENTRY_POINTS = [
+    "ai_news_digest", "ai_thoughts_bot", "horizon_bot", "model_data_bot",
+    "prompt_library_bot", "radar_bot", "tool_of_the_week", "git_safe", "runner",
+]
+LAZY = {"anthropic", "feedparser", "dotenv"}
+BUDGET_US = 600_000  # cumulative cold import of the entry point itself
+
+
+def cold_import(module: str) -> tuple[int, set[str]]:
+    """(cumulative import µs of `module`, top-level packages it imported)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BOT_DIR, capture_output=True, text=True, check=True,
+    )
+    total, loaded = 0, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if not cumulative.isdigit():
+            continue  # header row
+        loaded.add(name.split(".")[0])
+        if name == module:
+            total = int(cumulative)
+    return total, loaded
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_point_import_budget(module):
+    total, loaded = cold_import(module)
+    assert not loaded & LAZY, f"{module} imports {sorted(loaded & LAZY)} eagerly"
+    assert 0 < total < BUDGET_US, f"{module} cold import took {total / 1000:.0f}ms"
@@ -0,0 +1,64 @@
+"""Columnar model history (models-history.json): appends must be deduped,
+kept sorted, and range-queryable, and the trend file must only summarise
+what actually landed (suspects never show up as a price move on the site).
+"""
+import model_history as mh
+
+BASE = {"id": "anthropic/claude-sonnet-4", "name": "Claude Sonnet 4.5",
+        "contextK": 200, "inputPrice": 3, "outputPrice": 15, "multimodal": False}
+
+
+def empty():
+    return {"version": 1, "series": {}}
+
+
+def test_first_change_seeds_baseline():
+    store = empty()
+    assert mh.append_point(store, "m", "inputPrice", "2026-10-01", 3, 3.5, mh.ACCEPTED)
+    col = store["series"]["m"]["inputPrice"]
+    assert col == {"t": ["2026-10-01", "2026-10-01"], "v": [3, 3.5], "k": ["b", "a"]}
+
+
+def test_repeated_suspect_recorded_once():
+    store = empty()
+    assert mh.append_point(store, "m", "contextK", "2026-10-01", 200, 1000, mh.SUSPECT)
+    assert not mh.append_point(store, "m", "contextK", "2026-10-02", 200, 1000, mh.SUSPECT)
+    assert store["series"]["m"]["contextK"]["k"] == ["b", "s"]
+
+
+def test_range_query_bisects_and_filters_kind():
+    store = empty()
+    for day, v in [("2026-01-01", 4), ("2026-02-01", 5), ("2026-03-01", 6)]:
+        mh.append_point(store, "m", "inputPrice", day, 3, v, mh.ACCEPTED)
+    mh.append_point(store, "m", "inputPrice", "2026-02-15", 6, 60, mh.SUSPECT)
+    pts = mh.query(store, "m", "inputPrice", "2026-01-15", "2026-03-01")
+    assert pts == [("2026-02-01", 5), ("2026-03-01", 6)]
+    assert mh.query(store, "m", "inputPrice", kinds=(mh.SUSPECT,)) == [("2026-02-15", 60)]
+    assert mh.query(store, "missing", "inputPrice") == []
+
+
+def test_diff_changes_recovers_accepted_and_suspects():
+    updated = [dict(BASE, inputPrice=3.5)]
+    suspects = [{"id": BASE["id"], "field": "contextK", "current": 200, "proposed": 1000}]
+    changes = mh.diff_changes([dict(BASE)], updated, suspects)
+    assert {(c["field"], c["kind"]) for c in changes} == {("inputPrice", "a"), ("contextK", "s")}
+
+
+def test_trends_ignore_suspect_only_series():
+    store = empty()
+    mh.append_point(store, "m", "inputPrice", "2026-01-01", 4, 5, mh.ACCEPTED)
+    mh.append_point(store, "m", "contextK", "2026-01-01", 200, 1000, mh.SUSPECT)
+    trends = mh.build_trends(store)
+    assert set(trends["m"]) == {"inputPrice"}
+    assert trends["m"]["inputPrice"]["change_pct"] == 25.0
+
+
+def test_record_writes_store_and_trends(tmp_path, monkeypatch):
+    monkeypatch.setattr(mh, "HISTORY_FILE", tmp_path / "h.json")
+    monkeypatch.setattr(mh, "TRENDS_FILE", tmp_path / "t.json")
+    n = mh.record([dict(BASE)], [dict(BASE, outputPrice=16)], [], when="2026-10-19")
+    assert n == 1
+    assert mh.load_store()["series"][BASE["id"]]["outputPrice"]["v"] == [15, 16]
+    assert (tmp_path / "t.json").exists()
+    # same run again appends nothing
+    assert mh.record([dict(BASE)], [dict(BASE, outputPrice=16)], [], when="2026-10-20") == 0
@@ -0,0 +1,64 @@
+"""Tests for normalize.py: markup, tracking pixels and platform footers
+are gone, truncation happens after cleaning, and the before/after token
+report is kept for log_run.
+"""
+import normalize
+
+WORDPRESS = (
+    '<figure class="wp-block-image"><img src="https://cdn.test/hero.jpg" alt="hero" '
+    'width="1200" height="630" /><figcaption>Photo: Vendor</figcaption></figure>'
+    '<p>Acme released <strong>Widget&nbsp;2</strong>, an open-weights model for '
+    '<a href="https://acme.test/?utm_source=rss&amp;utm_medium=rss">on-device agents</a>.'
+    '</p>\n<p>It runs in 4&#8239;GB of RAM.</p>'
+    '<img src="https://feeds.feedblitz.com/~/i/123/0/acme" height="1" width="1" alt=""/>'
+    '<p>The post <a href="https://news.test/widget-2">Acme ships Widget 2</a> appeared '
+    'first on <a href="https://news.test">News Test</a>.</p>'
+)
+
+
+def test_clean_text_drops_markup_and_footer():
+    text = normalize.strip_boilerplate(normalize.clean_text(WORDPRESS))
+    assert text == ("Acme released Widget 2, an open-weights model for "
+                    "on-device agents. It runs in 4 GB of RAM.")
+
+
+def test_plain_text_passes_through():
+    assert normalize.clean_text("  Already   plain\n\n text ") == "Already plain text"
+    assert normalize.strip_boilerplate("Big launch today. Continue reading →") == "Big launch today."
+
+
+def test_footer_words_inside_prose_are_kept():
+    for text in ("The FTC is now seeking public comments",
+                 "Users can read more files at once with the new context window…",
+                 "Widget ships. Read more: the docs explain it. Then more."):
+        assert normalize.strip_boilerplate(text) == text
+    assert normalize.strip_boilerplate("Widget ships. Read more at TechCrunch »") == "Widget ships."
+    assert normalize.strip_boilerplate("Widget ships. 12 Comments") == "Widget ships."
+
+def test_truncate_cuts_at_a_word_after_cleaning():
+    text = "word " * 200
+    cut = normalize.truncate(text.strip(), 50)
+    assert len(cut) <= 51 and cut.endswith("word…")
+
+
+def test_estimate_tokens_is_in_the_right_range():
+    prose = ("Anthropic released a new model today with a longer context window "
+             "and lower prices for developers building agents.")
+    assert 18 <= normalize.estimate_tokens(prose) <= 26
+    assert normalize.estimate_tokens(WORDPRESS) > 3 * normalize.estimate_tokens(
+        normalize.clean_text(WORDPRESS))
+
+
+def test_normalize_entries_reports_savings():
+    normalize.take_report()
+    entries = [{"title": "Acme &amp; Co ship Widget 2", "summary": WORDPRESS,
+                "link": "https://news.test/widget-2", "source": "News Test"}] * 10
+    out = normalize.normalize_entries(entries, max_chars=500)
+    assert out[0]["title"] == "Acme & Co ship Widget 2"
+    assert out[0]["link"] == entries[0]["link"]
+    assert out[0]["tokens"] == (normalize.estimate_tokens(out[0]["title"])
+                                + normalize.estimate_tokens(out[0]["summary"]))
+
+    report = normalize.take_report()
+    assert report["entries"] == 10
+    assert report["tokens_after"] < report["tokens_before"] / 2
@@ -0,0 +1,133 @@
+"""Tests for outbox.py: enqueue never touches the network, drain batches
+Discord posts and supersedes stale pings, and failed deliveries back off
+and are retried on a later drain.
+"""
+import fcntl
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+import outbox
+
+HOOK = "https://discord.example.test/api/webhooks/1/abc"
+CHECK = "https://hc.example.test/ping/uuid"
+T0 = datetime(2026, 10, 19, 9, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def tmp_outbox(tmp_path, monkeypatch):
+    monkeypatch.setattr(outbox, "OUTBOX_FILE", tmp_path / "outbox.json")
+    monkeypatch.setenv("SOFTCAT_OUTBOX_NO_KICK", "1")
+
+
+def client(responder):
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return responder(request)
+    return httpx.Client(transport=httpx.MockTransport(handler)), sent
+
+
+def by_id() -> dict:
+    return {m["id"]: m for m in outbox.load()}
+
+
+def test_drain_batches_discord_and_sends_only_the_latest_ping():
+    a = outbox.discord(HOOK, "first", username="SOFT CAT Radar", source="radar_bot")
+    b = outbox.discord(HOOK, "second", username="SOFT CAT Radar", source="radar_bot")
+    old = outbox.ping(CHECK, source="radar_bot")
+    new = outbox.ping(CHECK, status="fail", source="radar_bot")
+    http, sent = client(lambda r: httpx.Response(204))
+
+    stats = outbox.drain(http, now=T0)
+
+    assert stats == {"delivered": 3, "retry": 0, "dead": 0, "requests": 2}
+    assert [r.method for r in sent] == ["POST", "GET"]
+    assert b'"first\\n\\nsecond"' in sent[0].content
+    assert str(sent[1].url) == f"{CHECK}/fail"
+    msgs = by_id()
+    assert all(msgs[i]["status"] == "delivered" and msgs[i]["delivered_at"] for i in (a, b, new))
+    assert msgs[old]["status"] == "superseded"
+    assert outbox.drain(http, now=T0)["requests"] == 0
+
+
+def test_discord_batches_respect_the_length_limit():
+    for _ in range(3):
+        outbox.discord(HOOK, "x" * 900, username="SOFT CAT Radar")
+    http, sent = client(lambda r: httpx.Response(204))
+    outbox.drain(http, now=T0)
+    assert len(sent) == 2
+
+
+def test_failures_back_off_and_retry_on_a_later_drain():
+    msg = outbox.discord(HOOK, "hello", username="SOFT CAT Horizon")
+    down, _ = client(lambda r: httpx.Response(503))
+    assert outbox.drain(down, now=T0)["retry"] == 1
+    queued = by_id()[msg]
+    assert queued["attempts"] == 1 and queued["last_error"] == "HTTP 503"
+    assert queued["next_attempt_at"] == (T0 + timedelta(seconds=60)).isoformat()
+
+    up, sent = client(lambda r: httpx.Response(204))
+    assert outbox.drain(up, now=T0 + timedelta(seconds=30))["requests"] == 0
+    assert outbox.drain(up, now=T0 + timedelta(seconds=61))["delivered"] == 1
+    assert len(sent) == 1 and by_id()[msg]["status"] == "delivered"
+
+
+def test_rate_limit_and_permanent_errors():
+    limited = outbox.discord(HOOK, "a", username="SOFT CAT Radar")
+    gone = outbox.ping(CHECK)
+
+    def respond(request):
+        if request.method == "POST":
+            return httpx.Response(429, json={"retry_after": 7.5})
+        return httpx.Response(404)
+    http, _ = client(respond)
+    outbox.drain(http, now=T0)
+    msgs = by_id()
+    assert msgs[limited]["next_attempt_at"] == (T0 + timedelta(seconds=7.5)).isoformat()
+    assert msgs[gone]["status"] == "dead"
+
+
+def test_transport_errors_give_up_after_max_attempts(monkeypatch):
+    monkeypatch.setattr(outbox, "MAX_ATTEMPTS", 2)
+    msg = outbox.ping(CHECK)
+
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+    http, _ = client(refuse)
+    outbox.drain(http, now=T0)
+    outbox.drain(http, now=T0 + timedelta(hours=1))
+    assert by_id()[msg]["status"] == "dead"
+    assert by_id()[msg]["last_error"].startswith("ConnectError")
+
+
+def test_a_second_drainer_exits_instead_of_waiting(tmp_path, monkeypatch):
+    monkeypatch.setattr(outbox, "DRAIN_LOCK", tmp_path / "drain.lock")
+    outbox.ping(CHECK, source="radar_bot")
+    with open(outbox.DRAIN_LOCK, "w") as held:
+        fcntl.flock(held, fcntl.LOCK_EX)
+        assert outbox.drain_loop(linger_s=0) is False
+    assert outbox.load()[0]["status"] == "pending"
+
+
+def test_a_corrupt_outbox_is_moved_aside_not_wiped(tmp_path, capsys):
+    outbox.OUTBOX_FILE.write_text('[{"id": "abc", "status": "pending"')
+    outbox.ping(CHECK, source="radar_bot")
+    aside = list(tmp_path.glob("outbox.json.corrupt-*"))
+    assert len(aside) == 1 and aside[0].read_text().startswith('[{"id": "abc"')
+    assert "was corrupt; moved to" in capsys.readouterr().out
+    assert [m["url"] for m in outbox.load()] == [CHECK]
+
+
+def test_a_failed_write_keeps_the_queued_messages(tmp_path, monkeypatch):
+    outbox.ping(CHECK, source="radar_bot")
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+    with monkeypatch.context() as m, pytest.raises(OSError):
+        m.setattr(outbox.state_store.os, "replace", broken_replace)
+        outbox.ping(CHECK, status="fail", source="radar_bot")
+    assert not list(tmp_path.glob(".outbox.json.*.tmp"))
+    assert [m["url"] for m in outbox.load()] == [CHECK]
@@ -0,0 +1,30 @@
+"""Tests for pipeline_log.py: every registered run report is attached to
+the next log_run entry once, and preflight's budget meets the billed
+input tokens.
+"""
+import json
+
+import pipeline_log
+import preflight
+
+
+def test_log_run_attaches_each_report_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline_log, "RUNS_FILE", tmp_path / "runs.json")
+    monkeypatch.setattr(pipeline_log, "_reports", dict(pipeline_log._reports))
+    for run_report in pipeline_log._reports.values():
+        run_report.take()
+    stage = pipeline_log.report("test_stage")
+    assert pipeline_log.report("test_stage") is stage
+
+    stage.add(entries=3, tokens=100)
+    stage.add(entries=2, tokens=50)
+    stage.note(method="local")
+    preflight.fit(lambda items: "rules " * 100 + " ".join(items), ["a", "b"], 10_000,
+                  label="news_bot")
+    pipeline_log.log_run("news_bot", input_tokens=1234)
+    pipeline_log.log_run("news_bot")
+
+    first, second = json.loads((tmp_path / "runs.json").read_text())
+    assert first["test_stage"] == {"entries": 5, "tokens": 150, "method": "local"}
+    assert first["preflight"]["budget"] == 10_000 and first["preflight"]["actual"] == 1234
+    assert "test_stage" not in second and "preflight" not in second
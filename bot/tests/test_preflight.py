@@ -0,0 +1,83 @@
+"""Tests for preflight.py: prompts under budget pass untouched, prompts over
+it lose their lowest-ranked context items first, a runaway fixed part
+fails before the call is paid for, and the totals are reported.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+import normalize
+import preflight
+
+RULES = "Pick the three most interesting stories and write a digest. " * 20
+ITEMS = [f"Story {i}: " + " ".join(f"word{i}x{j}" for j in range(40)) for i in range(20)]
+
+
+def build(items):
+    return RULES + "\n\n".join(items)
+
+
+@pytest.fixture(autouse=True)
+def fresh_report():
+    preflight.take_report()
+
+
+def test_under_budget_is_untouched():
+    kept, prompt = preflight.fit(build, ITEMS, 100_000, label="news_bot")
+    assert kept == ITEMS and prompt == build(ITEMS)
+    assert preflight.take_report()["trimmed"] == 0
+
+
+def test_over_budget_drops_lowest_ranked_first():
+    full = normalize.estimate_tokens(build(ITEMS))
+    budget = full // 2
+    kept, prompt = preflight.fit(build, ITEMS, budget, label="news_bot")
+    assert kept == ITEMS[:len(kept)] and 0 < len(kept) < len(ITEMS)
+    assert prompt == build(kept)
+    assert normalize.estimate_tokens(prompt) <= budget
+    # One-shot sizing: nothing more than one extra item was dropped.
+    assert normalize.estimate_tokens(build(ITEMS[:len(kept) + 2])) > budget
+    report = preflight.take_report()
+    assert report["trimmed"] == len(ITEMS) - len(kept) and report["budget"] == budget
+
+
+def test_fixed_part_over_budget_warns_then_raises(capsys):
+    fixed = normalize.estimate_tokens(RULES)
+    kept, _ = preflight.fit(build, ITEMS, int(fixed * 0.8), label="news_bot")
+    assert kept == []
+    assert "WARNING: news_bot prompt is over budget" in capsys.readouterr().out
+    with pytest.raises(RuntimeError, match="no context left to trim"):
+        preflight.fit(build, ITEMS, fixed // 3, label="news_bot")
+
+
+class Counter:
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+        self.messages = self
+
+    def count_tokens(self, model, messages):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("offline")
+        return SimpleNamespace(input_tokens=len(messages[0]["content"]) // 4)
+
+
+def test_count_tokens_endpoint_when_enabled(monkeypatch):
+    monkeypatch.setenv("SOFTCAT_COUNT_TOKENS", "1")
+    client = Counter()
+    budget = len(build(ITEMS)) // 4 * 2 // 3
+    kept, prompt = preflight.fit(build, ITEMS, budget, label="news_bot",
+                                 model="claude-sonnet-4-6", client=client)
+    assert len(prompt) // 4 <= budget and 2 <= client.calls <= 4
+    assert preflight.take_report()["method"] == "count_tokens"
+
+    kept, _ = preflight.fit(build, ITEMS, 100_000, label="news_bot",
+                            model="claude-sonnet-4-6", client=Counter(fail=True))
+    assert kept == ITEMS and preflight.take_report()["method"] == "local"
+
+    monkeypatch.setenv("SOFTCAT_COUNT_TOKENS", "0")
+    client = Counter()
+    preflight.fit(build, ITEMS, 100_000, label="news_bot", model="claude-sonnet-4-6",
+                  client=client)
+    assert client.calls == 0 and preflight.take_report()["method"] == "local"
@@ -0,0 +1,72 @@
+"""Radar archive reader: unchanged day-files must be served from the
+manifest + parsed cache without re-reading their JSON, and an edited file
+must be picked up on the next read (never a stale parse).
+"""
+import json
+import os
+
+import radar_archive
+
+
+def make(tmp_path):
+    radar = tmp_path / "radar"
+    radar.mkdir()
+    (radar / "2026-06-01.json").write_text(json.dumps({"featured": [{"name": "A"}]}))
+    (radar / "2026-06-02.json").write_text(json.dumps({"featured": [{"name": "B"}]}))
+    (radar / "index.json").write_text("{}")
+    return radar, tmp_path / "cache"
+
+
+def test_dates_ignore_manifest_file(tmp_path):
+    radar, cache = make(tmp_path)
+    assert radar_archive.RadarArchive(radar, cache).dates() == ["2026-06-01", "2026-06-02"]
+
+
+def test_second_process_reads_nothing_unchanged(tmp_path):
+    radar, cache = make(tmp_path)
+    first = radar_archive.RadarArchive(radar, cache)
+    assert first.read("2026-06-01")["featured"][0]["name"] == "A"
+    first.read("2026-06-02")
+    first.save()
+    assert first.stats["parsed"] == 2
+
+    second = radar_archive.RadarArchive(radar, cache)
+    assert second.read("2026-06-01")["featured"][0]["name"] == "A"
+    assert second.stats == {"lru_hits": 0, "disk_hits": 1, "parsed": 0, "hashed": 0}
+    second.read("2026-06-01")
+    assert second.stats["lru_hits"] == 1
+
+
+def test_edited_file_is_reparsed(tmp_path):
+    radar, cache = make(tmp_path)
+    a = radar_archive.RadarArchive(radar, cache)
+    a.read("2026-06-01")
+    a.save()
+    f = radar / "2026-06-01.json"
+    f.write_text(json.dumps({"featured": [{"name": "Edited"}]}))
+    st = f.stat()
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    b = radar_archive.RadarArchive(radar, cache)
+    assert b.read("2026-06-01")["featured"][0]["name"] == "Edited"
+    assert b.stats["parsed"] == 1
+
+
+def test_touched_but_identical_file_is_not_reparsed(tmp_path):
+    radar, cache = make(tmp_path)
+    a = radar_archive.RadarArchive(radar, cache)
+    a.read("2026-06-01")
+    a.save()
+    f = radar / "2026-06-01.json"
+    st = f.stat()
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    b = radar_archive.RadarArchive(radar, cache)
+    assert b.read("2026-06-01")["featured"][0]["name"] == "A"
+    assert b.stats["hashed"] == 1 and b.stats["parsed"] == 0
+
+
+def test_missing_and_corrupt_days_read_as_none(tmp_path):
+    radar, cache = make(tmp_path)
+    (radar / "2026-06-03.json").write_text("{not json")
+    a = radar_archive.RadarArchive(radar, cache)
+    assert a.read("2026-05-01") is None
+    assert a.read("2026-06-03") is None
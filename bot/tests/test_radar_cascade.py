@@ -0,0 +1,167 @@
+"""Tests for radar_bot's launch cascade: the local filter keeps launches and
+drops the rest, only survivors reach the writer, per-tier tokens and cost
+reach log_run, and a replayed fixture run keeps every published product
+(benchmarks/cascade.py).
+"""
+import json
+import sys
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+BENCH_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
+sys.path.insert(0, str(BENCH_DIR))
+
+import cascade  # noqa: E402
+import pipeline_log  # noqa: E402
+import radar_bot  # noqa: E402
+import replay  # noqa: E402
+
+RECORDED_AT = datetime(2026, 10, 19, 6, 0, tzinfo=timezone.utc)
+FEED_URL = "https://feeds.test/ai.xml"
+
+LAUNCHES = [
+    ("Acme launches Widget, an open-source agent SDK",
+     "Widget is available today on GitHub with a CLI and a hosted API."),
+    ("Figma rolls out AI prototyping in beta",
+     "Designers can turn frames into clickable prototypes from a prompt."),
+    ("Introducing Loom Notes: meeting summaries for every call",
+     "The new app records, transcribes and drafts follow-ups."),
+    ("Mistral releases Codestral 3 with a 256k context window",
+     "The model is available through the API and as open weights."),
+    ("Google announces Gemini CLI, an open-source AI agent for your terminal",
+     "Developers get free access to Gemini 2.5 Pro from the command line."),
+    ("Mistral announces Devstral 2 coding model",
+     "Devstral 2 tops open models on SWE-bench Verified."),
+    ("OpenAI launches Study Mode in ChatGPT",
+     "Study Mode walks students through problems step by step."),
+]
+NOT_LAUNCHES = [
+    ("Acme raises $40M Series B to build agents",
+     "The round was led by a16z and values the company at $400M."),
+    ("Opinion: agent demos are not products",
+     "Most of what we saw this week will not survive contact with users."),
+    ("Researchers find LLMs overstate their confidence",
+     "A study of 12 models shows calibration degrades with length."),
+    ("EU regulators open consultation on model audits",
+     "Comments are due by January."),
+    ("Why your RAG pipeline is slow",
+     "Three fixes that take an afternoon."),
+    ("New funding round values Acme AI model maker at $2B",
+     "Investors are betting on enterprise demand."),
+    ("Meet the lawsuit targeting OpenAI model training",
+     "Authors say their books were used without permission."),
+]
+
+
+def entry(title, summary, i=0):
+    return {"title": title, "summary": summary, "source": "AI Feed",
+            "link": f"https://news.test/{i}", "published": "",
+            "published_ts": RECORDED_AT.timestamp() - 3600 * (i + 1)}
+
+
+def test_filter_keeps_launches_and_drops_the_rest():
+    assert all(radar_bot.launch_score(entry(t, s)) >= radar_bot.LAUNCH_THRESHOLD
+               for t, s in LAUNCHES)
+    assert all(radar_bot.launch_score(entry(t, s)) < radar_bot.LAUNCH_THRESHOLD
+               for t, s in NOT_LAUNCHES)
+    entries = [entry(t, s, i) for i, (t, s) in enumerate(LAUNCHES + NOT_LAUNCHES)]
+    kept, tier = radar_bot.filter_launches(entries)
+    assert [e["title"] for e in kept] == [t for t, _ in LAUNCHES]
+    assert tier["entries_in"] == 14 and tier["entries_out"] == 7 and tier["cost_usd"] == 0.0
+    assert tier["est_tokens_out"] < tier["est_tokens_in"] and "input_tokens" not in tier
+
+
+def writer_reply(products: list[dict]) -> str:
+    return json.dumps({"date": "2026-10-19", "featured": products[:1], "picks": products[1:],
+                       "hn_top5": [], "discord_summary": "Daily AI Intel"})
+
+
+class FakeAnthropic:
+    prompts: list[str] = []
+
+    def __init__(self, *a, **kw):
+        self.messages = self
+
+    def create(self, model, max_tokens, messages):
+        FakeAnthropic.prompts.append(messages[0]["content"])
+        return SimpleNamespace(content=[SimpleNamespace(text=writer_reply([]))],
+                               usage=SimpleNamespace(input_tokens=2000, output_tokens=500))
+
+
+@pytest.mark.parametrize("on", [True, False])
+def test_writer_sees_only_survivors_and_tiers_are_logged(on, tmp_path, monkeypatch):
+    anthropic = pytest.importorskip("anthropic")
+    monkeypatch.setattr(anthropic, "Anthropic", FakeAnthropic)
+    monkeypatch.setattr(pipeline_log, "RUNS_FILE", tmp_path / "runs.json")
+    FakeAnthropic.prompts = []
+    entries = [entry(t, s, i) for i, (t, s) in enumerate(LAUNCHES + NOT_LAUNCHES)]
+
+    monkeypatch.setenv("RADAR_CASCADE", "1" if on else "0")  # read per call, not at import
+    data, tiers = radar_bot.generate_radar(entries, [], {"scans": []})
+    prompt = FakeAnthropic.prompts[0]
+    assert all(t in prompt for t, _ in LAUNCHES)
+    assert all((t in prompt) != on for t, _ in NOT_LAUNCHES)
+    assert [t["tier"] for t in tiers] == (["filter", "write"] if on else ["write"])
+    assert tiers[-1]["cost_usd"] == pytest.approx((2000 * 3 + 500 * 15) / 1_000_000)
+
+    pipeline_log.log_run("radar_bot", model=radar_bot.WRITE_MODEL, tiers=tiers)
+    logged = json.loads((tmp_path / "runs.json").read_text())[0]
+    assert logged["tiers"] == tiers
+
+
+def rss(items) -> str:
+    body = "".join(
+        f"<item><title>{t}</title><link>https://news.test/{i}</link>"
+        f"<description>{s}</description>"
+        f"<pubDate>{format_datetime(RECORDED_AT.replace(hour=i % 6))}</pubDate></item>"
+        for i, (t, s) in enumerate(items))
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>AI Feed</title>{body}</channel></rss>'
+
+
+def fixture_cassette(products: list[dict]) -> replay.Cassette:
+    reply = {"id": "msg_1", "type": "message", "role": "assistant", "model": radar_bot.WRITE_MODEL,
+             "content": [{"type": "text", "text": writer_reply(products)}],
+             "usage": {"input_tokens": 6000, "output_tokens": 900}}
+    return replay.Cassette(
+        {"bot": "radar", "recorded_at": RECORDED_AT.isoformat(), "radar_cascade": "0"},
+        [{"method": "GET", "url": FEED_URL, "status": 200,
+          "headers": [["content-type", "application/rss+xml"]], "text": rss(LAUNCHES + NOT_LAUNCHES)},
+         {"method": "POST", "url": cascade.ANTHROPIC_MESSAGES, "status": 200,
+          "headers": [["content-type", "application/json"]], "text": json.dumps(reply)}])
+
+
+@pytest.fixture
+def recorded(tmp_path, monkeypatch):
+    pytest.importorskip("feedparser")
+    monkeypatch.setattr(radar_bot, "FEEDS", [FEED_URL])
+    monkeypatch.setattr(radar_bot, "HISTORY_FILE", tmp_path / "radar_history.json")
+
+
+def test_replayed_fixture_keeps_every_published_product(recorded):
+    products = [{"name": "Widget", "ph_url": "https://news.test/0"},
+                {"name": "Codestral 3", "ph_url": "https://mistral.test/codestral"},
+                {"name": "Some HN tool", "ph_url": "https://hn.test/1"}]
+    report = cascade.compare(fixture_cassette(products))
+    assert report["parity"] and report["misses"] == []
+    assert report["entries"] == 14 and report["kept"] == 7
+    assert report["matched"] == 2 and report["unmatched"] == ["Some HN tool"]
+    assert report["tokens_cascade"] < report["tokens_full"] * 0.7
+
+
+def test_replayed_fixture_reports_a_lost_product(recorded, tmp_path, capsys):
+    products = [{"name": "Acme Agents", "ph_url": "https://news.test/7"}]  # the funding story
+    path = tmp_path / "radar.json"
+    fixture_cassette(products).save(path)
+    assert cascade.main(["--cassette", str(path)]) == 1
+    assert "LOST: Acme Agents (Acme raises $40M Series B" in capsys.readouterr().out
+
+
+def test_a_cascade_on_recording_is_refused(recorded):
+    cassette = fixture_cassette([{"name": "Widget", "ph_url": "https://news.test/0"}])
+    del cassette.meta["radar_cascade"]
+    with pytest.raises(SystemExit, match="circular"):
+        cascade.compare(cassette)
@@ -0,0 +1,93 @@
+"""Tests for ranker.py: later feeds are no longer crowded out, the token
+budget and k hold, syndicated duplicates and already-covered themes sink,
+and the same input always gives the same pick.
+"""
+import normalize
+import ranker
+
+NOW = 1_790_000_000
+FOCUS = "launch release open source tool api sdk agent"
+
+
+def entry(title, source, summary="", age_h=1.0, link=None):
+    e = {"title": title, "summary": summary or title, "source": source,
+         "link": link or f"https://{source.lower()}.test/{title.lower().replace(' ', '-')}",
+         "published_ts": NOW - age_h * 3600}
+    e["tokens"] = normalize.estimate_tokens(e["title"]) + normalize.estimate_tokens(e["summary"])
+    return e
+
+
+FINANCE = ["Chipmaker beats quarterly estimates", "Bank trims rate forecast",
+           "Retailer warns on holiday margins", "Carmaker delays EV plant",
+           "Insurer books storm losses", "Airline fuel costs climb",
+           "Brewer sells cider unit", "Miner cuts copper guidance",
+           "Telecom raises dividend", "Pharma settles patent suit",
+           "Shipping rates slide again", "Utility files rate case",
+           "Grocer expands delivery zones", "Steelmaker idles furnace",
+           "Hotel chain reopens resort"]
+COLUMN = ["Why meetings feel longer", "Notes on city cycling", "The case for paper maps",
+          "Remote work, five years on", "A defence of long emails", "On learning Welsh",
+          "What gardening taught me", "Against productivity apps", "The joy of timetables",
+          "Running slower on purpose", "Kitchen table economics", "Inbox zero was a lie",
+          "Podcasts at double speed", "Letters to a younger manager", "The office plant census"]
+
+
+def batch():
+    first = [entry(t, "Finance", age_h=i) for i, t in enumerate(FINANCE)]
+    second = [entry(t, "Column", age_h=i) for i, t in enumerate(COLUMN)]
+    third = [entry("Acme launches open source agent SDK", "Launches",
+                   "Acme released an open source SDK and API for building agents."),
+             entry("Beta tool release: Widget CLI", "Launches",
+                   "Widget launches a CLI tool with an API for agent workflows.", age_h=5)]
+    return first + second + third
+
+
+def test_relevant_later_feed_is_not_crowded_out():
+    entries = batch()
+    assert all(e["source"] == "Finance" for e in entries[:10])  # the old slice
+    picked = ranker.select(entries, k=10, focus=FOCUS, now=NOW)
+    assert [e["title"] for e in picked[:2]] == ["Acme launches open source agent SDK",
+                                                "Beta tool release: Widget CLI"]
+    assert {e["source"] for e in picked} == {"Finance", "Column", "Launches"}
+
+
+def test_k_and_budget_hold_and_order_is_stable():
+    entries = batch()
+    picked = ranker.select(entries, k=8, budget=60, focus=FOCUS, now=NOW)
+    assert len(picked) <= 8
+    assert sum(ranker.entry_tokens(e) for e in picked) <= 60
+    assert picked == ranker.select(list(entries), k=8, budget=60, focus=FOCUS, now=NOW)
+    assert len(ranker.select(entries, k=50, now=NOW)) == len(entries)
+
+
+def test_syndicated_duplicate_is_dropped():
+    story = "Acme launches open source agent SDK for developers"
+    entries = [entry(story, "FeedA"), entry(story + ".", "FeedB"),
+               entry("Widget ships a new CLI", "FeedC")]
+    picked = ranker.select(entries, k=3, focus=FOCUS, now=NOW)
+    assert len(picked) == 2 and picked[0]["source"] == "FeedA"
+
+
+def test_history_sinks_covered_themes():
+    entries = [entry("Cursor ships cloud agents", "A"), entry("Orchids 2.0 app builder", "B")]
+    picked = ranker.select(entries, k=1, now=NOW, history=["Cursor Cloud Agents"])
+    assert picked[0]["title"] == "Orchids 2.0 app builder"
+
+
+def test_recency_prefers_fresh_entries():
+    assert ranker.recency({"published_ts": NOW}, NOW) == 1.0
+    assert abs(ranker.recency({"published_ts": NOW - ranker.HALF_LIFE_H * 3600}, NOW) - 0.5) < 1e-9
+    assert ranker.recency({}, NOW) == 0.5
+
+
+def test_selection_totals_are_reported():
+    ranker.take_report()
+    ranker.select(batch(), k=5, budget=100, focus=FOCUS, now=NOW)
+    report = ranker.take_report()
+    assert report["candidates"] == 32 and report["picked"] == 5 and report["budget"] == 100
+    assert report["tokens_picked"] <= 100 < report["tokens_candidates"]
+
+    ranker.select(batch(), k=5, budget=100, now=NOW)
+    ranker.select(batch(), k=5, budget=80, now=NOW)
+    report = ranker.take_report()
+    assert report["candidates"] == 64 and report["budget"] == 80  # a setting, not summed
@@ -0,0 +1,144 @@
+"""Tests for bot/benchmarks/replay.py: a cassette recorded against a local
+server replays with the server gone, side-effecting calls never leave the
+box, and a whole model_data_bot run replays offline into the sandbox
+remote without touching the real tree.
+"""
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+
+BENCH_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
+REPO_DIR = BENCH_DIR.parent.parent
+sys.path.insert(0, str(BENCH_DIR))
+
+import replay  # noqa: E402
+
+
+class Feed(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        Feed.hits += 1
+        body = f"<rss><channel><title>hit {Feed.hits}</title></channel></rss>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Feed)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+
+
+def test_record_then_replay_without_the_server(server, tmp_path):
+    recorder = replay.Cassette({"bot": "radar"})
+    restore = replay.install(recorder, "record")
+    try:
+        first = httpx.get(f"{server}/feed").text
+        second = httpx.get(f"{server}/feed").text
+    finally:
+        restore()
+    path = tmp_path / "radar.json"
+    recorder.save(path)
+    assert "hit 1" in first and "hit 2" in second
+    assert all("headers" in rec and rec["method"] == "GET" for rec in recorder.http)
+
+    cassette = replay.Cassette.load(path)
+    restore = replay.install(cassette, "replay")
+    try:
+        # Same URL twice: served in recorded order.
+        assert httpx.get(f"{server}/feed").text == first
+        assert httpx.get(f"{server}/feed").text == second
+        with pytest.raises(httpx.ConnectError):
+            httpx.get(f"{server}/feed")
+    finally:
+        restore()
+    assert Feed.hits == 2
+    assert cassette.misses == [f"GET {server}/feed"]
+
+
+def test_side_effects_are_canned_in_record_mode():
+    cassette = replay.Cassette()
+    restore = replay.install(cassette, "record")
+    try:
+        hook = httpx.post("https://discord.com/api/webhooks/1/x", json={"content": "hi"})
+        pr = httpx.post("https://api.github.com/repos/o/r/pulls", json={"title": "t"})
+    finally:
+        restore()
+    assert hook.status_code == 204
+    assert pr.status_code == 201 and pr.json()["number"] == 0
+    assert cassette.http == []
+
+
+def test_gh_auth_token_is_redacted():
+    cassette = replay.Cassette()
+    cassette.record_command(["gh", "auth", "token"],
+                            subprocess.CompletedProcess([], 0, "gho_secret\n", ""))
+    assert cassette.commands[0]["stdout"] == "replay-token\n"
+    replayed = replay.Cassette(commands=cassette.commands).replay_command(
+        ["gh", "auth", "token"], text=True)
+    assert replayed.stdout == "replay-token\n"
+
+
+def test_only_record_mode_loads_the_real_env_file(tmp_path, monkeypatch):
+    env = tmp_path / ".env"
+    env.write_text("SOFTCAT_REPLAY_TEST_KEY=live-secret\n")
+    monkeypatch.setenv("SOFTCAT_REPLAY_TEST_KEY", "")  # so teardown removes it
+    monkeypatch.delenv("SOFTCAT_REPLAY_TEST_KEY")
+    replay.load_secrets("replay", env)
+    assert "SOFTCAT_REPLAY_TEST_KEY" not in os.environ
+    replay.load_secrets("record", env)
+    assert os.environ["SOFTCAT_REPLAY_TEST_KEY"] == "live-secret"
+
+
+def test_model_data_run_replays_offline(tmp_path):
+    models = json.loads((REPO_DIR / "src/data/models.json").read_text())
+    target = next(m for m in models if not m.get("openSource")
+                  and "inputPrice" not in (m.get("lockedFields") or [])
+                  and m.get("inputPrice", 0) > 1)
+    data = []
+    for m in models:
+        price = m.get("inputPrice", 0) * (1.1 if m is target else 1)
+        data.append({"id": m["id"], "name": m["name"],
+                     "context_length": m.get("contextK", 0) * 1000,
+                     "pricing": {"prompt": f"{price / 1e6:.10f}",
+                                 "completion": f"{m.get('outputPrice', 0) / 1e6:.10f}"},
+                     "architecture": {"input_modalities":
+                                      ["text", "image"] if m.get("multimodal") else ["text"]}})
+    sha = subprocess.run(["git", "-C", str(REPO_DIR), "rev-parse", "HEAD"],
+                         capture_output=True, text=True, check=True).stdout.strip()
+    cassette = replay.Cassette(
+        {"bot": "model-data", "recorded_at": "2026-10-19T06:00:00+00:00", "sha": sha,
+         "github_repository": "example/softcat"},
+        http=[{"method": "GET", "url": "https://openrouter.ai/api/v1/models", "status": 200,
+               "headers": [["content-type", "application/json"]],
+               "text": json.dumps({"data": data})}])
+    path = tmp_path / "model-data.json"
+    cassette.save(path)
+    before = (REPO_DIR / "src/data/models.json").read_bytes()
+
+    result = subprocess.run([sys.executable, str(BENCH_DIR / "replay.py"), "replay",
+                             "model-data", "--cassette", str(path)],
+                            capture_output=True, text=True, timeout=120,
+                            env={**os.environ, "TZ": "UTC"})
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Model Data bot starting" in result.stdout
+    assert "[2026-10-19T06:00:00" in result.stdout  # frozen clock
+    assert "model-data replay: ok" in result.stdout
+    assert "1 commit(s) pushed to the sandbox remote" in result.stdout
+    assert (REPO_DIR / "src/data/models.json").read_bytes() == before
@@ -0,0 +1,70 @@
+"""runner.py runs bots back to back in one process: a bot that exits
+non-zero, raises, or changes directory must not affect the next one.
+"""
+import os
+import sys
+import types
+from datetime import date
+
+import pytest
+
+import runner
+
+
+def fake_bot(monkeypatch, name, main):
+    module = types.ModuleType(name)
+    module.__file__ = f"/fake/{name}.py"
+    module.main = main
+    monkeypatch.setitem(sys.modules, name, module)
+
+
+@pytest.fixture
+def bots(monkeypatch, tmp_path):
+    calls = []
+
+    def ok():
+        calls.append(("ok", list(sys.argv)))
+        os.chdir(tmp_path)
+
+    def exits_zero():
+        calls.append(("quiet", None))
+        sys.exit(0)
+
+    def exits_one():
+        calls.append(("exit1", None))
+        sys.exit(1)
+
+    def raises():
+        calls.append(("raise", None))
+        raise RuntimeError("boom")
+
+    for name, main in [("fake_ok", ok), ("fake_quiet", exits_zero),
+                       ("fake_exit1", exits_one), ("fake_raise", raises)]:
+        fake_bot(monkeypatch, name, main)
+    monkeypatch.setattr(runner, "SCHEDULE", {
+        "ok": ("fake_ok", None), "quiet": ("fake_quiet", {6}),
+        "exit1": ("fake_exit1", None), "raise": ("fake_raise", None),
+    })
+    return calls
+
+
+def test_failures_are_isolated(bots):
+    cwd, argv = os.getcwd(), list(sys.argv)
+    assert runner.main(["raise", "exit1", "quiet", "ok"]) == 1
+    assert [c[0] for c in bots] == ["raise", "exit1", "quiet", "ok"]
+    assert bots[-1][1] == ["/fake/fake_ok.py"]
+    assert os.getcwd() == cwd and sys.argv == argv
+
+
+def test_clean_exits_count_as_success(bots):
+    assert runner.main(["quiet", "ok"]) == 0
+
+
+def test_schedule_by_weekday(bots):
+    assert runner.due_today(date(2026, 10, 18)) == ["ok", "quiet", "exit1", "raise"]  # Sunday
+    assert runner.due_today(date(2026, 10, 19)) == ["ok", "exit1", "raise"]
+
+
+def test_real_schedule_runs_radar_before_horizon():
+    names = list(runner.SCHEDULE)
+    assert names.index("radar") < names.index("horizon")
@@ -0,0 +1,73 @@
+"""Tests for state_store.py: pretty output is byte-identical to the old
+writers, unchanged content is not rewritten, a failed write leaves the old
+file intact, and compact files round-trip with or without orjson.
+"""
+import json
+import os
+
+import pytest
+
+import state_store
+
+DATA = {"digests": [{"date": "2026-10-19", "title": "Café ünïcode", "links": ["a", "b"]}],
+        "count": 2, "ratio": 0.1}
+
+
+def test_pretty_matches_the_old_stdlib_output(tmp_path):
+    path = tmp_path / "models.json"
+    assert state_store.write(path, DATA) is True
+    assert path.read_text() == json.dumps(DATA, indent=2) + "\n"
+
+
+def test_unchanged_content_is_not_rewritten(tmp_path):
+    path = tmp_path / "history.json"
+    assert state_store.write(path, DATA, compact=True) is True
+    mtime = path.stat().st_mtime_ns
+    assert state_store.write(path, json.loads(path.read_text()), compact=True) is False
+    assert path.stat().st_mtime_ns == mtime
+
+    # Edited behind our back: the stat mismatch forces a re-read and a write.
+    path.write_text("{}")
+    assert state_store.write(path, DATA, compact=True) is True
+    assert state_store.read(path) == DATA
+
+
+def test_failed_write_keeps_the_old_file(tmp_path, monkeypatch):
+    path = tmp_path / "history.json"
+    state_store.write(path, DATA)
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "replace", broken_replace)
+    with pytest.raises(OSError):
+        state_store.write(path, {"digests": []})
+    assert state_store.read(path) == DATA
+    assert list(tmp_path.iterdir()) == [path]  # temp file cleaned up
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_compact_round_trips(tmp_path, monkeypatch, fast):
+    if fast and state_store.orjson is None:
+        pytest.skip("orjson not installed")
+    if not fast:
+        monkeypatch.setattr(state_store, "orjson", None)
+    path = tmp_path / "digest_history.json"
+    state_store.write(path, DATA, compact=True, sort_keys=True)
+    raw = path.read_bytes()
+    assert b"\n" not in raw.rstrip(b"\n") and b": " not in raw
+    assert json.loads(raw) == DATA
+
+
+def test_read_falls_back_on_missing_or_corrupt(tmp_path):
+    assert state_store.read(tmp_path / "missing.json", {"scans": []}) == {"scans": []}
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    assert state_store.read(bad, []) == []
+
+
+def test_strict_read_raises_on_corrupt_but_not_missing(tmp_path):
+    assert state_store.read(tmp_path / "missing.json", {"scans": []}, strict=True) == {"scans": []}
+    bad = tmp_path / "radar_history.json"
+    bad.write_text('{"scans": [')
+    with pytest.raises(ValueError, match="radar_history.json is not valid JSON"):
+        state_store.read(bad, {"scans": []}, strict=True)
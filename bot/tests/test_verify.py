@@ -122,11 +122,14 @@ def test_stamp_noop_returns_false(tmp_path):
 
 # ---- corrupt history guard ----------------------------------------------------
 
-def test_corrupt_history_resets(tmp_path, monkeypatch):
-    bad = tmp_path / "tool_verify_history.json"
-    bad.write_text("{broken")
-    monkeypatch.setattr(bot, "VERIFY_HISTORY", bad)
-    assert bot.load_verify_history() == {}
+def test_corrupt_history_fails_loudly(tmp_path, monkeypatch):
+    path = tmp_path / "tool_verify_history.json"
+    monkeypatch.setattr(bot, "VERIFY_HISTORY", path)
+    assert bot.load_verify_history() == {}  # first run: nothing checked yet
+    for bad in ("{broken", "[]"):
+        path.write_text(bad)
+        with pytest.raises(ValueError, match="tool_verify_history.json"):
+            bot.load_verify_history()
 
 
 def test_urlless_writeups_are_skipped():
@@ -135,3 +138,97 @@ def test_urlless_writeups_are_skipped():
     for name in ("context-window-viz.md", "softcat-site.md", "token-cost-calculator.md"):
         txt = (bot.CONTENT_DIR / name).read_text()
         assert bot.FRONT_URL.search(txt) is None, name
+
+
+# ---- concurrent verifier ------------------------------------------------------
+
+class SlowHosts:
+    """Mock transport: per-path status, optional delay, concurrency tracking."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.methods: list[tuple[str, str]] = []
+
+    async def __call__(self, request):
+        import asyncio
+        host = request.url.host
+        self.methods.append((request.method, request.url.path))
+        self.active[host] = self.active.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        try:
+            if request.url.path == "/hang":
+                await asyncio.sleep(30)
+            if request.url.path == "/refused":
+                raise httpx.ConnectError("connection refused")
+            await asyncio.sleep(self.delay)
+            code = {"/gone": 404, "/blocked": 403, "/nohead": 405}.get(request.url.path, 200)
+            if request.url.path == "/nohead" and request.method == "GET":
+                code = 200
+            return httpx.Response(code)
+        finally:
+            self.active[host] -= 1
+
+
+def test_verify_urls_verdicts_match_classifier():
+    hosts = SlowHosts()
+    urls = ["https://a.test/ok", "https://a.test/gone", "https://b.test/blocked",
+            "https://b.test/nohead", "https://c.test/refused", "not a url"]
+    verdicts = bot.verify_urls(urls, transport=httpx.MockTransport(hosts))
+    assert verdicts == {
+        "https://a.test/ok": "ok", "https://a.test/gone": "dead",
+        "https://b.test/blocked": "unverifiable", "https://b.test/nohead": "ok",
+        "https://c.test/refused": "dead", "not a url": "unverifiable",
+    }
+    assert ("GET", "/nohead") in hosts.methods  # HEAD 405 -> GET fallback
+
+
+def test_verify_urls_caps_per_host_concurrency():
+    hosts = SlowHosts()
+    urls = [f"https://github.test/tool-{i}" for i in range(12)] + ["https://other.test/x"]
+    verdicts = bot.verify_urls(urls, transport=httpx.MockTransport(hosts))
+    assert set(verdicts.values()) == {"ok"}
+    assert hosts.peak["github.test"] == bot.VERIFY_PER_HOST
+
+
+def test_deadline_leaves_slow_links_unverifiable():
+    hosts = SlowHosts()
+    verdicts = bot.verify_urls(["https://slow.test/hang", "https://fast.test/ok"],
+                               deadline_s=0.5, transport=httpx.MockTransport(hosts))
+    assert verdicts == {"https://slow.test/hang": "unverifiable", "https://fast.test/ok": "ok"}
+
+
+# ---- adaptive re-verification schedule -----------------------------------------
+
+def test_healthy_links_back_off_one_two_four_weeks():
+    h, _ = bot.update_streak({}, "x.md", "ok", "2026-10-04")
+    assert h["x.md"]["ok_count"] == 1 and h["x.md"]["last_ok"] == "2026-10-04"
+    assert not bot.is_due(h["x.md"], "2026-10-05")
+    assert bot.is_due(h["x.md"], "2026-10-11")             # 1 week
+    h, _ = bot.update_streak(h, "x.md", "ok", "2026-10-11")
+    assert not bot.is_due(h["x.md"], "2026-10-18")
+    assert bot.is_due(h["x.md"], "2026-10-25")             # 2 weeks
+    h, _ = bot.update_streak(h, "x.md", "ok", "2026-10-25")
+    h, _ = bot.update_streak(h, "x.md", "ok", "2026-11-22")
+    assert h["x.md"]["ok_count"] == 4
+    assert not bot.is_due(h["x.md"], "2026-12-13")
+    assert bot.is_due(h["x.md"], "2026-12-20")             # capped at 4 weeks
+
+
+def test_dead_and_unverifiable_links_are_due_every_run():
+    h, _ = bot.update_streak({}, "x.md", "ok", "2026-10-04")
+    h, _ = bot.update_streak(h, "x.md", "ok", "2026-10-11")
+    h, _ = bot.update_streak(h, "x.md", "unverifiable", "2026-10-25")
+    assert h["x.md"]["ok_count"] == 0 and h["x.md"]["last_ok"] == "2026-10-11"
+    assert bot.is_due(h["x.md"], "2026-10-26")
+    for day in ("2026-11-01", "2026-11-08"):
+        h, archive = bot.update_streak(h, "x.md", "dead", day)
+        assert bot.is_due(h["x.md"], day)
+    h, archive = bot.update_streak(h, "x.md", "dead", "2026-11-15")
+    assert archive is True  # ARCHIVE_AFTER consecutive weekly runs, as before
+
+
+def test_legacy_history_entries_are_due():
+    assert bot.is_due(None, "2026-10-19")
+    assert bot.is_due({"streak": 0, "last_verdict": "ok"}, "2026-10-19")
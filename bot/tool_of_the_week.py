@@ -6,10 +6,10 @@ Pulls AI tool discoveries from RSS feeds, picks one worth writing about,
 generates a markdown post in the house style, and commits it to the site repo.
 """
 
+import asyncio
 import os
 import re
 import sys
-import json
 import hashlib
 import subprocess
 import time as _time
@@ -17,12 +17,16 @@ from datetime import datetime, date
 from pathlib import Path
 
 import httpx
-import feedparser
-from dotenv import load_dotenv
-from anthropic import Anthropic
 
 from pipeline_log import log_run
+import content_catalogue
+import feeds
 import git_safe
+import http_pool
+import outbox
+import preflight
+import ranker
+import state_store
 
 # Paths
 BOT_DIR = Path(__file__).parent
@@ -39,41 +43,31 @@ FEEDS = [
     "https://buttondown.com/ainews/rss",
 ]
 
-load_dotenv(BOT_DIR / ".env")
+# Tools a developer can install and run today, open source first.
+FOCUS = """open source library framework tool sdk cli github release developer
+api plugin agent python typescript local self hosted"""
+FEED_TOKEN_BUDGET = 2000
+INPUT_TOKEN_BUDGET = 4000  # whole prompt; see preflight.py
 
 
 def load_history() -> dict:
     """Load the history of previously featured tools."""
-    if HISTORY_FILE.exists():
-        return json.loads(HISTORY_FILE.read_text())
-    return {"featured": []}
+    return state_store.read(HISTORY_FILE, {"featured": []}, strict=True)
 
 
 def save_history(history: dict):
     """Save the history."""
-    HISTORY_FILE.write_text(json.dumps(history, indent=2))
+    state_store.write(HISTORY_FILE, history, compact=True)
 
 
 def fetch_feed_entries() -> list[dict]:
     """Pull entries from all RSS feeds."""
-    entries = []
-    for url in FEEDS:
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:10]:
-                entries.append({
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
-                    "summary": entry.get("summary", "")[:500],
-                    "source": feed.feed.get("title", url),
-                })
-        except Exception as e:
-            print(f"Failed to fetch {url}: {e}")
-    return entries
+    return feeds.fetch_entries(FEEDS, limit=10)
 
 
 def pick_and_write(entries: list[dict], history: dict) -> str | None:
     """Use Claude to pick an interesting tool and write it up."""
+    from anthropic import Anthropic
     client = Anthropic()
     style_guide = STYLE_GUIDE.read_text()
 
@@ -86,15 +80,19 @@ def pick_and_write(entries: list[dict], history: dict) -> str | None:
         return None
 
     # Build the feed summary for Claude
-    feed_text = "\n\n".join(
-        f"**{e['title']}**\nSource: {e['source']}\nLink: {e['link']}\n{e['summary']}"
-        for e in fresh[:20]
-    )
+    picked = ranker.select(fresh, k=20, budget=FEED_TOKEN_BUDGET, focus=FOCUS,
+                           label="tool_bot")
 
     today = date.today().isoformat()
     slug_date = date.today().strftime("%Y-%m-%d")
 
-    prompt = f"""You are writing content for SOFT CAT .ai. Your job is to pick ONE interesting AI tool, library, or technique from the feed below and write a short "Tool of the Week" post.
+    def build(items: list[dict]) -> str:
+        feed_text = "\n\n".join(
+            f"**{e['title']}**\nSource: {e['source']}\nLink: {e['link']}\n{e['summary']}"
+            for e in items
+        )
+
+        return f"""You are writing content for SOFT CAT .ai. Your job is to pick ONE interesting AI tool, library, or technique from the feed below and write a short "Tool of the Week" post.
 
 ## House style (follow this exactly):
 {style_guide}
@@ -129,6 +127,9 @@ Rules:
   "we've been using"). You have not used the tool. Attribute claims to the
   source ("the benchmarks show", "the demo handles") or stay neutral."""
 
+    picked, prompt = preflight.fit(build, picked, INPUT_TOKEN_BUDGET, label="tool_bot",
+                                   model="claude-sonnet-4-6", client=client)
+
     response = client.messages.create(
         model="claude-sonnet-4-6",
         max_tokens=1024,
@@ -199,11 +200,7 @@ def ping_healthcheck(status="success"):
     url = os.environ.get("HC_PING_TOOL_OF_WEEK")
     if not url:
         return
-    try:
-        suffix = "/fail" if status == "fail" else ""
-        httpx.get(f"{url}{suffix}", timeout=10)
-    except Exception as e:
-        print(f"Healthcheck ping failed: {e}")
+    outbox.ping(url, status, source="tool_bot")
 
 
 # --------------------------------------------------------------------------- #
@@ -256,44 +253,127 @@ def classify_status(code: int | None, exc: Exception | None = None) -> str:
     return "unverifiable"
 
 
-def check_url(url: str) -> str:
-    """Status-code-only check. HEAD first, GET fallback (some hosts 405 HEAD).
-    Response bodies are never read into anything."""
+# The verify job checks every write-up's link concurrently through one pooled
+# client. Per-host caps keep us polite to hosts that carry many write-ups
+# (github.com); the run deadline bounds the job's wall time whatever the
+# slowest host does. A link still unchecked at the deadline is 'unverifiable',
+# which leaves its streak untouched (D12).
+VERIFY_TIMEOUT_S = 15
+VERIFY_CONCURRENCY = 16
+VERIFY_PER_HOST = 2
+VERIFY_DEADLINE_S = 300
+
+
+async def _check_url_async(client: httpx.AsyncClient, url: str,
+                           limit: asyncio.Semaphore,
+                           per_host: dict[str, asyncio.Semaphore]) -> str:
+    """HEAD first, GET fallback (some hosts 405 HEAD). The GET is streamed
+    and closed unread: only the status code matters."""
     try:
-        resp = httpx.head(url, timeout=15, follow_redirects=True)
-        if resp.status_code in (405, 501):
-            resp = httpx.get(url, timeout=15, follow_redirects=True)
-        return classify_status(resp.status_code)
+        host = httpx.URL(url).host.lower()
+        host_limit = per_host.setdefault(host, asyncio.Semaphore(VERIFY_PER_HOST))
+        # Host slot first, so a task queued behind its host holds no global slot.
+        async with host_limit, limit:
+            resp = await client.head(url)
+            code = resp.status_code
+            if code in (405, 501):
+                async with client.stream("GET", url) as resp:
+                    code = resp.status_code
+        return classify_status(code)
     except Exception as e:
         return classify_status(None, e)
 
 
+async def _verify_urls(urls: list[str], deadline_s: float,
+                       transport: httpx.AsyncBaseTransport | None) -> dict[str, str]:
+    limits = httpx.Limits(max_connections=VERIFY_CONCURRENCY,
+                          max_keepalive_connections=VERIFY_CONCURRENCY)
+    limit = asyncio.Semaphore(VERIFY_CONCURRENCY)
+    per_host: dict[str, asyncio.Semaphore] = {}
+    async with http_pool.async_client("verify", limits=limits, transport=transport,
+                                      timeout=VERIFY_TIMEOUT_S,
+                                      follow_redirects=True) as client:
+        tasks = {url: asyncio.create_task(_check_url_async(client, url, limit, per_host))
+                 for url in dict.fromkeys(urls)}
+        if not tasks:
+            return {}
+        _, late = await asyncio.wait(tasks.values(), timeout=deadline_s)
+        for task in late:
+            task.cancel()
+        if late:
+            await asyncio.gather(*late, return_exceptions=True)
+            print(f"[tool_bot] verify deadline ({deadline_s:.0f}s) hit: "
+                  f"{len(late)} link(s) left unverifiable")
+        return {url: "unverifiable" if task in late else task.result()
+                for url, task in tasks.items()}
+
+
+def verify_urls(urls: list[str], deadline_s: float = VERIFY_DEADLINE_S,
+                transport: httpx.AsyncBaseTransport | None = None) -> dict[str, str]:
+    """Verdict per unique url ('ok' | 'dead' | 'unverifiable'), checked
+    concurrently under VERIFY_CONCURRENCY / VERIFY_PER_HOST caps."""
+    return asyncio.run(_verify_urls(urls, deadline_s, transport))
+
+
+def check_url(url: str) -> str:
+    """Status-code-only check of a single url."""
+    return verify_urls([url])[url]
+
+
 def load_verify_history() -> dict:
-    """Corrupt history resets to empty with a logged warning (shadow guard)."""
-    if not VERIFY_HISTORY.exists():
-        return {}
-    try:
-        data = json.loads(VERIFY_HISTORY.read_text())
-        return data if isinstance(data, dict) else {}
-    except (json.JSONDecodeError, ValueError):
-        print(f"[tool_bot] WARNING: {VERIFY_HISTORY} corrupt, resetting streaks")
-        return {}
+    """Dead-link streaks per write-up, {} before the first check. A corrupt
+    file raises rather than resetting: the empty history would be saved over
+    it at the end of the run, restarting every streak."""
+    data = state_store.read(VERIFY_HISTORY, {}, strict=True)
+    if not isinstance(data, dict):
+        raise ValueError(f"{VERIFY_HISTORY} is not a JSON object")
+    return data
 
 
-def update_streak(history: dict, key: str, verdict: str) -> tuple[dict, bool]:
+def update_streak(history: dict, key: str, verdict: str,
+                  today: str | None = None) -> tuple[dict, bool]:
     """Pure streak logic. Returns (history, should_archive).
     'ok' resets the streak; 'unverifiable' leaves it untouched (a blocked
-    check is not evidence of death); 'dead' increments."""
+    check is not evidence of death); 'dead' increments.
+
+    With `today`, also records the schedule inputs: last_checked, last_ok
+    and ok_count (consecutive ok verdicts; anything else resets it)."""
     entry = history.get(key, {"streak": 0})
     if verdict == "ok":
         entry["streak"] = 0
     elif verdict == "dead":
         entry["streak"] = entry.get("streak", 0) + 1
     entry["last_verdict"] = verdict
+    if today is not None:
+        entry["last_checked"] = today
+        if verdict == "ok":
+            entry["last_ok"] = today
+            entry["ok_count"] = entry.get("ok_count", 0) + 1
+        else:
+            entry["ok_count"] = 0
     history[key] = entry
     return history, verdict == "dead" and entry["streak"] >= ARCHIVE_AFTER
 
 
+# Healthy links back off: after 1 consecutive ok the next check is a week
+# out, after 2 it is two weeks, after 3+ four. Dead and unverifiable links
+# are due every run, so a dying link still reaches ARCHIVE_AFTER in the same
+# number of weekly runs as before.
+RECHECK_WEEKS = (1, 2, 4)
+
+
+def is_due(entry: dict | None, today: str) -> bool:
+    """Should this write-up's link be checked on `today`'s run?"""
+    if not entry or entry.get("last_verdict") != "ok" or not entry.get("last_checked"):
+        return True
+    ok_count = max(entry.get("ok_count", 1), 1)
+    weeks = RECHECK_WEEKS[min(ok_count, len(RECHECK_WEEKS)) - 1]
+    age = (date.fromisoformat(today) - date.fromisoformat(entry["last_checked"])).days
+    # A day of slack: a Persistent=true catch-up run after downtime can land
+    # the next scheduled Sunday only six days later.
+    return age >= weeks * 7 - 1
+
+
 FRONT_URL = re.compile(r'^url:\s*"?([^"\n]+)"?\s*$', re.M)
 FRONT_STATUS = re.compile(r"^status:\s*(\w+)\s*$", re.M)
 FRONT_VERIFIED = re.compile(r"^last_verified:\s*\S+\s*$", re.M)
@@ -325,11 +405,8 @@ def post_unverifiable_to_discord(items: list[dict]):
         return
     lines = [f"**Tool bot:** {len(items)} link(s) unverifiable this week:"]
     lines += [f"- {i['file']}: {i['url']}" for i in items[:10]]
-    try:
-        httpx.post(webhook, json={"content": "\n".join(lines),
-                                  "username": "SOFT CAT Tool of the Week"}, timeout=15)
-    except Exception as e:
-        print(f"[tool_bot] Discord post failed: {e}")
+    outbox.discord(webhook, "\n".join(lines), username="SOFT CAT Tool of the Week",
+                   source="tool_bot")
 
 
 def run_verify_job(t0: float):
@@ -340,14 +417,22 @@ def run_verify_job(t0: float):
     unverifiable: list[dict] = []
     checked = archived = 0
 
-    for path in sorted(CONTENT_DIR.glob("*.md")):
-        m = FRONT_URL.search(path.read_text())
-        if not m:
-            continue  # url-less write-ups are skipped, no stamp (E6.8)
-        url = m.group(1).strip()
-        verdict = check_url(url)
+    # url-less write-ups are skipped, no stamp (E6.8)
+    links = [(e["path"], e["meta"].get("url", "").strip())
+             for e in content_catalogue.get().entries("tools")]
+    links = [(path, url) for path, url in links if url]
+    due = [(path, url) for path, url in links if is_due(history.get(path.name), today)]
+    skipped = len(links) - len(due)
+    links = due
+    t_check = _time.time()
+    verdicts = verify_urls([url for _, url in links])
+    print(f"[tool_bot] verify: {len(verdicts)} link(s) checked in "
+          f"{_time.time() - t_check:.1f}s, {skipped} healthy link(s) not yet due")
+
+    for path, url in links:
+        verdict = verdicts[url]
         checked += 1
-        history, should_archive = update_streak(history, path.name, verdict)
+        history, should_archive = update_streak(history, path.name, verdict, today)
         if verdict == "unverifiable":
             unverifiable.append({"file": path.name, "url": url})
             print(f"  unverifiable: {path.name}")
@@ -358,12 +443,10 @@ def run_verify_job(t0: float):
             archived += 1
             print(f"  ARCHIVED (streak {ARCHIVE_AFTER}): {path.name}")
 
-    VERIFY_HISTORY.write_text(json.dumps(history, indent=2) + "\n")
+    state_store.write(VERIFY_HISTORY, history, compact=True)
 
     if unverifiable:
-        UNVERIFIABLE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        UNVERIFIABLE_FILE.write_text(json.dumps(
-            {"generated_at": today, "items": unverifiable}, indent=2) + "\n")
+        state_store.write(UNVERIFIABLE_FILE, {"generated_at": today, "items": unverifiable})
         post_unverifiable_to_discord(unverifiable)
 
     log_run("tool_bot", status="success", duration_s=_time.time() - t0,
@@ -381,6 +464,8 @@ def run_verify_job(t0: float):
 
 
 def main():
+    from dotenv import load_dotenv
+    load_dotenv(BOT_DIR / ".env")
     print(f"[{datetime.now().isoformat()}] Tool of the Week bot starting")
     t0 = _time.time()
 